@@ -0,0 +1,214 @@
+"""Load test: fleets of covers moving at once on a real event loop.
+
+Creates 100, 500 and 1000 ``CoverTimeBased`` entities against the stand-in
+``hass`` of tools/harness.py (service registry, state machine and event
+bus on a plain asyncio loop, wall-clock timers), starts all of them at the
+same moment and measures until the last one has stopped:
+
+- event loop lag: how late a 50 ms probe timer fires (p50/p95/max)
+- state writes per second and updater ticks
+- CPU time per updater tick (process CPU time of the run / ticks)
+- auto-stop lateness p95 from the covers' performance counters
+- memory per cover (tracemalloc while creating the fleet) and peak RSS
+
+Home Assistant must be installed (the entity derives from ``CoverEntity``);
+no instance is started.
+
+    python benchmarks/bench_fleet.py                      # 100, 500 and 1000 covers
+    python benchmarks/bench_fleet.py --sizes 2000 --duration 20
+    python benchmarks/bench_fleet.py --save               # write benchmarks/fleet_baseline.json
+    python benchmarks/bench_fleet.py --compare            # show changes against the baseline
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import platform
+import random
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "tools"))
+
+from harness import StandInHass, add_cover, entity_timers  # noqa: E402
+
+from custom_components.cover_rf_time_based.models import DeviceConfig, ScriptsConfig  # noqa: E402
+from custom_components.cover_rf_time_based.perf import PerfCounters  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "fleet_baseline.json"
+SIZES = (100, 500, 1000)
+# Seconds a full open takes; targets are spread over the upper half so moves end with a STOP
+DEFAULT_DURATION = 10.0
+PROBE_INTERVAL = 0.05
+SEED = 1234
+
+CONFIG = DeviceConfig(
+    name="Fleet cover",
+    device_class="shutter",
+    travel_time_down=DEFAULT_DURATION,
+    travel_time_up=DEFAULT_DURATION,
+    tilting_time_down=0,
+    tilting_time_up=0,
+    send_stop_at_ends=False,
+    always_confident=False,
+    block_tilt_if_open=False,
+    tilt_only_when_closed=False,
+    availability_template=None,
+    command_delay=0.4,
+)
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def _probe_lag(loop: asyncio.AbstractEventLoop, samples: list[float], done: asyncio.Event) -> None:
+    """Sample how late a short sleep returns while the fleet is moving."""
+    while not done.is_set():
+        started = loop.time()
+        await asyncio.sleep(PROBE_INTERVAL)
+        samples.append(max(0.0, loop.time() - started - PROBE_INTERVAL))
+
+
+async def _run_fleet(hass: StandInHass, covers, targets: list[int], timeout: float) -> dict:
+    loop = hass.loop
+    lag: list[float] = []
+    done = asyncio.Event()
+    probe = loop.create_task(_probe_lag(loop, lag, done))
+    await asyncio.sleep(PROBE_INTERVAL * 4)
+    lag.clear()
+
+    writes = hass.states.writes
+    cpu = time.process_time()
+    started = time.perf_counter()
+    await asyncio.gather(*(cover.async_set_cover_position(target) for cover, target in zip(covers, targets)))
+    while any(cover.tc.is_traveling() for cover in covers) and time.perf_counter() - started < timeout:
+        await asyncio.sleep(0.25)
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu
+    writes = hass.states.writes - writes
+
+    done.set()
+    await probe
+    for cover in covers:
+        await cover.async_will_remove_from_hass()
+
+    total = PerfCounters()
+    for cover in covers:
+        total.merge(cover._perf)
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "still_moving": sum(cover.tc.is_traveling() for cover in covers),
+        "loop_lag_p50_ms": round(_percentile(lag, 0.5) * 1000, 1),
+        "loop_lag_p95_ms": round(_percentile(lag, 0.95) * 1000, 1),
+        "loop_lag_max_ms": round(max(lag, default=0) * 1000, 1),
+        "state_writes_per_s": round(writes / elapsed, 1),
+        "ticks": total.ticks,
+        "cpu_s": round(cpu, 3),
+        "cpu_per_tick_us": round(cpu / total.ticks * 1e6, 1) if total.ticks else None,
+        "stop_lateness_p95_ms": total.stop_lateness.percentile(0.95),
+        "mean_tick_lag_ms": round(statistics.fmean(cover._lag.tick_lag for cover in covers) * 1000, 1),
+    }
+
+
+def bench_size(size: int, duration: float) -> dict:
+    rng = random.Random(SEED + size)
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    hass = StandInHass(loop)
+    hass.services.async_register("homeassistant", "turn_on", lambda call: None)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    covers = []
+    for index in range(size):
+        config = dataclasses.replace(
+            CONFIG, name=f"Fleet cover {index}", travel_time_down=duration, travel_time_up=duration
+        )
+        scripts = ScriptsConfig(
+            open_script=f"script.fleet_{index}_open",
+            close_script=f"script.fleet_{index}_close",
+            stop_script=f"script.fleet_{index}_stop",
+            tilt_open_script=None,
+            tilt_close_script=None,
+            tilt_stop_script=None,
+        )
+        cover = add_cover(hass, f"fleet_{index}", config, scripts)
+        cover._perf.enabled = True
+        covers.append(cover)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    targets = [rng.randint(50, 100) for _ in covers]
+    try:
+        with entity_timers(hass):
+            result = loop.run_until_complete(_run_fleet(hass, covers, targets, duration * 3))
+    finally:
+        loop.close()
+        asyncio.set_event_loop(None)
+    result["bytes_per_cover"] = round(allocated / size)
+    result["peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    return result
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    lines = []
+    for size, metrics in current["results"].items():
+        base = baseline["results"].get(size)
+        if base is None:
+            continue
+        for name, value in metrics.items():
+            old = base.get(name)
+            if isinstance(value, (int, float)) and isinstance(old, (int, float)) and old:
+                lines.append(f"{size:>6} {name:<22} {old:>10} -> {value:>10}  ({(value - old) / old:+.0%})")
+    return lines
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="seconds of a full open")
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, type=Path, help="write results as baseline")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, type=Path, help="compare against a baseline")
+    args = parser.parse_args(argv)
+
+    current = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "duration": args.duration,
+        "results": {},
+    }
+    for size in args.sizes:
+        result = bench_size(size, args.duration)
+        current["results"][str(size)] = result
+        print(
+            f"{size:>6} covers  lag p50/p95/max {result['loop_lag_p50_ms']:6.1f}/{result['loop_lag_p95_ms']:6.1f}/"
+            f"{result['loop_lag_max_ms']:6.1f} ms  {result['state_writes_per_s']:8.1f} writes/s  "
+            f"{result['cpu_per_tick_us']} us/tick  stop late p95 {result['stop_lateness_p95_ms']} ms  "
+            f"{result['bytes_per_cover']} B/cover  rss {result['peak_rss_mb']} MB"
+        )
+        if result["still_moving"]:
+            print(f"       {result['still_moving']} covers were still moving after {result['elapsed_s']} s")
+
+    if args.save:
+        args.save.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline written to {args.save}")
+    if args.compare:
+        for line in compare(current, json.loads(args.compare.read_text(encoding="utf-8"))):
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""Memory budget check: bytes per TravelCalculator, movement trace and cover.
+
+Allocations are measured with tracemalloc while a fleet is created and
+divided by its size. The calculator, trace and cover state checks load
+their modules straight from the integration folder and run without Home
+Assistant; the trace check fills every trace up to its cap, the worst
+case of a cover that moved often, and the state check builds the
+Home Assistant-free part of a cover (two calculators, an empty trace,
+duty cycle, performance counters and loop lag). The cover check creates
+``CoverTimeBased`` entities against the stand-in ``hass`` of
+tools/harness.py and needs Home Assistant installed (it is skipped when it
+is not). Exits with 1 when a result exceeds its budget.
+
+    python benchmarks/bench_memory.py
+    python benchmarks/bench_memory.py --size 500 --cover-budget 60000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import importlib.util
+import sys
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+INTEGRATION = ROOT / "custom_components" / "cover_rf_time_based"
+MODULE_PATH = INTEGRATION / "travelcalculator.py"
+TRACE_PATH = INTEGRATION / "trace.py"
+DUTY_PATH = INTEGRATION / "duty.py"
+PERF_PATH = INTEGRATION / "perf.py"
+LAG_PATH = INTEGRATION / "lag.py"
+
+DEFAULT_SIZE = 1000
+# Bytes per calculator, including a started travel
+CALCULATOR_BUDGET = 240
+# Bytes of the Home Assistant-free state of a new cover: two calculators,
+# the empty movement trace, duty cycle, performance counters and loop lag
+STATE_BUDGET = 4_000
+# Bytes per freshly added cover: the entity, its two calculators, counters
+# and the still empty movement trace
+COVER_BUDGET = 8_000
+# Bytes per movement trace holding TRACE_SIZE movements (about 41 bytes each)
+TRACE_BUDGET = 44_000
+# Traces filled for the trace check (each takes TRACE_SIZE movements)
+TRACE_FLEET = 50
+
+
+def load_module(path: Path = MODULE_PATH):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _measure(create, size: int) -> tuple[list, dict[str, int]]:
+    """Create ``size`` objects and return them with the bytes they allocated per file."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [create(index) for index in range(size)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    by_file = {}
+    for stat in after.compare_to(before, "filename"):
+        if stat.size_diff > 0:
+            by_file[stat.traceback[0].filename] = stat.size_diff
+    return objects, by_file
+
+
+def calculator_bytes(size: int) -> float:
+    module = load_module()
+
+    def create(index):
+        tc = module.TravelCalculator(25.0, 30.0, 0.4)
+        tc.time_set_from_outside = 1_000_000.0
+        tc.set_position(index % 101)
+        tc.start_travel(100 - index % 101, 0.8)
+        return tc
+
+    _, by_file = _measure(create, size)
+    return sum(by_file.values()) / size
+
+
+def trace_bytes(size: int = TRACE_FLEET) -> float:
+    module = load_module(TRACE_PATH)
+
+    def create(index):
+        trace = module.MovementTrace()
+        for seq in range(trace.size):
+            trace.begin(1_000_000.0 + seq * 60, index % 101, 50, 12.5, 0.0, 0.4, 1_000_012.5 + seq * 60)
+        return trace
+
+    _, by_file = _measure(create, size)
+    return sum(by_file.values()) / size
+
+
+def state_bytes(size: int) -> float:
+    travelcalculator, trace, duty, perf, lag = (
+        load_module(path) for path in (MODULE_PATH, TRACE_PATH, DUTY_PATH, PERF_PATH, LAG_PATH)
+    )
+
+    def create(index):
+        tc = travelcalculator.TravelCalculator(25.0, 30.0, 0.4)
+        tilt_tc = travelcalculator.TravelCalculator(2.0, 2.0, 0.4)
+        tc.set_position(index % 101)
+        tilt_tc.set_position(index % 101)
+        return tc, tilt_tc, trace.MovementTrace(), duty.DutyCycle(900), perf.PerfCounters(), lag.LoopLag()
+
+    _, by_file = _measure(create, size)
+    return sum(by_file.values()) / size
+
+
+def cover_bytes(size: int) -> tuple[float, float] | None:
+    """Bytes per cover and the part of it taken by the movement trace, or None without Home Assistant."""
+    try:
+        sys.path.insert(0, str(ROOT / "tools"))
+        from harness import StandInHass, add_cover
+        from simulate import CONFIG, SCRIPTS
+    except ModuleNotFoundError as err:
+        print(f"cover check skipped: {err}")
+        return None
+
+    loop = asyncio.new_event_loop()
+    try:
+        hass = StandInHass(loop)
+        # Warm up class-level caches so they are not counted against the first cover
+        add_cover(hass, "warmup", CONFIG, SCRIPTS)
+        _, by_file = _measure(lambda index: add_cover(hass, f"cover_{index}", CONFIG, SCRIPTS), size)
+    finally:
+        loop.close()
+    trace = by_file.get(str(TRACE_PATH), 0)
+    return sum(by_file.values()) / size, trace / size
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="objects per fleet")
+    parser.add_argument("--calculator-budget", type=int, default=CALCULATOR_BUDGET, help="bytes per calculator")
+    parser.add_argument("--state-budget", type=int, default=STATE_BUDGET, help="bytes per cover state without Home Assistant")
+    parser.add_argument("--trace-budget", type=int, default=TRACE_BUDGET, help="bytes per full movement trace")
+    parser.add_argument("--cover-budget", type=int, default=COVER_BUDGET, help="bytes per cover")
+    args = parser.parse_args(argv)
+
+    over = []
+    per_calculator = calculator_bytes(args.size)
+    print(f"TravelCalculator  {per_calculator:8.0f} B   budget {args.calculator_budget} B")
+    if per_calculator > args.calculator_budget:
+        over.append("TravelCalculator")
+
+    per_state = state_bytes(args.size)
+    print(f"Cover state       {per_state:8.0f} B   budget {args.state_budget} B   (without Home Assistant)")
+    if per_state > args.state_budget:
+        over.append("Cover state")
+
+    per_trace = trace_bytes()
+    print(f"MovementTrace     {per_trace:8.0f} B   budget {args.trace_budget} B   (full)")
+    if per_trace > args.trace_budget:
+        over.append("MovementTrace")
+
+    covers = cover_bytes(args.size)
+    if covers is not None:
+        per_cover, trace = covers
+        print(
+            f"CoverTimeBased    {per_cover:8.0f} B   budget {args.cover_budget} B"
+            f"   (movement trace {trace:.0f} B, rest {per_cover - trace:.0f} B)"
+        )
+        if per_cover > args.cover_budget:
+            over.append("CoverTimeBased")
+
+    for name in over:
+        print(f"OVER BUDGET {name}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
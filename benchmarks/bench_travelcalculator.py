@@ -0,0 +1,173 @@
+"""Microbenchmarks for the TravelCalculator per-tick hot path.
+
+Runs without Home Assistant: travelcalculator.py only depends on the
+standard library and is loaded straight from the integration folder. The
+clock is injected through ``time_set_from_outside`` so every run sees the
+same move mix.
+
+    python benchmarks/bench_travelcalculator.py                  # print results
+    python benchmarks/bench_travelcalculator.py --save           # write the baseline
+    python benchmarks/bench_travelcalculator.py --compare        # fail on regressions
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import importlib.util
+import json
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+MODULE_PATH = ROOT / "custom_components" / "cover_rf_time_based" / "travelcalculator.py"
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "travelcalculator_baseline.json"
+
+SIZES = (1, 100, 10_000)
+# Calls per pass (spread over rounds of one call per calculator) and passes per result
+CALLS_PER_ROUND = 20_000
+REPEAT = 5
+TICK = 0.1
+SEED = 1234
+# A result slower than baseline * (1 + tolerance) is a regression; baselines are
+# machine specific, so compare on the machine that recorded them
+DEFAULT_TOLERANCE = 0.5
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("travelcalculator", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_fleet(module, size: int, rng: random.Random, now: float):
+    """Calculators in a realistic state: about a third stopped, the rest moving."""
+    fleet = []
+    for _ in range(size):
+        tc = module.TravelCalculator(rng.uniform(15, 60), rng.uniform(15, 60), rng.choice((0, 0.2, 0.4)))
+        tc.time_set_from_outside = now - rng.uniform(0, 30)
+        tc.set_position(rng.randint(0, 100))
+        if rng.random() < 2 / 3:
+            tc.start_travel(rng.choice((0, 100, rng.randint(0, 100))), rng.choice((0, 0, 0.8)))
+        fleet.append(tc)
+    return fleet
+
+
+def _set_clock(fleet, now: float):
+    for tc in fleet:
+        tc.time_set_from_outside = now
+
+
+def _noop(tc):
+    pass
+
+
+def _reverse(tc):
+    tc.start_travel(100 - tc.travel_to_position)
+
+
+def _time_calls(fleet, call, rounds: int, now: float, prepare=None) -> float:
+    """Nanoseconds per call of the fastest round, advancing the clock by one tick per round.
+
+    The minimum is the most stable statistic on a shared machine: noise only
+    ever makes a round slower. ``prepare`` runs on every calculator before
+    each round, outside the timing.
+    """
+    best = float("inf")
+    for _ in range(REPEAT):
+        clock = now
+        for _ in range(rounds):
+            clock += TICK
+            _set_clock(fleet, clock)
+            if prepare is not None:
+                for tc in fleet:
+                    prepare(tc)
+            started = time.perf_counter()
+            for tc in fleet:
+                call(tc)
+            best = min(best, time.perf_counter() - started)
+    return best / len(fleet) * 1e9
+
+
+def bench_size(module, size: int) -> dict[str, float]:
+    rng = random.Random(SEED + size)
+    now = 1_000_000.0
+    rounds = max(1, CALLS_PER_ROUND // size)
+    results = {}
+    # Loop, call and timer overhead, subtracted from every result
+    overhead = _time_calls(make_fleet(module, size, rng, now), _noop, rounds, now)
+
+    fleet = make_fleet(module, size, rng, now)
+    results["current_position"] = _time_calls(fleet, lambda tc: tc.current_position(), rounds, now)
+    fleet = make_fleet(module, size, rng, now)
+    results["position_reached"] = _time_calls(fleet, lambda tc: tc.position_reached(), rounds, now)
+    fleet = make_fleet(module, size, rng, now)
+    results["calculate_position"] = _time_calls(fleet, lambda tc: tc.calculate_position(), rounds, now)
+
+    # Alternate between a target and its mirror so every start is a real move
+    fleet = make_fleet(module, size, rng, now)
+    results["start_travel"] = _time_calls(fleet, _reverse, rounds, now)
+    fleet = make_fleet(module, size, rng, now)
+    results["stop"] = _time_calls(fleet, lambda tc: tc.stop(), rounds, now, prepare=_reverse)
+    return {name: max(0.0, ns - overhead) for name, ns in results.items()}
+
+
+def run() -> dict:
+    module = load_module()
+    results: dict[str, dict[str, float]] = {}
+    gc.disable()
+    try:
+        for size in SIZES:
+            for name, ns in bench_size(module, size).items():
+                results.setdefault(name, {})[str(size)] = round(ns, 1)
+    finally:
+        gc.enable()
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "unit": "ns/call",
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return one line per result that regressed beyond the tolerance."""
+    regressions = []
+    for name, sizes in baseline["results"].items():
+        for size, base in sizes.items():
+            value = current["results"].get(name, {}).get(size)
+            if value is not None and value > base * (1 + tolerance):
+                regressions.append(f"{name}[{size}]: {value:.1f} ns vs baseline {base:.1f} ns")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, type=Path, help="write results as baseline")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, type=Path, help="compare against a baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    current = run()
+    for name, sizes in current["results"].items():
+        row = "  ".join(f"{size:>6}: {ns:8.1f}" for size, ns in sizes.items())
+        print(f"{name:<20} {row}  ns/call")
+
+    if args.save:
+        args.save.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline written to {args.save}")
+    if args.compare:
+        regressions = compare(current, json.loads(args.compare.read_text(encoding="utf-8")), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print("No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,10 +11,12 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.discovery import async_load_platform
 
-from .const import DOMAIN
+from .const import DOMAIN, CONF_ENTRY_TYPE, ENTRY_TYPE_HUB, SUBENTRY_TYPE_DEVICE
 
 _LOGGER = logging.getLogger(__name__)
 
+PLATFORMS = ["cover", "sensor"]
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Cover RF Time Based component.
@@ -31,6 +33,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
 
+    from .services import async_register_services
+
+    async_register_services(hass)
+
     # Collect all YAML cover configs for this platform
     yaml_configs = []
     if "cover" in config:
@@ -117,11 +123,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.info("This is a YAML configuration placeholder entry - entities loaded via platform setup")
         return True
 
-    # For UI-configured entries, forward the setup to the cover platform
-    await hass.config_entries.async_forward_entry_setups(entry, ["cover"])
+    # For UI-configured entries, forward the setup to the cover and diagnostic sensor platforms
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Register update listener for options changes
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     return True
 
@@ -130,12 +136,72 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.info("Unloading cover_rf_time_based config entry: %s", entry.title)
 
-    return await hass.config_entries.async_unload_platforms(entry, ["cover"])
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        from .perf import retire_perf_counters
+
+        domain_data = hass.data.get(DOMAIN, {})
+        entities = domain_data.get("entities", {})
+        entities.pop(entry.entry_id, None)
+        retire_perf_counters(hass, entry.entry_id)
+        for device_id in domain_data.get("hub_devices", {}).pop(entry.entry_id, set()):
+            entities.pop(device_id, None)
+            retire_perf_counters(hass, device_id)
+        if domain_data.get("perf_aggregate_entry") == entry.entry_id:
+            domain_data.pop("perf_aggregate_entry")
+    return unload_ok
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry when options change."""
+    """Reload config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the live entity, reloading only on structural changes.
+
+    Timing and behaviour options are pushed straight into the entity and its
+    travel calculators so in-flight movements keep their position. Switching
+    between wrapper and script mode, changing the wrapped cover or adding or
+    removing tilt scripts still needs a full reload.
+    """
+    from .helpers import consume_skipped_update
+
+    if consume_skipped_update(hass, entry.entry_id):
+        return
+    if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HUB:
+        await _async_update_hub(hass, entry)
+        return
+
+    from .helpers import apply_device_config
+
+    config_data = {**entry.data, **entry.options}
+    if not apply_device_config(hass, entry.entry_id, config_data, entry.title):
+        _LOGGER.info("Structural change for %s, reloading entry", entry.title)
+        await async_reload_entry(hass, entry)
+
+
+async def _async_update_hub(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply subentry changes of a hub entry, reloading only when devices change."""
+    domain_data = hass.data.get(DOMAIN, {})
+    known = domain_data.get("hub_devices", {}).get(entry.entry_id, set())
+    current = {
+        subentry_id: subentry
+        for subentry_id, subentry in entry.subentries.items()
+        if subentry.subentry_type == SUBENTRY_TYPE_DEVICE
+    }
+
+    if set(current) != known:
+        # Entities of removed subentries are dropped by Home Assistant itself
+        _LOGGER.info("Devices of hub %s changed, reloading entry", entry.title)
+        await async_reload_entry(hass, entry)
+        return
+
+    from .helpers import apply_device_config
+
+    for subentry_id, subentry in current.items():
+        if not apply_device_config(hass, subentry_id, dict(subentry.data), subentry.title):
+            _LOGGER.info("Structural change for %s, reloading hub %s", subentry.title, entry.title)
+            await async_reload_entry(hass, entry)
+            return
 
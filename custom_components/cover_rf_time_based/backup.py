@@ -0,0 +1,253 @@
+"""Export and import of device configuration and runtime state."""
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+import voluptuous as vol
+import homeassistant.helpers.config_validation as cv
+from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigSubentry
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    CONF_NAME,
+    CONF_ENTRY_TYPE,
+    ENTRY_TYPE_HUB,
+    SUBENTRY_TYPE_DEVICE,
+    ATTR_POSITION,
+    ATTR_TILT_POSITION,
+    ATTR_CONFIDENT,
+    ATTR_START_LATENCY,
+    ATTR_STOP_LATENCY,
+    ATTR_MOTOR_CYCLES,
+    ATTR_MOTOR_RUN_TIME,
+    CONF_BLOCK_TILT_IF_OPEN,
+    CONF_OPEN_SCRIPT_ENTITY_ID,
+    CONF_CLOSE_SCRIPT_ENTITY_ID,
+    EXPORT_FORMAT,
+    EXPORT_VERSION,
+)
+from .config_flow import CONF_MODE, MODE_SCRIPT, MODE_WRAPPER, _get_script_schema, _get_wrapper_schema
+from .helpers import apply_device_config, async_config_dir_path, ui_data_from_configs
+
+_LOGGER = logging.getLogger(__name__)
+
+SOURCE_ENTRY = "entry"
+SOURCE_HUB = "hub"
+SOURCE_YAML = "yaml"
+
+STATE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_POSITION): vol.Any(None, vol.All(vol.Coerce(int), vol.Range(min=0, max=100))),
+    vol.Optional(ATTR_TILT_POSITION): vol.Any(None, vol.All(vol.Coerce(int), vol.Range(min=0, max=100))),
+    vol.Optional(ATTR_CONFIDENT, default=False): cv.boolean,
+    vol.Optional(ATTR_START_LATENCY): vol.Any(None, vol.All(vol.Coerce(float), vol.Range(min=0))),
+    vol.Optional(ATTR_STOP_LATENCY): vol.Any(None, vol.All(vol.Coerce(float), vol.Range(min=0))),
+    vol.Optional(ATTR_MOTOR_CYCLES): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional(ATTR_MOTOR_RUN_TIME): vol.All(vol.Coerce(float), vol.Range(min=0)),
+})
+
+DEVICE_SCHEMA = vol.Schema({
+    vol.Required("device_id"): cv.string,
+    vol.Required("source"): vol.In([SOURCE_ENTRY, SOURCE_HUB, SOURCE_YAML]),
+    vol.Optional("hub"): vol.Any(None, cv.string),
+    vol.Required("config"): vol.Schema({
+        vol.Required(CONF_NAME): cv.string,
+        vol.Required(CONF_MODE): vol.In([MODE_SCRIPT, MODE_WRAPPER]),
+    }, extra=vol.ALLOW_EXTRA),
+    vol.Optional("state", default={}): STATE_SCHEMA,
+})
+
+
+def _config_schema(mode: str) -> vol.Schema:
+    """The config/options flow schema of a mode, plus the keys only YAML covers carry."""
+    if mode == MODE_SCRIPT:
+        schema = _get_script_schema()
+    else:
+        # YAML covers may define scripts next to the wrapped cover
+        schema = _get_wrapper_schema().extend({
+            vol.Optional(CONF_OPEN_SCRIPT_ENTITY_ID): cv.entity_id,
+            vol.Optional(CONF_CLOSE_SCRIPT_ENTITY_ID): cv.entity_id,
+        })
+    return schema.extend({
+        vol.Required(CONF_MODE): mode,
+        vol.Optional(CONF_BLOCK_TILT_IF_OPEN): cv.boolean,
+    })
+
+
+DOCUMENT_SCHEMA = vol.Schema({
+    vol.Required("format"): EXPORT_FORMAT,
+    vol.Required("version"): vol.All(vol.Coerce(int), vol.Range(min=1, max=EXPORT_VERSION)),
+    vol.Optional("exported_at"): cv.string,
+    vol.Required("devices"): [DEVICE_SCHEMA],
+}, extra=vol.ALLOW_EXTRA)
+
+
+def _device_sources(hass: HomeAssistant) -> dict[str, tuple[str, str | None]]:
+    """Map device id to (source, hub title) for every known device."""
+    sources: dict[str, tuple[str, str | None]] = {}
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HUB:
+            for subentry_id in entry.subentries:
+                sources[subentry_id] = (SOURCE_HUB, entry.title)
+        else:
+            sources[entry.entry_id] = (SOURCE_ENTRY, None)
+    return sources
+
+
+def async_export_document(hass: HomeAssistant) -> dict[str, Any]:
+    """Build one versioned document with the config and runtime state of every cover."""
+    sources = _device_sources(hass)
+    devices = []
+    for device_id, entity in hass.data.get(DOMAIN, {}).get("entities", {}).items():
+        source, hub = sources.get(device_id, (SOURCE_YAML, None))
+        devices.append({
+            "device_id": device_id,
+            "source": source,
+            "hub": hub,
+            "config": ui_data_from_configs(*entity.configs),
+            "state": entity.export_runtime_state(),
+        })
+    return {
+        "format": EXPORT_FORMAT,
+        "version": EXPORT_VERSION,
+        "exported_at": dt_util.utcnow().isoformat(),
+        "devices": devices,
+    }
+
+
+async def async_export_to_file(hass: HomeAssistant, filename: str) -> dict[str, Any]:
+    """Export all covers and write the document under the config directory."""
+    path = await async_config_dir_path(hass, filename)
+    document = async_export_document(hass)
+
+    def _write() -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(document, handle, indent=2)
+
+    await hass.async_add_executor_job(_write)
+    _LOGGER.info("Exported %d covers to %s", len(document["devices"]), path)
+    return document
+
+
+async def async_read_document(hass: HomeAssistant, filename: str) -> dict[str, Any]:
+    """Read an exported document from the config directory."""
+    path = await async_config_dir_path(hass, filename)
+
+    def _read() -> dict[str, Any]:
+        with open(path, encoding="utf-8") as handle:
+            return json.load(handle)
+
+    try:
+        return await hass.async_add_executor_job(_read)
+    except (OSError, ValueError) as ex:
+        raise HomeAssistantError(f"Cannot read export file {path}: {ex}") from ex
+
+
+def _validate_document(document: dict[str, Any]) -> dict[str, Any]:
+    """Validate the whole document up front so an import is all-or-nothing."""
+    try:
+        document = DOCUMENT_SCHEMA(document)
+    except vol.Invalid as ex:
+        raise HomeAssistantError(f"Invalid export document: {ex}") from ex
+
+    problems = []
+    names = set()
+    for device in document["devices"]:
+        config = device["config"]
+        name = config[CONF_NAME]
+        if name in names:
+            problems.append(f"{name}: duplicate name")
+        names.add(name)
+        try:
+            device["config"] = _config_schema(config[CONF_MODE])(config)
+        except vol.Invalid as ex:
+            problems.append(f"{name}: {ex}")
+    if problems:
+        raise HomeAssistantError("Invalid export document: " + "; ".join(problems))
+    return document
+
+
+async def async_import_document(hass: HomeAssistant, document: dict[str, Any]) -> dict[str, list[str]]:
+    """Import configs and runtime state from an exported document.
+
+    The document is validated completely before anything is changed. Covers
+    that exist (matched by name) are updated in place, missing ones are
+    created - inside the hub they were exported from if that hub exists -
+    and runtime state is restored without sending any RF commands.
+    """
+    document = _validate_document(document)
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    entities = domain_data.get("entities", {})
+    live_by_name = {entity.name: entity for entity in entities.values()}
+    existing = {}
+    hubs = {}
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HUB:
+            hubs[entry.title] = entry
+            for subentry in entry.subentries.values():
+                existing[subentry.title] = (entry, subentry)
+        elif entry.data.get(CONF_NAME):
+            existing[entry.data[CONF_NAME]] = (entry, None)
+
+    report: dict[str, list[str]] = {"updated": [], "created": [], "state_only": []}
+    pending_state = domain_data.setdefault("pending_state", {})
+    new_entries: list[dict[str, Any]] = []
+
+    for device in document["devices"]:
+        config = device["config"]
+        name = config[CONF_NAME]
+        state = device["state"]
+        live = live_by_name.get(name)
+
+        if name in existing:
+            entry, subentry = existing[name]
+            device_id = subentry.subentry_id if subentry is not None else entry.entry_id
+            apply_device_config(hass, device_id, config, name)
+            if subentry is not None:
+                hass.config_entries.async_update_subentry(entry, subentry, data=config)
+            else:
+                hass.config_entries.async_update_entry(entry, data=config, options={})
+            report["updated"].append(name)
+        elif live is not None:
+            # YAML-configured cover; its config stays in configuration.yaml
+            report["state_only"].append(name)
+        else:
+            pending_state[name] = state
+            hub = hubs.get(device.get("hub") or "")
+            if hub is not None:
+                hass.config_entries.async_add_subentry(
+                    hub,
+                    ConfigSubentry(
+                        data=config,
+                        subentry_type=SUBENTRY_TYPE_DEVICE,
+                        title=name,
+                        unique_id=None,
+                    ),
+                )
+            else:
+                new_entries.append(config)
+            report["created"].append(name)
+            continue
+
+        if live is not None:
+            live.async_import_runtime_state(state)
+
+    # Hub subentries were added above without yielding, so each hub reloads once;
+    # standalone entries are created afterwards through the import flow.
+    for config in new_entries:
+        await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": "import"},
+            data={"device_config": config},
+        )
+
+    _LOGGER.info(
+        "Import complete: %d updated, %d created, %d state only",
+        len(report["updated"]), len(report["created"]), len(report["state_only"]),
+    )
+    return report
@@ -22,6 +22,7 @@ from .const import (
     CONF_SEND_STOP_AT_ENDS,
     CONF_ALWAYS_CONFIDENT,
     CONF_TILT_ONLY_WHEN_CLOSED,
+    CONF_TILT_COUPLED,
     CONF_OPEN_SCRIPT_ENTITY_ID,
     CONF_CLOSE_SCRIPT_ENTITY_ID,
     CONF_STOP_SCRIPT_ENTITY_ID,
@@ -29,6 +30,16 @@ from .const import (
     CONF_TILT_CLOSE_SCRIPT_ENTITY_ID,
     CONF_TILT_STOP_SCRIPT_ENTITY_ID,
     CONF_COMMAND_DELAY,
+    CONF_BACKLASH,
+    CONF_MIN_MOVE_TIME,
+    CONF_MAX_RUN_TIME,
+    CONF_DUTY_WINDOW,
+    CONF_DUTY_MODE,
+    CONF_WRAPPER_POSITION_WEIGHT,
+    CONF_OPEN_SENSOR_ENTITY_ID,
+    CONF_CLOSED_SENSOR_ENTITY_ID,
+    CONF_POWER_SENSOR_ENTITY_ID,
+    CONF_POWER_THRESHOLD,
     CONF_AVAILABILITY_TEMPLATE,
     DEFAULT_DEVICE_CLASS,
     DEFAULT_TRAVEL_TIME,
@@ -36,15 +47,229 @@ from .const import (
     DEFAULT_SEND_STOP_AT_ENDS,
     DEFAULT_ALWAYS_CONFIDENT,
     DEFAULT_TILT_ONLY_WHEN_CLOSED,
+    DEFAULT_TILT_COUPLED,
     DEFAULT_COMMAND_DELAY,
+    DEFAULT_BACKLASH,
+    DEFAULT_MIN_MOVE_TIME,
+    DEFAULT_MAX_RUN_TIME,
+    DEFAULT_DUTY_WINDOW,
+    DEFAULT_DUTY_MODE,
+    DEFAULT_WRAPPER_POSITION_WEIGHT,
+    DEFAULT_POWER_THRESHOLD,
+    CONF_ENTRY_TYPE,
+    ENTRY_TYPE_HUB,
+    HUB_SUPPORTED,
+    SUBENTRY_TYPE_DEVICE,
+    DUTY_MODE_QUEUE,
+    DUTY_MODE_REJECT,
     DOMAIN,
 )
+from .migration import existing_devices_by_name
 
 _LOGGER = logging.getLogger(__name__)
 
 CONF_MODE = "mode"
 MODE_SCRIPT = "script"
 MODE_WRAPPER = "wrapper"
+MODE_HUB = "hub"
+
+DEVICE_MODES = {
+    MODE_SCRIPT: "Script-based (recommended)",
+    MODE_WRAPPER: "Wrapper (existing cover entity)",
+}
+
+# Modes offered when adding an entry; the hub needs config subentries
+ENTRY_MODES = {**DEVICE_MODES, MODE_HUB: "Hub (many covers in one entry)"} if HUB_SUPPORTED else DEVICE_MODES
+
+
+def _get_base_schema() -> vol.Schema:
+    """Get base configuration schema shared by both modes."""
+    return vol.Schema({
+        vol.Required(CONF_NAME): selector.TextSelector(),
+        vol.Optional(CONF_DEVICE_CLASS, default=DEFAULT_DEVICE_CLASS): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=["awning", "blind", "curtain", "damper", "door", "garage", "gate", "shade", "shutter", "window"],
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            )
+        ),
+        vol.Required(CONF_TRAVELLING_TIME_DOWN, default=DEFAULT_TRAVEL_TIME): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=1,
+                max=300,
+                unit_of_measurement="seconds",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Required(CONF_TRAVELLING_TIME_UP, default=DEFAULT_TRAVEL_TIME): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=1,
+                max=300,
+                unit_of_measurement="seconds",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Optional(CONF_TILTING_TIME_DOWN, default=DEFAULT_TILT_TIME): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0.1,
+                max=60,
+                step=0.1,
+                unit_of_measurement="seconds",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Optional(CONF_TILTING_TIME_UP, default=DEFAULT_TILT_TIME): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0.1,
+                max=60,
+                step=0.1,
+                unit_of_measurement="seconds",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Optional(CONF_COMMAND_DELAY, default=DEFAULT_COMMAND_DELAY): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=10,
+                step=0.1,
+                unit_of_measurement="seconds",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Optional(CONF_BACKLASH, default=DEFAULT_BACKLASH): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=5,
+                step=0.05,
+                unit_of_measurement="seconds",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Optional(CONF_MIN_MOVE_TIME, default=DEFAULT_MIN_MOVE_TIME): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=5,
+                step=0.05,
+                unit_of_measurement="seconds",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Optional(CONF_MAX_RUN_TIME, default=DEFAULT_MAX_RUN_TIME): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=3600,
+                unit_of_measurement="seconds",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Optional(CONF_DUTY_WINDOW, default=DEFAULT_DUTY_WINDOW): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=60,
+                max=7200,
+                unit_of_measurement="seconds",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Optional(CONF_DUTY_MODE, default=DEFAULT_DUTY_MODE): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=[DUTY_MODE_QUEUE, DUTY_MODE_REJECT],
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            )
+        ),
+        vol.Optional(CONF_SEND_STOP_AT_ENDS, default=DEFAULT_SEND_STOP_AT_ENDS): selector.BooleanSelector(),
+        vol.Optional(CONF_ALWAYS_CONFIDENT, default=DEFAULT_ALWAYS_CONFIDENT): selector.BooleanSelector(),
+        vol.Optional(CONF_TILT_ONLY_WHEN_CLOSED, default=DEFAULT_TILT_ONLY_WHEN_CLOSED): selector.BooleanSelector(),
+        vol.Optional(CONF_TILT_COUPLED, default=DEFAULT_TILT_COUPLED): selector.BooleanSelector(),
+        vol.Optional(CONF_AVAILABILITY_TEMPLATE): selector.TemplateSelector(),
+        vol.Optional(CONF_OPEN_SENSOR_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="binary_sensor")
+        ),
+        vol.Optional(CONF_CLOSED_SENSOR_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="binary_sensor")
+        ),
+        vol.Optional(CONF_POWER_SENSOR_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="sensor", device_class="power")
+        ),
+        vol.Optional(CONF_POWER_THRESHOLD, default=DEFAULT_POWER_THRESHOLD): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=1000,
+                step=0.5,
+                unit_of_measurement="W",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+    })
+
+def _get_script_schema() -> vol.Schema:
+    """Get schema for script-based mode."""
+    base = _get_base_schema().schema
+    base.update({
+        vol.Required(CONF_OPEN_SCRIPT_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="script")
+        ),
+        vol.Required(CONF_CLOSE_SCRIPT_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="script")
+        ),
+        vol.Required(CONF_STOP_SCRIPT_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="script")
+        ),
+        vol.Optional(CONF_TILT_OPEN_SCRIPT_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="script")
+        ),
+        vol.Optional(CONF_TILT_CLOSE_SCRIPT_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="script")
+        ),
+        vol.Optional(CONF_TILT_STOP_SCRIPT_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="script")
+        ),
+    })
+    return vol.Schema(base)
+
+def _get_wrapper_schema() -> vol.Schema:
+    """Get schema for wrapper mode."""
+    base = _get_base_schema().schema
+    base.update({
+        vol.Required(CONF_COVER_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="cover")
+        ),
+        vol.Optional(CONF_WRAPPER_POSITION_WEIGHT, default=DEFAULT_WRAPPER_POSITION_WEIGHT): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=1,
+                step=0.05,
+                mode=selector.NumberSelectorMode.SLIDER,
+            )
+        ),
+        vol.Optional(CONF_STOP_SCRIPT_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="script")
+        ),
+        vol.Optional(CONF_TILT_OPEN_SCRIPT_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="script")
+        ),
+        vol.Optional(CONF_TILT_CLOSE_SCRIPT_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="script")
+        ),
+        vol.Optional(CONF_TILT_STOP_SCRIPT_ENTITY_ID): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="script")
+        ),
+    })
+    return vol.Schema(base)
+
+
+def _validate_device_input(mode: str, user_input: dict[str, Any]) -> dict[str, str]:
+    """Validate device input for the given mode, returning form errors."""
+    errors = {}
+    if mode == MODE_SCRIPT:
+        if not all([
+            user_input.get(CONF_OPEN_SCRIPT_ENTITY_ID),
+            user_input.get(CONF_CLOSE_SCRIPT_ENTITY_ID),
+            user_input.get(CONF_STOP_SCRIPT_ENTITY_ID),
+        ]):
+            errors["base"] = "missing_scripts"
+    elif mode == MODE_WRAPPER:
+        if not user_input.get(CONF_COVER_ENTITY_ID):
+            errors["base"] = "missing_cover_entity"
+    return errors
 
 
 class CoverRfTimeBasedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -65,12 +290,10 @@ class CoverRfTimeBasedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             device_config = import_data["device_config"]
             device_name = device_config.get(CONF_NAME, "Unknown")
 
-            # Check if this device is already configured (by name)
-            existing_entries = self._async_current_entries()
-            for entry in existing_entries:
-                if entry.data.get(CONF_NAME) == device_name:
-                    _LOGGER.info("Device '%s' already configured, skipping import", device_name)
-                    return self.async_abort(reason="already_configured")
+            # Check if this device is already configured (by name), also inside hubs
+            if device_name in existing_devices_by_name(self.hass):
+                _LOGGER.info("Device '%s' already configured, skipping import", device_name)
+                return self.async_abort(reason="already_configured")
 
             # Set unique ID based on device name
             await self.async_set_unique_id(f"yaml_import_{device_name}")
@@ -106,6 +329,8 @@ class CoverRfTimeBasedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return await self.async_step_migrate_yaml()
             else:
                 self.mode = user_input.get(CONF_MODE, MODE_SCRIPT)
+                if self.mode == MODE_HUB:
+                    return await self.async_step_hub()
                 return await self.async_step_device_config()
 
         # Check if YAML configs are available for migration
@@ -122,10 +347,7 @@ class CoverRfTimeBasedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         "add": "Add new cover",
                         "migrate": f"Migrate {total_yaml_devices} YAML cover(s) to UI",
                     }),
-                    vol.Optional(CONF_MODE, default=MODE_SCRIPT): vol.In({
-                        MODE_SCRIPT: "Script-based (recommended)",
-                        MODE_WRAPPER: "Wrapper (existing cover entity)",
-                    }),
+                    vol.Optional(CONF_MODE, default=MODE_SCRIPT): vol.In(ENTRY_MODES),
                 }),
             )
         else:
@@ -133,10 +355,7 @@ class CoverRfTimeBasedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_show_form(
                 step_id="user",
                 data_schema=vol.Schema({
-                    vol.Required(CONF_MODE, default=MODE_SCRIPT): vol.In({
-                        MODE_SCRIPT: "Script-based (recommended)",
-                        MODE_WRAPPER: "Wrapper (existing cover entity)",
-                    }),
+                    vol.Required(CONF_MODE, default=MODE_SCRIPT): vol.In(ENTRY_MODES),
                 }),
             )
 
@@ -147,12 +366,10 @@ class CoverRfTimeBasedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             if user_input.get("confirm"):
                 # Perform migration
-                from .migration import async_migrate_yaml_to_ui
+                from .migration import async_migrate_yaml_devices
 
                 yaml_configs = self.hass.data.get(DOMAIN, {}).get("yaml_configs", [])
-
-                for yaml_config in yaml_configs:
-                    await async_migrate_yaml_to_ui(self.hass, yaml_config)
+                await async_migrate_yaml_devices(self.hass, yaml_configs)
 
                 # Clear the notification if it exists
                 await self.hass.services.async_call(
@@ -182,6 +399,25 @@ class CoverRfTimeBasedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             },
         )
 
+    async def async_step_hub(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Create a hub entry that holds many covers as subentries."""
+        if user_input is not None:
+            await self.async_set_unique_id(f"hub_{user_input[CONF_NAME]}")
+            self._abort_if_unique_id_configured()
+            return self.async_create_entry(
+                title=user_input[CONF_NAME],
+                data={CONF_ENTRY_TYPE: ENTRY_TYPE_HUB, CONF_NAME: user_input[CONF_NAME]},
+            )
+
+        return self.async_show_form(
+            step_id="hub",
+            data_schema=vol.Schema({
+                vol.Required(CONF_NAME, default="Covers"): selector.TextSelector(),
+            }),
+        )
+
     async def async_step_device_config(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -190,16 +426,7 @@ class CoverRfTimeBasedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             # Validate based on mode
-            if self.mode == MODE_SCRIPT:
-                if not all([
-                    user_input.get(CONF_OPEN_SCRIPT_ENTITY_ID),
-                    user_input.get(CONF_CLOSE_SCRIPT_ENTITY_ID),
-                    user_input.get(CONF_STOP_SCRIPT_ENTITY_ID),
-                ]):
-                    errors["base"] = "missing_scripts"
-            elif self.mode == MODE_WRAPPER:
-                if not user_input.get(CONF_COVER_ENTITY_ID):
-                    errors["base"] = "missing_cover_entity"
+            errors = _validate_device_input(self.mode, user_input)
 
             if not errors:
                 # Remove None values and empty strings from optional fields to prevent validation errors
@@ -219,9 +446,9 @@ class CoverRfTimeBasedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         # Build schema based on mode
         if self.mode == MODE_SCRIPT:
-            schema = self._get_script_schema()
+            schema = _get_script_schema()
         else:
-            schema = self._get_wrapper_schema()
+            schema = _get_wrapper_schema()
 
         return self.async_show_form(
             step_id="device_config",
@@ -229,112 +456,6 @@ class CoverRfTimeBasedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
-    def _get_base_schema(self) -> vol.Schema:
-        """Get base configuration schema shared by both modes."""
-        return vol.Schema({
-            vol.Required(CONF_NAME): selector.TextSelector(),
-            vol.Optional(CONF_DEVICE_CLASS, default=DEFAULT_DEVICE_CLASS): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=["awning", "blind", "curtain", "damper", "door", "garage", "gate", "shade", "shutter", "window"],
-                    mode=selector.SelectSelectorMode.DROPDOWN,
-                )
-            ),
-            vol.Required(CONF_TRAVELLING_TIME_DOWN, default=DEFAULT_TRAVEL_TIME): selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=1,
-                    max=300,
-                    unit_of_measurement="seconds",
-                    mode=selector.NumberSelectorMode.BOX,
-                )
-            ),
-            vol.Required(CONF_TRAVELLING_TIME_UP, default=DEFAULT_TRAVEL_TIME): selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=1,
-                    max=300,
-                    unit_of_measurement="seconds",
-                    mode=selector.NumberSelectorMode.BOX,
-                )
-            ),
-            vol.Optional(CONF_TILTING_TIME_DOWN, default=DEFAULT_TILT_TIME): selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=0.1,
-                    max=60,
-                    step=0.1,
-                    unit_of_measurement="seconds",
-                    mode=selector.NumberSelectorMode.BOX,
-                )
-            ),
-            vol.Optional(CONF_TILTING_TIME_UP, default=DEFAULT_TILT_TIME): selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=0.1,
-                    max=60,
-                    step=0.1,
-                    unit_of_measurement="seconds",
-                    mode=selector.NumberSelectorMode.BOX,
-                )
-            ),
-            vol.Optional(CONF_COMMAND_DELAY, default=DEFAULT_COMMAND_DELAY): selector.NumberSelector(
-                selector.NumberSelectorConfig(
-                    min=0,
-                    max=10,
-                    step=0.1,
-                    unit_of_measurement="seconds",
-                    mode=selector.NumberSelectorMode.BOX,
-                )
-            ),
-            vol.Optional(CONF_SEND_STOP_AT_ENDS, default=DEFAULT_SEND_STOP_AT_ENDS): selector.BooleanSelector(),
-            vol.Optional(CONF_ALWAYS_CONFIDENT, default=DEFAULT_ALWAYS_CONFIDENT): selector.BooleanSelector(),
-            vol.Optional(CONF_TILT_ONLY_WHEN_CLOSED, default=DEFAULT_TILT_ONLY_WHEN_CLOSED): selector.BooleanSelector(),
-            vol.Optional(CONF_AVAILABILITY_TEMPLATE): selector.TemplateSelector(),
-        })
-
-    def _get_script_schema(self) -> vol.Schema:
-        """Get schema for script-based mode."""
-        base = self._get_base_schema().schema
-        base.update({
-            vol.Required(CONF_OPEN_SCRIPT_ENTITY_ID): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="script")
-            ),
-            vol.Required(CONF_CLOSE_SCRIPT_ENTITY_ID): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="script")
-            ),
-            vol.Required(CONF_STOP_SCRIPT_ENTITY_ID): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="script")
-            ),
-            vol.Optional(CONF_TILT_OPEN_SCRIPT_ENTITY_ID): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="script")
-            ),
-            vol.Optional(CONF_TILT_CLOSE_SCRIPT_ENTITY_ID): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="script")
-            ),
-            vol.Optional(CONF_TILT_STOP_SCRIPT_ENTITY_ID): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="script")
-            ),
-        })
-        return vol.Schema(base)
-
-    def _get_wrapper_schema(self) -> vol.Schema:
-        """Get schema for wrapper mode."""
-        base = self._get_base_schema().schema
-        base.update({
-            vol.Required(CONF_COVER_ENTITY_ID): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="cover")
-            ),
-            vol.Optional(CONF_STOP_SCRIPT_ENTITY_ID): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="script")
-            ),
-            vol.Optional(CONF_TILT_OPEN_SCRIPT_ENTITY_ID): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="script")
-            ),
-            vol.Optional(CONF_TILT_CLOSE_SCRIPT_ENTITY_ID): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="script")
-            ),
-            vol.Optional(CONF_TILT_STOP_SCRIPT_ENTITY_ID): selector.EntitySelector(
-                selector.EntitySelectorConfig(domain="script")
-            ),
-        })
-        return vol.Schema(base)
-
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -343,6 +464,24 @@ class CoverRfTimeBasedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Get the options flow for this handler."""
         return CoverRfTimeBasedOptionsFlow()
 
+    @classmethod
+    @callback
+    def async_supports_options_flow(cls, config_entry: config_entries.ConfigEntry) -> bool:
+        """Hub entries are edited through their device subentries."""
+        return config_entry.data.get(CONF_ENTRY_TYPE) != ENTRY_TYPE_HUB
+
+    @classmethod
+    @callback
+    def async_get_supported_subentry_types(
+        cls, config_entry: config_entries.ConfigEntry
+    ) -> dict[str, type[config_entries.ConfigSubentryFlow]]:
+        """Return subentries supported by this handler."""
+        if not HUB_SUPPORTED or config_entry.data.get(CONF_ENTRY_TYPE) != ENTRY_TYPE_HUB:
+            return {}
+        from .subentry_flow import CoverDeviceSubentryFlow
+
+        return {SUBENTRY_TYPE_DEVICE: CoverDeviceSubentryFlow}
+
 
 class CoverRfTimeBasedOptionsFlow(config_entries.OptionsFlow):
     """Handle options flow for Cover RF Time Based."""
@@ -369,7 +508,7 @@ class CoverRfTimeBasedOptionsFlow(config_entries.OptionsFlow):
 
             # Save changes to both data and options
             # - data: ensures persistence (changes stay after restart)
-            # - options: triggers update_listener which reloads the entry
+            # - options: triggers update_listener which applies the change in place
             self.hass.config_entries.async_update_entry(
                 self.config_entry,
                 data=updated_data,
@@ -398,7 +537,7 @@ class CoverRfTimeBasedOptionsFlow(config_entries.OptionsFlow):
 
     def _get_base_options_schema(self) -> vol.Schema:
         """Get base options schema."""
-        return vol.Schema({
+        base = {
             vol.Optional(
                 CONF_TRAVELLING_TIME_DOWN,
                 default=self._get_current_value(CONF_TRAVELLING_TIME_DOWN, DEFAULT_TRAVEL_TIME)
@@ -457,6 +596,61 @@ class CoverRfTimeBasedOptionsFlow(config_entries.OptionsFlow):
                     mode=selector.NumberSelectorMode.BOX,
                 )
             ),
+            vol.Optional(
+                CONF_BACKLASH,
+                default=self._get_current_value(CONF_BACKLASH, DEFAULT_BACKLASH)
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=5,
+                    step=0.05,
+                    unit_of_measurement="seconds",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_MIN_MOVE_TIME,
+                default=self._get_current_value(CONF_MIN_MOVE_TIME, DEFAULT_MIN_MOVE_TIME)
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=5,
+                    step=0.05,
+                    unit_of_measurement="seconds",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_MAX_RUN_TIME,
+                default=self._get_current_value(CONF_MAX_RUN_TIME, DEFAULT_MAX_RUN_TIME)
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=3600,
+                    unit_of_measurement="seconds",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_DUTY_WINDOW,
+                default=self._get_current_value(CONF_DUTY_WINDOW, DEFAULT_DUTY_WINDOW)
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=60,
+                    max=7200,
+                    unit_of_measurement="seconds",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_DUTY_MODE,
+                default=self._get_current_value(CONF_DUTY_MODE, DEFAULT_DUTY_MODE)
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=[DUTY_MODE_QUEUE, DUTY_MODE_REJECT],
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                )
+            ),
             vol.Optional(
                 CONF_SEND_STOP_AT_ENDS,
                 default=self._get_current_value(CONF_SEND_STOP_AT_ENDS, DEFAULT_SEND_STOP_AT_ENDS)
@@ -469,11 +663,44 @@ class CoverRfTimeBasedOptionsFlow(config_entries.OptionsFlow):
                 CONF_TILT_ONLY_WHEN_CLOSED,
                 default=self._get_current_value(CONF_TILT_ONLY_WHEN_CLOSED, DEFAULT_TILT_ONLY_WHEN_CLOSED)
             ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_TILT_COUPLED,
+                default=self._get_current_value(CONF_TILT_COUPLED, DEFAULT_TILT_COUPLED)
+            ): selector.BooleanSelector(),
             vol.Optional(
                 CONF_AVAILABILITY_TEMPLATE,
                 default=self._get_current_value(CONF_AVAILABILITY_TEMPLATE)
             ): selector.TemplateSelector(),
-        })
+        }
+
+        open_sensor = self._get_current_value(CONF_OPEN_SENSOR_ENTITY_ID)
+        base[vol.Optional(CONF_OPEN_SENSOR_ENTITY_ID, description={"suggested_value": open_sensor} if open_sensor else None)] = selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="binary_sensor")
+        )
+
+        closed_sensor = self._get_current_value(CONF_CLOSED_SENSOR_ENTITY_ID)
+        base[vol.Optional(CONF_CLOSED_SENSOR_ENTITY_ID, description={"suggested_value": closed_sensor} if closed_sensor else None)] = selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="binary_sensor")
+        )
+
+        power_sensor = self._get_current_value(CONF_POWER_SENSOR_ENTITY_ID)
+        base[vol.Optional(CONF_POWER_SENSOR_ENTITY_ID, description={"suggested_value": power_sensor} if power_sensor else None)] = selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="sensor", device_class="power")
+        )
+        base[vol.Optional(
+            CONF_POWER_THRESHOLD,
+            default=self._get_current_value(CONF_POWER_THRESHOLD, DEFAULT_POWER_THRESHOLD)
+        )] = selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=1000,
+                step=0.5,
+                unit_of_measurement="W",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        )
+
+        return vol.Schema(base)
 
     def _get_script_options_schema(self) -> vol.Schema:
         """Get options schema for script mode."""
@@ -526,6 +753,18 @@ class CoverRfTimeBasedOptionsFlow(config_entries.OptionsFlow):
             selector.EntitySelectorConfig(domain="cover")
         )
 
+        base[vol.Optional(
+            CONF_WRAPPER_POSITION_WEIGHT,
+            default=self._get_current_value(CONF_WRAPPER_POSITION_WEIGHT, DEFAULT_WRAPPER_POSITION_WEIGHT)
+        )] = selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=1,
+                step=0.05,
+                mode=selector.NumberSelectorMode.SLIDER,
+            )
+        )
+
         stop_script = self._get_current_value(CONF_STOP_SCRIPT_ENTITY_ID)
         base[vol.Optional(CONF_STOP_SCRIPT_ENTITY_ID, description={"suggested_value": stop_script} if stop_script else None)] = selector.EntitySelector(
             selector.EntitySelectorConfig(domain="script")
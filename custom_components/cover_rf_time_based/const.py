@@ -1,6 +1,8 @@
 """Constants for cover_rf_time_based integration."""
 from datetime import timedelta
 
+from homeassistant.const import MAJOR_VERSION, MINOR_VERSION
+
 DOMAIN = "cover_rf_time_based"
 
 # Warning / log messages
@@ -19,6 +21,7 @@ CONF_SEND_STOP_AT_ENDS = 'send_stop_at_ends'
 CONF_ALWAYS_CONFIDENT = 'always_confident'
 CONF_BLOCK_TILT_IF_OPEN = 'block_tilt_if_open'
 CONF_TILT_ONLY_WHEN_CLOSED = 'tilt_only_when_closed'
+CONF_TILT_COUPLED = 'tilt_coupled'
 CONF_OPEN_SCRIPT_ENTITY_ID = 'open_script_entity_id'
 CONF_CLOSE_SCRIPT_ENTITY_ID = 'close_script_entity_id'
 CONF_STOP_SCRIPT_ENTITY_ID = 'stop_script_entity_id'
@@ -28,6 +31,27 @@ CONF_TILT_STOP_SCRIPT_ENTITY_ID = 'tilt_stop_script_entity_id'
 CONF_COVER_ENTITY_ID = 'cover_entity_id'
 CONF_AVAILABILITY_TEMPLATE = 'availability_template'
 CONF_COMMAND_DELAY = 'command_delay'
+CONF_BACKLASH = 'backlash'
+CONF_MIN_MOVE_TIME = 'min_move_time'
+CONF_MAX_RUN_TIME = 'max_run_time'
+CONF_DUTY_WINDOW = 'duty_window'
+CONF_DUTY_MODE = 'duty_mode'
+CONF_WRAPPER_POSITION_WEIGHT = 'wrapper_position_weight'
+CONF_OPEN_SENSOR_ENTITY_ID = 'open_sensor_entity_id'
+CONF_CLOSED_SENSOR_ENTITY_ID = 'closed_sensor_entity_id'
+CONF_POWER_SENSOR_ENTITY_ID = 'power_sensor_entity_id'
+CONF_POWER_THRESHOLD = 'power_threshold'
+
+# Duty limit modes
+DUTY_MODE_QUEUE = 'queue'
+DUTY_MODE_REJECT = 'reject'
+
+# Config entry types
+CONF_ENTRY_TYPE = 'entry_type'
+ENTRY_TYPE_HUB = 'hub'
+SUBENTRY_TYPE_DEVICE = 'device'
+# Hub entries hold their covers as config subentries, added in Home Assistant 2025.3
+HUB_SUPPORTED = (MAJOR_VERSION, MINOR_VERSION) >= (2025, 3)
 
 # Attributes
 ATTR_UNCONFIRMED_STATE = 'unconfirmed_state'
@@ -40,6 +64,27 @@ ATTR_COMMAND = 'command'
 ATTR_DEVICE_ID = 'device_id'
 ATTR_TILT_POSITION = 'tilt_position'
 ATTR_POSITION = 'position'
+ATTR_AREA_ID = 'area_id'
+ATTR_MODE = 'mode'
+ATTR_OPTIONS = 'options'
+ATTR_DRY_RUN = 'dry_run'
+ATTR_MAX_CONCURRENCY = 'max_concurrency'
+ATTR_FILENAME = 'filename'
+ATTR_DOCUMENT = 'document'
+ATTR_START_LATENCY = 'start_latency'
+ATTR_STOP_LATENCY = 'stop_latency'
+ATTR_MOTOR_CYCLES = 'motor_cycles'
+ATTR_MOTOR_RUN_TIME = 'motor_run_time'
+ATTR_DUTY_RUN_TIME = 'duty_run_time'
+ATTR_LOOP_LAG = 'loop_lag'
+ATTR_STOP_COMPENSATION = 'stop_compensation'
+ATTR_START_POSITION = 'start_position'
+ATTR_END_POSITION = 'end_position'
+ATTR_TARGET_POSITION = 'target_position'
+ATTR_PLANNED_DURATION = 'planned_duration'
+ATTR_ACTUAL_DURATION = 'actual_duration'
+ATTR_ARRIVE_AT = 'arrive_at'
+ATTR_DURATION = 'duration'
 
 # Defaults
 DEFAULT_TRAVEL_TIME = 25
@@ -48,12 +93,43 @@ DEFAULT_SEND_STOP_AT_ENDS = False
 DEFAULT_ALWAYS_CONFIDENT = False
 DEFAULT_BLOCK_TILT_IF_OPEN = False
 DEFAULT_TILT_ONLY_WHEN_CLOSED = False
+DEFAULT_TILT_COUPLED = False
 DEFAULT_DEVICE_CLASS = 'shutter'
 DEFAULT_COMMAND_DELAY = 0
+DEFAULT_BACKLASH = 0
+DEFAULT_MIN_MOVE_TIME = 0
+DEFAULT_MAX_RUN_TIME = 0
+DEFAULT_DUTY_WINDOW = 900
+DEFAULT_DUTY_MODE = 'queue'
+DEFAULT_WRAPPER_POSITION_WEIGHT = 0
+DEFAULT_POWER_THRESHOLD = 5
 
 # Services
 SERVICE_SET_KNOWN_ACTION = 'set_known_action'
 SERVICE_SEND_COMMAND = 'send_command'
+SERVICE_MOVE_TO = 'move_to'
+SERVICE_GET_MOVE_PLAN = 'get_move_plan'
+SERVICE_BULK_UPDATE_OPTIONS = 'bulk_update_options'
+SERVICE_MIGRATE_YAML = 'migrate_yaml'
+SERVICE_EXPORT_DEVICES = 'export_devices'
+SERVICE_IMPORT_DEVICES = 'import_devices'
+SERVICE_PROFILE = 'profile'
+
+# Events
+EVENT_MOVEMENT_STARTED = f'{DOMAIN}_movement_started'
+EVENT_MOVEMENT_ARRIVED = f'{DOMAIN}_movement_arrived'
+EVENT_MOVEMENT_STOPPED = f'{DOMAIN}_movement_stopped'
+
+# Export / import
+EXPORT_FORMAT = DOMAIN
+EXPORT_VERSION = 2
+
+# Profiling
+DEFAULT_PROFILE_DURATION = 60
+MAX_PROFILE_DURATION = 600
+DEFAULT_PROFILE_FILENAME = f'{DOMAIN}_profile.json'
 
 # Timing
 TRAVEL_TIME_INTERVAL = timedelta(milliseconds=100)
+# Wrapped cover state_changed events arriving within this window are merged (seconds)
+WRAPPER_COALESCE_WINDOW = 0.15
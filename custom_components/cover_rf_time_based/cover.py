@@ -5,12 +5,13 @@ import voluptuous as vol
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers import entity_platform
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, SupportsResponse
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     ATTR_POSITION,
     ATTR_TILT_POSITION,
+    ATTR_ARRIVE_AT,
     ATTR_CONFIDENT,
     ATTR_POSITION_TYPE,
     ATTR_POSITION_TYPE_TARGET,
@@ -18,36 +19,14 @@ from .const import (
     ATTR_COMMAND,
     SERVICE_SET_KNOWN_ACTION,
     SERVICE_SEND_COMMAND,
-    CONF_NAME,
-    CONF_DEVICE_CLASS,
-    CONF_COVER_ENTITY_ID,
-    CONF_TRAVELLING_TIME_DOWN,
-    CONF_TRAVELLING_TIME_UP,
-    CONF_TILTING_TIME_DOWN,
-    CONF_TILTING_TIME_UP,
-    CONF_SEND_STOP_AT_ENDS,
-    CONF_ALWAYS_CONFIDENT,
-    CONF_BLOCK_TILT_IF_OPEN,
-    CONF_TILT_ONLY_WHEN_CLOSED,
-    CONF_OPEN_SCRIPT_ENTITY_ID,
-    CONF_CLOSE_SCRIPT_ENTITY_ID,
-    CONF_STOP_SCRIPT_ENTITY_ID,
-    CONF_TILT_OPEN_SCRIPT_ENTITY_ID,
-    CONF_TILT_CLOSE_SCRIPT_ENTITY_ID,
-    CONF_TILT_STOP_SCRIPT_ENTITY_ID,
-    CONF_COMMAND_DELAY,
-    CONF_AVAILABILITY_TEMPLATE,
-    DEFAULT_DEVICE_CLASS,
-    DEFAULT_TRAVEL_TIME,
-    DEFAULT_TILT_TIME,
-    DEFAULT_SEND_STOP_AT_ENDS,
-    DEFAULT_ALWAYS_CONFIDENT,
-    DEFAULT_BLOCK_TILT_IF_OPEN,
-    DEFAULT_TILT_ONLY_WHEN_CLOSED,
-    DEFAULT_COMMAND_DELAY,
+    SERVICE_MOVE_TO,
+    SERVICE_GET_MOVE_PLAN,
+    CONF_ENTRY_TYPE,
+    ENTRY_TYPE_HUB,
+    SUBENTRY_TYPE_DEVICE,
+    DOMAIN,
 )
-from .helpers import PLATFORM_SCHEMA, devices_from_config
-from .models import DeviceConfig, ScriptsConfig, WrapperConfig
+from .helpers import PLATFORM_SCHEMA, devices_from_config, configs_from_entry_data
 from .entity import CoverTimeBased
 
 _LOGGER = logging.getLogger(__name__)
@@ -61,46 +40,14 @@ async def async_setup_entry(
     """Set up cover from a config entry."""
     _LOGGER.info("Setting up cover_rf_time_based from config entry: %s", entry.title)
 
+    if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HUB:
+        await _async_setup_hub_entry(hass, entry, async_add_entities)
+        return
+
     # Merge data and options (options take precedence)
     config_data = {**entry.data, **entry.options}
-
-    # Process availability_template if present
-    availability_template = None
-    if CONF_AVAILABILITY_TEMPLATE in config_data and config_data[CONF_AVAILABILITY_TEMPLATE]:
-        try:
-            from homeassistant.helpers.template import Template
-            template_str = config_data[CONF_AVAILABILITY_TEMPLATE]
-            availability_template = Template(template_str, hass)
-        except Exception as ex:
-            _LOGGER.warning("Failed to parse availability_template for %s: %s", entry.title, ex)
-
-    # Build device config from entry data
-    device_config = DeviceConfig(
-        name=config_data.get(CONF_NAME, entry.title),
-        device_class=config_data.get(CONF_DEVICE_CLASS, DEFAULT_DEVICE_CLASS),
-        travel_time_down=config_data.get(CONF_TRAVELLING_TIME_DOWN, DEFAULT_TRAVEL_TIME),
-        travel_time_up=config_data.get(CONF_TRAVELLING_TIME_UP, DEFAULT_TRAVEL_TIME),
-        tilting_time_down=config_data.get(CONF_TILTING_TIME_DOWN, DEFAULT_TILT_TIME),
-        tilting_time_up=config_data.get(CONF_TILTING_TIME_UP, DEFAULT_TILT_TIME),
-        send_stop_at_ends=config_data.get(CONF_SEND_STOP_AT_ENDS, DEFAULT_SEND_STOP_AT_ENDS),
-        always_confident=config_data.get(CONF_ALWAYS_CONFIDENT, DEFAULT_ALWAYS_CONFIDENT),
-        block_tilt_if_open=config_data.get(CONF_BLOCK_TILT_IF_OPEN, DEFAULT_BLOCK_TILT_IF_OPEN),
-        tilt_only_when_closed=config_data.get(CONF_TILT_ONLY_WHEN_CLOSED, DEFAULT_TILT_ONLY_WHEN_CLOSED),
-        availability_template=availability_template,
-        command_delay=config_data.get(CONF_COMMAND_DELAY, DEFAULT_COMMAND_DELAY),
-    )
-
-    scripts_config = ScriptsConfig(
-        open_script=config_data.get(CONF_OPEN_SCRIPT_ENTITY_ID),
-        close_script=config_data.get(CONF_CLOSE_SCRIPT_ENTITY_ID),
-        stop_script=config_data.get(CONF_STOP_SCRIPT_ENTITY_ID),
-        tilt_open_script=config_data.get(CONF_TILT_OPEN_SCRIPT_ENTITY_ID),
-        tilt_close_script=config_data.get(CONF_TILT_CLOSE_SCRIPT_ENTITY_ID),
-        tilt_stop_script=config_data.get(CONF_TILT_STOP_SCRIPT_ENTITY_ID),
-    )
-
-    wrapper_config = WrapperConfig(
-        cover_entity_id=config_data.get(CONF_COVER_ENTITY_ID),
+    device_config, scripts_config, wrapper_config = configs_from_entry_data(
+        hass, config_data, entry.title
     )
 
     # Use entry_id as device_id for config flow entries
@@ -109,12 +56,43 @@ async def async_setup_entry(
     entity = CoverTimeBased(device_id, device_config, scripts_config, wrapper_config)
     async_add_entities([entity])
 
+    # Keep a handle on the live entity so option changes can be applied in place
+    hass.data.setdefault(DOMAIN, {}).setdefault("entities", {})[entry.entry_id] = entity
+
     # Register services
     await _async_register_services(hass)
 
     _LOGGER.info("Config entry setup complete for: %s", entry.title)
 
 
+async def _async_setup_hub_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up every device subentry of a hub entry in a single platform setup.
+
+    Entities are added per subentry so Home Assistant ties each cover and its
+    device to its subentry and removes them together with it.
+    """
+    registry = hass.data.setdefault(DOMAIN, {}).setdefault("entities", {})
+    hub_devices: set[str] = set()
+    hass.data[DOMAIN].setdefault("hub_devices", {})[entry.entry_id] = hub_devices
+    for subentry_id, subentry in entry.subentries.items():
+        if subentry.subentry_type != SUBENTRY_TYPE_DEVICE:
+            continue
+        device_config, scripts_config, wrapper_config = configs_from_entry_data(
+            hass, dict(subentry.data), subentry.title
+        )
+        entity = CoverTimeBased(subentry_id, device_config, scripts_config, wrapper_config)
+        registry[subentry_id] = entity
+        hub_devices.add(subentry_id)
+        async_add_entities([entity], config_subentry_id=subentry_id)
+    await _async_register_services(hass)
+
+    _LOGGER.info("Hub entry %s set up with %d covers", entry.title, len(hub_devices))
+
+
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up cover from YAML configuration."""
     _LOGGER.info("=== YAML Platform Setup Started ===")
@@ -123,6 +101,9 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
     try:
         entities = devices_from_config(config)
+        registry = hass.data.setdefault(DOMAIN, {}).setdefault("entities", {})
+        for entity in entities:
+            registry[entity.device_id] = entity
         if not entities:
             _LOGGER.warning("No entities to add (duplicates skipped or empty config)")
         else:
@@ -166,6 +147,24 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         {vol.Required(ATTR_COMMAND): cv.string},
         "async_send_command",
     )
+    platform.async_register_entity_service(
+        SERVICE_MOVE_TO,
+        {
+            vol.Optional(ATTR_POSITION): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+            vol.Optional(ATTR_TILT_POSITION): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+            vol.Optional(ATTR_ARRIVE_AT): cv.datetime,
+        },
+        "async_move_to",
+    )
+    platform.async_register_entity_service(
+        SERVICE_GET_MOVE_PLAN,
+        {
+            vol.Optional(ATTR_POSITION): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+            vol.Optional(ATTR_TILT_POSITION): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+        },
+        "async_get_move_plan",
+        supports_response=SupportsResponse.ONLY,
+    )
 
     # Mark as registered
     platform._cover_rf_registered = True
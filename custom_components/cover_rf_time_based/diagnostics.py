@@ -0,0 +1,74 @@
+"""Diagnostics support for Cover RF Time Based."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntry
+
+from .const import CONF_ENTRY_TYPE, DOMAIN, ENTRY_TYPE_HUB, SUBENTRY_TYPE_DEVICE
+from .helpers import ui_data_from_configs
+
+
+def _entry_device_ids(hass: HomeAssistant, entry: ConfigEntry) -> list[str]:
+    """Device ids of the covers belonging to an entry (all YAML covers for the YAML entry)."""
+    if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HUB:
+        return [
+            subentry_id
+            for subentry_id, subentry in entry.subentries.items()
+            if subentry.subentry_type == SUBENTRY_TYPE_DEVICE
+        ]
+    if not entry.data.get("yaml_config"):
+        return [entry.entry_id]
+    ui_devices = set()
+    for other in hass.config_entries.async_entries(DOMAIN):
+        ui_devices.add(other.entry_id)
+        ui_devices.update(other.subentries)
+    entities = hass.data.get(DOMAIN, {}).get("entities", {})
+    return [device_id for device_id in entities if device_id not in ui_devices]
+
+
+def _cover_diagnostics(entity) -> dict[str, Any]:
+    return {
+        "name": entity.name,
+        "entity_id": entity.entity_id,
+        "config": ui_data_from_configs(*entity.configs),
+        "state": entity.export_runtime_state(),
+        "attributes": entity.extra_state_attributes,
+        "movements": entity.movement_trace.as_list(),
+    }
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return the resolved config, state and movement trace of every cover of an entry."""
+    entities = hass.data.get(DOMAIN, {}).get("entities", {})
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "covers": {
+            device_id: _cover_diagnostics(entities[device_id])
+            for device_id in _entry_device_ids(hass, entry)
+            if device_id in entities
+        },
+    }
+
+
+async def async_get_device_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry, device: DeviceEntry
+) -> dict[str, Any]:
+    """Return the resolved config, state and movement trace of a single cover."""
+    entities = hass.data.get(DOMAIN, {}).get("entities", {})
+    device_ids = set(_entry_device_ids(hass, entry))
+    covers = {
+        device_id: _cover_diagnostics(entities[device_id])
+        for domain, device_id in device.identifiers
+        if domain == DOMAIN and device_id in device_ids and device_id in entities
+    }
+    return {
+        "entry": {"title": entry.title},
+        "covers": covers,
+    }
@@ -0,0 +1,90 @@
+"""Motor duty-cycle tracking for Cover RF Time Based."""
+from __future__ import annotations
+
+from collections import deque
+
+# Resolution of the wait time search (seconds)
+WAIT_RESOLUTION = 0.1
+
+
+class DutyCycle:
+    """Sliding-window record of motor run time plus lifetime counters."""
+
+    __slots__ = ("window", "cycles", "total_run_time", "_runs", "_running_since")
+
+    def __init__(self, window: float):
+        self.window = window
+        self.cycles = 0
+        self.total_run_time = 0.0
+        self._runs: deque[tuple[float, float]] = deque()
+        self._running_since: float | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._running_since is not None
+
+    def start(self, now: float) -> None:
+        """Mark the motor as running from now on."""
+        if self._running_since is None:
+            self._running_since = now
+            self.cycles += 1
+
+    def stop(self, now: float) -> None:
+        """Mark the motor as stopped and record the finished run."""
+        if self._running_since is None:
+            return
+        started, self._running_since = self._running_since, None
+        if now > started:
+            self._runs.append((started, now))
+            self.total_run_time += now - started
+        self._prune(now)
+
+    def run_time(self, now: float, running_until: float | None = None) -> float:
+        """Motor run time within the window ending at ``now``.
+
+        ``running_until`` is when the current run is expected to end; without
+        it a running motor is counted up to ``now``.
+        """
+        window_start = now - self.window
+        total = 0.0
+        for started, ended in self._runs:
+            if ended > window_start:
+                total += min(ended, now) - max(started, window_start)
+        if self._running_since is not None:
+            ended = now if running_until is None else min(now, running_until)
+            if ended > self._running_since:
+                total += max(0.0, ended - max(self._running_since, window_start))
+        return total
+
+    def wait_time(self, now: float, needed: float, limit: float, running_until: float | None = None) -> float:
+        """Seconds until a run of ``needed`` seconds fits in the limit (0 if it fits now).
+
+        While the motor runs, the budget only frees up after the current run
+        ends at ``running_until``; without that projection the full window is
+        returned. A run longer than the limit itself is allowed once the
+        window is empty.
+        """
+        needed = min(needed, limit)
+        if self.run_time(now, running_until) + needed <= limit:
+            return 0
+        low = 0.0
+        if self._running_since is not None:
+            if running_until is None:
+                return self.window
+            low = max(0.0, running_until - now)
+            if self.run_time(now + low, running_until) + needed <= limit:
+                return low
+        # Run time in the window only shrinks as time passes, so bisect the delay
+        high = low + self.window
+        while high - low > WAIT_RESOLUTION:
+            mid = (low + high) / 2
+            if self.run_time(now + mid, running_until) + needed <= limit:
+                high = mid
+            else:
+                low = mid
+        return high
+
+    def _prune(self, now: float) -> None:
+        window_start = now - self.window
+        while self._runs and self._runs[0][1] <= window_start:
+            self._runs.popleft()
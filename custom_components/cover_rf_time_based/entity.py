@@ -1,9 +1,13 @@
 """Entity class for cover_rf_time_based split out from monolithic cover.py."""
 from __future__ import annotations
+import asyncio
 import logging
+from datetime import timedelta
 from typing import Any
+from homeassistant.const import ATTR_ENTITY_ID, STATE_ON
 from homeassistant.core import callback
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_track_time_interval, async_call_later
 from homeassistant.components.cover import (
     CoverEntity,
     CoverEntityFeature,
@@ -19,9 +23,11 @@ from homeassistant.components.cover import (
     ATTR_CURRENT_TILT_POSITION,
 )
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import dt as dt_util
 from .const import (
     TILT_BLOCKED_LOG,
     TRAVEL_TIME_INTERVAL,
+    WRAPPER_COALESCE_WINDOW,
     ATTR_UNCONFIRMED_STATE,
     ATTR_CONFIDENT,
     ATTR_ACTION,
@@ -29,68 +35,284 @@ from .const import (
     ATTR_POSITION_TYPE_CURRENT,
     ATTR_COMMAND,
     ATTR_DEVICE_ID,
+    ATTR_POSITION,
+    ATTR_START_LATENCY,
+    ATTR_STOP_LATENCY,
+    ATTR_MOTOR_CYCLES,
+    ATTR_LOOP_LAG,
+    ATTR_STOP_COMPENSATION,
+    ATTR_MOTOR_RUN_TIME,
+    ATTR_DUTY_RUN_TIME,
+    ATTR_START_POSITION,
+    ATTR_END_POSITION,
+    ATTR_TARGET_POSITION,
+    ATTR_PLANNED_DURATION,
+    ATTR_ACTUAL_DURATION,
+    ATTR_ARRIVE_AT,
+    DUTY_MODE_REJECT,
+    EVENT_MOVEMENT_STARTED,
+    EVENT_MOVEMENT_ARRIVED,
+    EVENT_MOVEMENT_STOPPED,
+    DOMAIN,
     CONF_TILTING_TIME_DOWN,
     CONF_TILTING_TIME_UP,
     CONF_TILT_STOP_SCRIPT_ENTITY_ID,
     CONF_TILT_ONLY_WHEN_CLOSED,
+    CONF_TILT_COUPLED,
     CONF_TRAVELLING_TIME_DOWN,
     CONF_TRAVELLING_TIME_UP,
     CONF_BLOCK_TILT_IF_OPEN,
     CONF_COMMAND_DELAY,
 )
-from .models import DeviceConfig, ScriptsConfig, WrapperConfig
-from .travelcalculator import TravelCalculator, TravelStatus
+from .duty import DutyCycle
+from .models import DeviceConfig, Movement, ScriptsConfig, WrapperConfig
+from .perf import PerfCounters, perf_counters
+from .lag import LoopLag
+from .trace import SOURCE_END_SENSOR, SOURCE_POWER, SOURCE_WRAPPER, MovementTrace
+from .planner import (
+    AXIS_POSITION,
+    MotionProfile,
+    MovePlan,
+    approach_targets,
+    plan_move,
+    simulate_moves,
+    tilt_range,
+    tilt_shift,
+)
+from .travelcalculator import MIN_CORRECTION_TRAVEL, TravelCalculator, TravelStatus
 
 _LOGGER = logging.getLogger(__name__)
 
+
+def _int_attr(state, attribute):
+    """Return a state attribute as int, or None if missing or invalid."""
+    value = state.attributes.get(attribute)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def unique_id_for(device_id: str) -> str:
+    """Return the entity unique_id used for a device id."""
+    return f"cover_rf_timebased_uuid_{device_id}"
+
+
 class CoverTimeBased(CoverEntity, RestoreEntity):
     def __init__(self, device_id: str, config: DeviceConfig, scripts: ScriptsConfig, wrapper: WrapperConfig):
         self._device_id = device_id
         self._unique_id = device_id
-        self._config = config
-        self._scripts = scripts
-        self._wrapper = wrapper
-        self._name = config.name
-        self._device_class = config.device_class
-        self._send_stop_at_ends = config.send_stop_at_ends
-        self._always_confident = config.always_confident
-        self._tilt_only_when_closed = config.tilt_only_when_closed
-        self._assume_uncertain_position = not self._always_confident
         self._target_position = 0
         self._target_tilt_position = 0
         self._stopping = False
         self._processing_known_position = False
-        self._cover_entity_id = wrapper.cover_entity_id
-        self._availability_template = config.availability_template
-        self._open_script_entity_id = scripts.open_script
-        self._close_script_entity_id = scripts.close_script
-        self._stop_script_entity_id = scripts.stop_script
-        self._tilt_open_script_entity_id = scripts.tilt_open_script
-        self._tilt_close_script_entity_id = scripts.tilt_close_script
-        self._tilt_stop_script_entity_id = scripts.tilt_stop_script
-        self._effective_tilt_open_script = self._tilt_open_script_entity_id or self._open_script_entity_id
-        self._effective_tilt_close_script = self._tilt_close_script_entity_id or self._close_script_entity_id
-        self._effective_tilt_stop_script = self._tilt_stop_script_entity_id or self._stop_script_entity_id
-        self._has_tilt = any([
-            self._tilt_open_script_entity_id,
-            self._tilt_close_script_entity_id,
-            self._tilt_stop_script_entity_id,
-        ])
-        self._command_delay = config.command_delay
+        # Coupled (venetian) mode: one axis is moving only as a side effect of the other
+        self._tilt_follows_main = False
+        self._main_follows_tilt = False
+        self._plan_task = None
+        self._unsub_duty_queue = None
+        self._unsub_scheduled_move = None
+        self._duty = DutyCycle(config.duty_window)
+        # Commanded main travel reported through the movement events
+        self._movement = None
+        self._pending_arrival = None
+        self._unsub_stop_deadline = None
+        self._trace = MovementTrace()
+        self._lag = LoopLag()
+        self._last_trace_seq = -1
+        self._unsub_arrived_event = None
+        # Replaced by the device's shared counters once added to hass
+        self._perf = PerfCounters()
+        self._service_call = None
+        self._load_config(config, scripts, wrapper)
+        self._assume_uncertain_position = not self._always_confident
         self.tc = TravelCalculator(config.travel_time_down, config.travel_time_up, config.command_delay)
+        self.tc.backlash = config.backlash
         self.tilt_tc = TravelCalculator(config.tilting_time_down, config.tilting_time_up, config.command_delay)
         self._unsubscribe_auto_update = None
         self._unsub_availability_tracker = None
         self._unsub_wrapper_state_listener = None
+        self._unsub_wrapper_flush = None
+        self._unsub_end_stop_sensors = None
+        self._unsub_power_sensor = None
+        self._motor_running = False
+        self._stop_sent_at = None
+        self._start_latency = None
+        self._stop_latency = None
+        self._pending_wrapper_state = None
+        self._pending_wrapper_position = None
+        self._pending_wrapper_time = None
+        self._last_wrapper_report = None
         self.hass = None
 
+    def _load_config(self, config: DeviceConfig, scripts: ScriptsConfig, wrapper: WrapperConfig):
+        """Keep references to the configuration; settings are read from it, not copied."""
+        self._config = config
+        self._scripts = scripts
+        self._wrapper = wrapper
+
+    @property
+    def _name(self):
+        return self._config.name
+
+    @property
+    def _device_class(self):
+        return self._config.device_class
+
+    @property
+    def _send_stop_at_ends(self):
+        return self._config.send_stop_at_ends
+
+    @property
+    def _always_confident(self):
+        return self._config.always_confident
+
+    @property
+    def _tilt_only_when_closed(self):
+        return self._config.tilt_only_when_closed
+
+    @property
+    def _tilt_coupled(self):
+        return self._config.tilt_coupled
+
+    @property
+    def _availability_template(self):
+        return self._config.availability_template
+
+    @property
+    def _command_delay(self):
+        return self._config.command_delay
+
+    @property
+    def _cover_entity_id(self):
+        return self._wrapper.cover_entity_id
+
+    @property
+    def _open_script_entity_id(self):
+        return self._scripts.open_script
+
+    @property
+    def _close_script_entity_id(self):
+        return self._scripts.close_script
+
+    @property
+    def _stop_script_entity_id(self):
+        return self._scripts.stop_script
+
+    @property
+    def _tilt_open_script_entity_id(self):
+        return self._scripts.tilt_open_script
+
+    @property
+    def _tilt_close_script_entity_id(self):
+        return self._scripts.tilt_close_script
+
+    @property
+    def _tilt_stop_script_entity_id(self):
+        return self._scripts.tilt_stop_script
+
+    @property
+    def _effective_tilt_open_script(self):
+        return self._scripts.tilt_open_script or self._scripts.open_script
+
+    @property
+    def _effective_tilt_close_script(self):
+        return self._scripts.tilt_close_script or self._scripts.close_script
+
+    @property
+    def _effective_tilt_stop_script(self):
+        return self._scripts.tilt_stop_script or self._scripts.stop_script
+
+    @property
+    def _has_tilt(self):
+        scripts = self._scripts
+        return bool(scripts.tilt_open_script or scripts.tilt_close_script or scripts.tilt_stop_script)
+
+    def requires_reload(self, scripts: ScriptsConfig, wrapper: WrapperConfig) -> bool:
+        """Return True if the new config changes what the entity is wired to.
+
+        Changed sensor entities and availability templates do not need a
+        reload: async_apply_config re-subscribes those listeners.
+        """
+        has_tilt = any([scripts.tilt_open_script, scripts.tilt_close_script, scripts.tilt_stop_script])
+        return wrapper.cover_entity_id != self._cover_entity_id or has_tilt != self._has_tilt
+
+    def config_changed(self, config: DeviceConfig, scripts: ScriptsConfig, wrapper: WrapperConfig) -> bool:
+        """Return True if the given config differs from the one in use."""
+        return (config, scripts, wrapper) != (self._config, self._scripts, self._wrapper)
+
+    @callback
+    def async_apply_config(self, config: DeviceConfig, scripts: ScriptsConfig, wrapper: WrapperConfig):
+        """Apply new timing/behaviour options to the live entity without a reload.
+
+        Active travel is rebased on the current position so the estimate does
+        not jump when travel times change mid-move. Listeners whose entities
+        or template changed are re-subscribed.
+        """
+        previous = self._config
+        self._load_config(config, scripts, wrapper)
+        if self._always_confident:
+            self._assume_uncertain_position = False
+        self.tc.update_timing(config.travel_time_down, config.travel_time_up, config.command_delay)
+        self.tc.backlash = config.backlash
+        self._duty.window = config.duty_window
+        self.tilt_tc.update_timing(config.tilting_time_down, config.tilting_time_up, config.command_delay)
+        if self.hass is not None:
+            self._schedule_stop_deadline()
+            self._resubscribe_listeners(previous)
+            self.async_write_ha_state()
+        _LOGGER.debug("%s: Options applied in place", self._name)
+
+    def _resubscribe_listeners(self, previous: DeviceConfig):
+        """Re-subscribe the listeners whose inputs differ from ``previous``."""
+        config = self._config
+        if config.availability_template != previous.availability_template:
+            if self._unsub_availability_tracker is not None:
+                self._unsub_availability_tracker()
+                self._unsub_availability_tracker = None
+            self._setup_availability()
+        if (config.open_sensor, config.closed_sensor) != (previous.open_sensor, previous.closed_sensor):
+            if self._unsub_end_stop_sensors is not None:
+                self._unsub_end_stop_sensors()
+                self._unsub_end_stop_sensors = None
+            self._setup_end_stop_sensors()
+        if config.power_sensor != previous.power_sensor:
+            if self._unsub_power_sensor is not None:
+                self._unsub_power_sensor()
+                self._unsub_power_sensor = None
+            self._motor_running = False
+            self._setup_power_sensor()
+
+    @property
+    def device_id(self) -> str:
+        return self._device_id
+
+    @property
+    def configs(self) -> tuple[DeviceConfig, ScriptsConfig, WrapperConfig]:
+        return self._config, self._scripts, self._wrapper
+
+    @property
+    def movement_trace(self) -> MovementTrace:
+        return self._trace
+
     @property
     def name(self):
         return self._name
 
     @property
     def unique_id(self):
-        return f"cover_rf_timebased_uuid_{self._unique_id}"
+        return unique_id_for(self._unique_id)
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """One device per cover; its diagnostic sensors are attached to it as well."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._device_id)},
+            name=self._name,
+            model="Time based cover",
+        )
 
     @property
     def supported_features(self):
@@ -158,7 +380,7 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
             ATTR_UNCONFIRMED_STATE: str(self._assume_uncertain_position),
             ATTR_CONFIDENT: not self._assume_uncertain_position,
             ATTR_DEVICE_ID: self._device_id,
-            'tilt_is_allowed': (not self._tilt_only_when_closed) or self.tc.current_position() == 0,
+            'tilt_is_allowed': not self._should_block_tilt(),
         }
         if self._has_tilt:
             attr[ATTR_CURRENT_TILT_POSITION] = self.current_cover_tilt_position
@@ -166,20 +388,113 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
             attr[CONF_TILTING_TIME_UP] = self._config.tilting_time_up
             attr[CONF_TILT_STOP_SCRIPT_ENTITY_ID] = self._tilt_stop_script_entity_id
             attr[CONF_TILT_ONLY_WHEN_CLOSED] = self._tilt_only_when_closed
+            attr[CONF_TILT_COUPLED] = self._tilt_coupled
         attr[CONF_TRAVELLING_TIME_DOWN] = self._config.travel_time_down
         attr[CONF_TRAVELLING_TIME_UP] = self._config.travel_time_up
         attr[CONF_BLOCK_TILT_IF_OPEN] = self._config.block_tilt_if_open
         attr[CONF_COMMAND_DELAY] = self._config.command_delay
+        attr[ATTR_LOOP_LAG] = round(self._lag.tick_lag * 1000, 1)
+        attr[ATTR_STOP_COMPENSATION] = round(self._lag.compensation * 1000, 1)
+        attr[ATTR_MOTOR_CYCLES] = self._duty.cycles
+        attr[ATTR_MOTOR_RUN_TIME] = round(self._duty.total_run_time, 1)
+        if self._config.max_run_time:
+            attr[ATTR_DUTY_RUN_TIME] = round(self._duty.run_time(self.tc.current_time()), 1)
+        if self._config.power_sensor:
+            attr[ATTR_START_LATENCY] = self._start_latency
+            attr[ATTR_STOP_LATENCY] = self._stop_latency
         return attr
 
     async def async_added_to_hass(self):
         self.hass = self.platform.hass
+        self._perf = perf_counters(self.hass, self._device_id)
         await super().async_added_to_hass()
         await self._restore_state()
         self._setup_availability()
         self._setup_wrapper_state_listener()
+        self._setup_end_stop_sensors()
+        self._setup_power_sensor()
+
+    @callback
+    def async_set_context(self, context):
+        """Remember when a service call reached the entity (dispatch latency).
+
+        The call is tied to the task running its handler, so a call that
+        sends no command (set_known_position, get_move_plan, a scheduled or
+        queued move) is not matched with a later command from another task.
+        """
+        super().async_set_context(context)
+        if self._perf.enabled:
+            self._service_call = (asyncio.current_task(), self.tc.current_time())
+
+    @callback
+    def async_write_ha_state(self):
+        if self._perf.enabled:
+            self._perf.state_written(self.tc.current_time())
+        super().async_write_ha_state()
+
+    def active_timers(self) -> int:
+        """Number of timers and tasks this entity currently has scheduled."""
+        timers = sum(
+            unsub is not None
+            for unsub in (
+                self._unsubscribe_auto_update,
+                self._unsub_wrapper_flush,
+                self._unsub_duty_queue,
+                self._unsub_stop_deadline,
+                self._unsub_arrived_event,
+                self._unsub_scheduled_move,
+            )
+        )
+        if self._plan_task is not None and not self._plan_task.done():
+            timers += 1
+        return timers
+
+    def export_runtime_state(self) -> dict[str, Any]:
+        """Return the runtime state that is carried over by export/import.
+
+        Besides the position this is what the cover has learned about its
+        motor: the measured start/stop latencies and the lifetime duty
+        counters. The travel speed correction is not included, it only
+        lives for one travel segment.
+        """
+        return {
+            ATTR_POSITION: self.tc.current_position(),
+            ATTR_TILT_POSITION: self.tilt_tc.current_position() if self._has_tilt else None,
+            ATTR_CONFIDENT: not self._assume_uncertain_position,
+            ATTR_START_LATENCY: self._start_latency,
+            ATTR_STOP_LATENCY: self._stop_latency,
+            ATTR_MOTOR_CYCLES: self._duty.cycles,
+            ATTR_MOTOR_RUN_TIME: round(self._duty.total_run_time, 1),
+        }
+
+    @callback
+    def async_import_runtime_state(self, state: dict[str, Any]):
+        """Apply runtime state from an imported document without sending commands."""
+        if self.tc.is_traveling() or self.tilt_tc.is_traveling():
+            _LOGGER.debug("%s: Imported state ignored while moving", self._name)
+            return
+        if state.get(ATTR_POSITION) is not None:
+            self._apply_main_current(int(state[ATTR_POSITION]))
+        if self._has_tilt and state.get(ATTR_TILT_POSITION) is not None:
+            self._apply_tilt_current(int(state[ATTR_TILT_POSITION]))
+        if not self._always_confident:
+            self._assume_uncertain_position = not state.get(ATTR_CONFIDENT, False)
+        if state.get(ATTR_START_LATENCY) is not None:
+            self._start_latency = state[ATTR_START_LATENCY]
+        if state.get(ATTR_STOP_LATENCY) is not None:
+            self._stop_latency = state[ATTR_STOP_LATENCY]
+        if state.get(ATTR_MOTOR_CYCLES) is not None:
+            self._duty.cycles = state[ATTR_MOTOR_CYCLES]
+        if state.get(ATTR_MOTOR_RUN_TIME) is not None:
+            self._duty.total_run_time = state[ATTR_MOTOR_RUN_TIME]
+        if self.hass is not None:
+            self.async_write_ha_state()
 
     async def _restore_state(self):
+        pending = self.hass.data.get(DOMAIN, {}).get("pending_state", {}).pop(self._name, None)
+        if pending is not None:
+            self.async_import_runtime_state(pending)
+            return
         old = await self.async_get_last_state()
         if not old:
             return
@@ -189,6 +504,11 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
                 self.tc.set_position(int(pos))
             except Exception:
                 _LOGGER.debug("%s: Invalid stored position '%s' ignored", self._name, pos)
+        try:
+            self._duty.cycles = int(old.attributes.get(ATTR_MOTOR_CYCLES, 0))
+            self._duty.total_run_time = float(old.attributes.get(ATTR_MOTOR_RUN_TIME, 0))
+        except (ValueError, TypeError):
+            _LOGGER.debug("%s: Invalid stored motor counters ignored", self._name)
         unconfirmed = old.attributes.get(ATTR_UNCONFIRMED_STATE)
         if unconfirmed is not None and not self._always_confident:
             self._assume_uncertain_position = bool(unconfirmed) if isinstance(unconfirmed, bool) else str(unconfirmed).lower() == 'true'
@@ -217,43 +537,20 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
 
         @callback
         def _wrapper_state_changed(event):
-            """Handle wrapped cover state changes."""
-            # Ignore if we're currently processing a command
-            if self.tc.is_traveling() or (self._has_tilt and self.tilt_tc.is_traveling()):
-                return
-
+            """Collect wrapped cover state changes; bursts are handled in one flush."""
             new_state = event.data.get("new_state")
             if new_state is None:
                 return
-
-            # Update position from wrapped cover
-            new_position = new_state.attributes.get(ATTR_CURRENT_POSITION)
-            if new_position is not None:
-                try:
-                    new_position = int(new_position)
-                    if new_position != self.tc.current_position():
-                        _LOGGER.debug("%s: Syncing position from wrapper %s: %d",
-                                     self._name, self._cover_entity_id, new_position)
-                        self.tc.set_position(new_position)
-                        self._target_position = new_position
-                        self.async_write_ha_state()
-                except (ValueError, TypeError):
-                    pass
-
-            # Update tilt position if available (only if we don't have tilt scripts)
-            if self._has_tilt and not self._tilt_open_script_entity_id:
-                new_tilt = new_state.attributes.get(ATTR_CURRENT_TILT_POSITION)
-                if new_tilt is not None:
-                    try:
-                        new_tilt = int(new_tilt)
-                        if new_tilt != self.tilt_tc.current_position():
-                            _LOGGER.debug("%s: Syncing tilt from wrapper %s: %d",
-                                         self._name, self._cover_entity_id, new_tilt)
-                            self.tilt_tc.set_position(new_tilt)
-                            self._target_tilt_position = new_tilt
-                            self.async_write_ha_state()
-                    except (ValueError, TypeError):
-                        pass
+            position = _int_attr(new_state, ATTR_CURRENT_POSITION)
+            if self._pending_wrapper_state is None or position != self._pending_wrapper_position:
+                # Remember when this position was observed, not when the burst is flushed
+                self._pending_wrapper_position = position
+                self._pending_wrapper_time = self.tc.current_time()
+            self._pending_wrapper_state = new_state
+            if self._unsub_wrapper_flush is None:
+                self._unsub_wrapper_flush = async_call_later(
+                    self.hass, WRAPPER_COALESCE_WINDOW, self._flush_wrapper_state
+                )
 
         try:
             from homeassistant.helpers.event import async_track_state_change_event
@@ -264,6 +561,190 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
         except Exception as ex:
             _LOGGER.error("%s: wrapper state listener setup failed: %s", self._name, ex, exc_info=True)
 
+    def _end_stop_sensors(self) -> dict[str, int]:
+        """Map configured end-stop sensor entity ids to the position they confirm."""
+        sensors = {}
+        if self._config.open_sensor:
+            sensors[self._config.open_sensor] = self.tc.position_open
+        if self._config.closed_sensor:
+            sensors[self._config.closed_sensor] = self.tc.position_closed
+        return sensors
+
+    def _setup_end_stop_sensors(self):
+        """Subscribe directly to end-stop sensors; 'on' means the cover is at that end."""
+        sensors = self._end_stop_sensors()
+        if not sensors:
+            return
+
+        @callback
+        def _sensor_changed(event):
+            new_state = event.data.get("new_state")
+            if new_state is None or new_state.state != STATE_ON:
+                return
+            self._confirm_end_stop(sensors[event.data["entity_id"]])
+
+        from homeassistant.helpers.event import async_track_state_change_event
+        self._unsub_end_stop_sensors = async_track_state_change_event(
+            self.hass, list(sensors), _sensor_changed
+        )
+
+        # A sensor that is already active confirms the position right away
+        for entity_id, position in sensors.items():
+            state = self.hass.states.get(entity_id)
+            if state is not None and state.state == STATE_ON:
+                self._confirm_end_stop(position)
+
+    @callback
+    def _confirm_end_stop(self, position: int):
+        """Finish the active main travel at a sensor-confirmed end position."""
+        _LOGGER.debug("%s: End stop confirmed at %d by sensor", self._name, position)
+        self._trace_confirm(position, SOURCE_END_SENSOR)
+        target = self.tc.travel_to_position
+        self.tc.set_position(position)
+        self._target_position = position
+        self._assume_uncertain_position = False
+        self._end_movement(EVENT_MOVEMENT_ARRIVED if position == target else EVENT_MOVEMENT_STOPPED)
+        if not self.is_tilting:
+            self.stop_auto_updater()
+        self.async_write_ha_state()
+
+    def _setup_power_sensor(self):
+        """Detect real motor start/stop from a power sensor crossing the threshold."""
+        sensor = self._config.power_sensor
+        if not sensor:
+            return
+        state = self.hass.states.get(sensor)
+        self._motor_running = self._power_above_threshold(state) is True
+
+        @callback
+        def _power_changed(event):
+            running = self._power_above_threshold(event.data.get("new_state"))
+            if running is None or running == self._motor_running:
+                return
+            self._motor_running = running
+            if running:
+                self._motor_started()
+            else:
+                self._motor_stopped()
+
+        from homeassistant.helpers.event import async_track_state_change_event
+        self._unsub_power_sensor = async_track_state_change_event(
+            self.hass, [sensor], _power_changed
+        )
+
+    def _power_above_threshold(self, state) -> bool | None:
+        """Return True/False for a power reading, None if it is not a number."""
+        if state is None:
+            return None
+        try:
+            return float(state.state) >= self._config.power_threshold
+        except (ValueError, TypeError):
+            return None
+
+    @callback
+    def _motor_started(self):
+        """Anchor the main travel on the measured motor start."""
+        self._stop_sent_at = None
+        latency = self.tc.motor_started(self.tc.current_time())
+        if latency is None:
+            return
+        self._start_latency = round(latency, 3)
+        _LOGGER.debug("%s: Motor started %.3fs after command", self._name, latency)
+        self._schedule_stop_deadline()
+        self.async_write_ha_state()
+
+    @callback
+    def _motor_stopped(self):
+        """Measure stop latency, or end the travel if the motor stopped on its own."""
+        now = self.tc.current_time()
+        if not self.tc.is_traveling():
+            self._trace_confirm(self.tc.current_position(), SOURCE_POWER)
+            if self._stop_sent_at is not None:
+                self._stop_latency = round(now - self._stop_sent_at, 3)
+                self._stop_sent_at = None
+                self.async_write_ha_state()
+            return
+        target = self.tc.travel_to_position
+        position = self.tc.motor_stopped(now)
+        self._trace_confirm(position, SOURCE_POWER)
+        if target in (self.tc.position_closed, self.tc.position_open) and abs(target - position) < MIN_CORRECTION_TRAVEL:
+            # The motor's own limit switch ended the travel slightly ahead of the model
+            self.tc.set_position(target)
+            self._target_position = target
+            self._end_movement(EVENT_MOVEMENT_ARRIVED)
+            self._stop_updater_if_idle()
+            self.async_write_ha_state()
+            return
+        self._target_position = position
+        self._end_movement(EVENT_MOVEMENT_STOPPED)
+        _LOGGER.warning(
+            "%s: Motor stopped before reaching the target, position set to %d (obstacle or thermal cut-out?)",
+            self._name, position,
+        )
+        if not self.is_tilting:
+            self.stop_auto_updater()
+        self.async_write_ha_state()
+
+    @callback
+    def _flush_wrapper_state(self, _now=None):
+        """Sync position and tilt from the last wrapped cover state of a burst."""
+        self._unsub_wrapper_flush = None
+        new_state = self._pending_wrapper_state
+        observed_at = self._pending_wrapper_time
+        self._pending_wrapper_state = None
+        if new_state is None:
+            return
+
+        new_position = _int_attr(new_state, ATTR_CURRENT_POSITION)
+        new_tilt = _int_attr(new_state, ATTR_CURRENT_TILT_POSITION)
+        report = (new_position, new_tilt)
+
+        # While moving, reports either correct the active segment (fusion) or are ignored.
+        # A repeated report would fuse a stale position at a later time, so it is fused once.
+        if self.tc.is_traveling() or (self._has_tilt and self.tilt_tc.is_traveling()):
+            if report != self._last_wrapper_report and self._fuse_wrapper_report(new_position, observed_at):
+                self._last_wrapper_report = report
+            return
+        # Stationary reports are compared against the current positions below
+        self._last_wrapper_report = report
+
+        changed = False
+        if new_position is not None:
+            self._trace_confirm(new_position, SOURCE_WRAPPER)
+        if new_position is not None and new_position != self.tc.current_position():
+            _LOGGER.debug("%s: Syncing position from wrapper %s: %d",
+                          self._name, self._cover_entity_id, new_position)
+            self.tc.set_position(new_position)
+            self._target_position = new_position
+            changed = True
+
+        # Update tilt position if available (only if we don't have tilt scripts)
+        if self._has_tilt and not self._tilt_open_script_entity_id:
+            if new_tilt is not None and new_tilt != self.tilt_tc.current_position():
+                _LOGGER.debug("%s: Syncing tilt from wrapper %s: %d",
+                              self._name, self._cover_entity_id, new_tilt)
+                self.tilt_tc.set_position(new_tilt)
+                self._target_tilt_position = new_tilt
+                changed = True
+
+        if changed:
+            self.async_write_ha_state()
+
+    def _fuse_wrapper_report(self, reported, observed_at):
+        """Feed a mid-travel position report of the wrapped cover into the travel model.
+
+        Returns True if the report was fused, False if it was ignored.
+        """
+        weight = self._config.wrapper_position_weight
+        if weight <= 0 or reported is None or not self.tc.is_traveling():
+            return False
+        self.tc.correct_position(reported, weight, observed_at)
+        _LOGGER.debug("%s: Fused wrapper position %d (weight %.2f), estimate now %d",
+                      self._name, reported, weight, self.tc.current_position())
+        self._schedule_stop_deadline()
+        self.async_write_ha_state()
+        return True
+
     async def async_will_remove_from_hass(self):
         """Clean up when entity is removed."""
         if self._unsub_availability_tracker is not None:
@@ -274,6 +755,29 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
             self._unsub_wrapper_state_listener()
             self._unsub_wrapper_state_listener = None
 
+        if self._unsub_wrapper_flush is not None:
+            self._unsub_wrapper_flush()
+            self._unsub_wrapper_flush = None
+
+        if self._unsub_end_stop_sensors is not None:
+            self._unsub_end_stop_sensors()
+            self._unsub_end_stop_sensors = None
+
+        if self._unsub_power_sensor is not None:
+            self._unsub_power_sensor()
+            self._unsub_power_sensor = None
+
+        if self._unsub_stop_deadline is not None:
+            self._unsub_stop_deadline()
+            self._unsub_stop_deadline = None
+
+        if self._unsub_arrived_event is not None:
+            self._unsub_arrived_event()
+            self._unsub_arrived_event = None
+
+        self._cancel_plan()
+        self._cancel_duty_queue()
+        self._cancel_scheduled_move()
         self.stop_auto_updater()
 
     @property
@@ -288,6 +792,14 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
         moving_tilt = self._has_tilt and self.tilt_tc.is_traveling()
         if moving_tilt:
             self.tilt_tc.update_position()
+        now = self.tc.current_time()
+        lag = self._lag.tick(now, TRAVEL_TIME_INTERVAL.total_seconds())
+        if self._lag.should_warn(lag, now):
+            _LOGGER.warning("%s: Position update fired %.0f ms late, event loop is busy", self._name, lag * 1000)
+        if self._perf.enabled:
+            self._perf.ticks += 1
+            if not moving_main and not moving_tilt:
+                self._perf.leaked_updaters += 1
         if moving_main or moving_tilt:
             self.async_write_ha_state()
         if not moving_main and not moving_tilt:
@@ -296,26 +808,255 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
 
     def start_auto_updater(self):
         if self._unsubscribe_auto_update is None:
+            self._lag.reset_ticks()
             self._unsubscribe_auto_update = async_track_time_interval(
                 self.hass, self._update_cover_position, TRAVEL_TIME_INTERVAL
             )
 
     def stop_auto_updater(self):
         if self._unsubscribe_auto_update is not None:
+            self._duty.stop(self.tc.current_time())
             self._unsubscribe_auto_update()
             self._unsubscribe_auto_update = None
 
+    def _stop_updater_if_idle(self):
+        """Stop the updater as soon as nothing moves, so no tick fires after a stop or arrival."""
+        if not self.tc.is_traveling() and not self.is_tilting:
+            self.stop_auto_updater()
+
+    def _begin_movement(self):
+        """Track a commanded main travel: fire the started event and time its stop."""
+        self._end_movement(EVENT_MOVEMENT_STOPPED)
+        if self._unsub_arrived_event is not None:
+            # The previous movement is still settling; report its arrival before the new start
+            self._unsub_arrived_event()
+            self._unsub_arrived_event = None
+            self._fire_pending_arrival()
+        if not self.tc.is_traveling():
+            return
+        now = self.tc.current_time()
+        self._movement = Movement(
+            start_position=self.tc.last_known_position,
+            target_position=self.tc.travel_to_position,
+            started_at=now,
+            planned_duration=round(self.tc.arrival_time() - now, 3),
+        )
+        self._movement.trace_seq = self._trace.begin(
+            now,
+            self.tc.last_known_position,
+            self.tc.travel_to_position,
+            self.tc.arrival_time() - now - self.tc.start_lag - self.tc.lead_time,
+            self.tc.lead_time,
+            self.tc.command_delay,
+            self.tc.stop_deadline(),
+        )
+        self._fire_movement_event(EVENT_MOVEMENT_STARTED, self._movement, self._movement.target_position, None)
+        self._schedule_stop_deadline()
+
+    def _schedule_stop_deadline(self):
+        """Run the auto-stop at the exact moment the tracked travel has to stop.
+
+        The periodic updater only notices the deadline on its next tick, up to
+        one interval late. The timer is re-armed whenever the segment is
+        rebased (measured motor start, fused wrapper report, new timing).
+        The timer is armed early by the lag deadline timers have shown so far.
+        The auto-stop it triggers may run ahead of the deadline only by as
+        much as this timer actually fired late; a timer that fired on time
+        waits for the deadline instead of sending STOP early.
+        """
+        if self._unsub_stop_deadline is not None:
+            self._unsub_stop_deadline()
+            self._unsub_stop_deadline = None
+        if self._movement is None or not self.tc.is_traveling():
+            return
+        compensation = self._lag.compensation
+        deadline = self.tc.stop_deadline()
+        armed_at = deadline - compensation
+
+        @callback
+        def _deadline(_now):
+            self._unsub_stop_deadline = None
+            now = self.tc.current_time()
+            lag = self._lag.deadline(armed_at, now)
+            if self._lag.should_warn(lag, now):
+                _LOGGER.warning("%s: Stop deadline fired %.0f ms late, event loop is busy", self._name, lag * 1000)
+            tolerance = min(compensation, lag)
+            if now + tolerance < deadline:
+                self._unsub_stop_deadline = async_call_later(self.hass, deadline - now, _deadline_reached)
+                return
+            self.hass.async_create_task(self.auto_stop_if_necessary(tolerance))
+
+        @callback
+        def _deadline_reached(_now):
+            self._unsub_stop_deadline = None
+            self.hass.async_create_task(self.auto_stop_if_necessary())
+
+        self._trace.reschedule(self._movement.trace_seq, deadline)
+        self._unsub_stop_deadline = async_call_later(self.hass, max(0, armed_at - self.tc.current_time()), _deadline)
+
+    def _end_movement(self, event_type: str, arrival_at: float | None = None):
+        """Fire the arrived/stopped event of the tracked movement and stop tracking it.
+
+        STOP is sent ahead of the motor reaching the target, so an arrival is
+        reported at ``arrival_at`` (the model's arrival deadline) when that is
+        still in the future.
+        """
+        movement, self._movement = self._movement, None
+        if self._unsub_stop_deadline is not None:
+            self._unsub_stop_deadline()
+            self._unsub_stop_deadline = None
+        if movement is None:
+            return
+        now = self.tc.current_time()
+        position = self.tc.current_position()
+        self._trace.finish(movement.trace_seq, now, position, event_type == EVENT_MOVEMENT_ARRIVED)
+        self._last_trace_seq = movement.trace_seq
+        if event_type != EVENT_MOVEMENT_ARRIVED or arrival_at is None or arrival_at <= now:
+            self._fire_movement_event(event_type, movement, position, now)
+            return
+
+        @callback
+        def _arrived(_now):
+            self._unsub_arrived_event = None
+            self._fire_pending_arrival()
+
+        self._pending_arrival = (movement, position, arrival_at)
+        self._unsub_arrived_event = async_call_later(self.hass, arrival_at - now, _arrived)
+
+    def _trace_confirm(self, position: int, source: int):
+        """Record a real position for the active movement, or the last one if none is active."""
+        seq = self._movement.trace_seq if self._movement is not None else self._last_trace_seq
+        self._trace.confirm(seq, self.tc.current_time(), position, source)
+
+    def _fire_pending_arrival(self):
+        movement, position, arrival_at = self._pending_arrival
+        self._pending_arrival = None
+        self._fire_movement_event(EVENT_MOVEMENT_ARRIVED, movement, position, arrival_at)
+
+    def _fire_movement_event(self, event_type: str, movement: Movement, end_position: int, ended_at: float | None):
+        self.hass.bus.async_fire(event_type, {
+            ATTR_ENTITY_ID: self.entity_id,
+            ATTR_DEVICE_ID: self._device_id,
+            ATTR_START_POSITION: movement.start_position,
+            ATTR_END_POSITION: end_position,
+            ATTR_TARGET_POSITION: movement.target_position,
+            ATTR_PLANNED_DURATION: movement.planned_duration,
+            ATTR_ACTUAL_DURATION: None if ended_at is None else round(ended_at - movement.started_at, 3),
+            ATTR_CONFIDENT: not self._assume_uncertain_position,
+        })
+
+    def _duty_permits(self, run_time: float, retry, *args, **kwargs) -> bool:
+        """Check a move against the duty limit; queue or reject it if the motor needs to cool down."""
+        self._cancel_duty_queue()
+        limit = self._config.max_run_time
+        if not limit:
+            return True
+        wait = self._duty.wait_time(self.tc.current_time(), run_time, limit, self._motor_run_end())
+        if wait <= 0:
+            return True
+        if self._config.duty_mode == DUTY_MODE_REJECT:
+            _LOGGER.warning("%s: Move rejected, motor duty limit reached (retry in %.0fs)", self._name, wait)
+            return False
+
+        @callback
+        def _run_queued(_now):
+            self._unsub_duty_queue = None
+            self.hass.async_create_task(retry(*args, **kwargs))
+
+        _LOGGER.info("%s: Motor duty limit reached, move queued for %.0fs", self._name, wait)
+        self._unsub_duty_queue = async_call_later(self.hass, wait, _run_queued)
+        return False
+
+    def _motor_run_end(self) -> float:
+        """When the running motor is expected to stop: the latest arrival of the active travels."""
+        ends = [tc.arrival_time() for tc in (self.tc, self.tilt_tc) if tc.is_traveling()]
+        return max(ends, default=self.tc.current_time())
+
+    def _cancel_duty_queue(self):
+        if self._unsub_duty_queue is not None:
+            self._unsub_duty_queue()
+            self._unsub_duty_queue = None
+
+    def _main_run_time(self, target: int) -> float:
+        cur = self.tc.current_position()
+        full = self.tc.travel_time_up if target > cur else self.tc.travel_time_down
+        return full * abs(target - cur) / 100
+
+    def _tilt_run_time(self, target: int) -> float:
+        cur = self.tilt_tc.current_position()
+        full = self.tilt_tc.travel_time_up if target > cur else self.tilt_tc.travel_time_down
+        return full * abs(target - cur) / 100
+
     def _should_block_tilt(self) -> bool:
-        return self._tilt_only_when_closed and self.tc.current_position() > 0
+        return self._tilt_only_when_closed and self.tc.current_position() > self._coupled_tilt_range()
+
+    def _is_coupled(self) -> bool:
+        return self._tilt_coupled and self._has_tilt
+
+    def _coupled_tilt_range(self) -> int:
+        """Main position change caused by a full tilt-up when tilt and main are coupled."""
+        if not self._is_coupled():
+            return 0
+        return tilt_range(self._motion_profile())
+
+    def _motion_profile(self) -> MotionProfile:
+        return MotionProfile(
+            travel_time_down=self.tc.travel_time_down,
+            travel_time_up=self.tc.travel_time_up,
+            tilting_time_down=self.tilt_tc.travel_time_down,
+            tilting_time_up=self.tilt_tc.travel_time_up,
+            command_delay=self._command_delay,
+            send_stop_at_ends=self._send_stop_at_ends,
+            tilt_only_when_closed=self._tilt_only_when_closed,
+            tilt_coupled=self._is_coupled(),
+            backlash=self._config.backlash,
+            min_move_time=self._config.min_move_time,
+        )
+
+    def _couple_tilt_to_main(self, up: bool) -> float:
+        """Turn the slats to their end ahead of a main move and return how long that takes.
+
+        On venetian blinds the motor first uses up the tilt range; the main
+        position only starts changing once the slats are fully turned.
+        """
+        self._main_follows_tilt = False
+        if not self._is_coupled():
+            return 0
+        tilt = self.tilt_tc.current_position()
+        if up:
+            end, lead = 100, self.tilt_tc.travel_time_up * (100 - tilt) / 100
+        else:
+            end, lead = 0, self.tilt_tc.travel_time_down * tilt / 100
+        if lead > 0:
+            self.tilt_tc.start_travel(end)
+            self._target_tilt_position = end
+            self._tilt_follows_main = True
+        return lead
+
+    def _couple_main_to_tilt(self, tilt_target: int):
+        """Shift the main position by the distance the blind moves while tilting."""
+        self._tilt_follows_main = False
+        if not self._is_coupled() or self.tc.is_traveling():
+            return
+        shift = tilt_shift(self._motion_profile(), self.tilt_tc.current_position(), tilt_target)
+        position = self.tc.current_position()
+        target = min(max(position + shift, 0), 100)
+        if target != position:
+            self.tc.start_travel(target)
+            self._target_position = target
+            self._main_follows_tilt = True
 
     def _apply_main_target(self, pos: int):
         self._target_position = pos
-        self.tc.start_travel(self._target_position)
+        lead = self._couple_tilt_to_main(pos > self.tc.current_position())
+        self.tc.start_travel(self._target_position, lead)
+        self._begin_movement()
         self.start_auto_updater()
 
     def _apply_main_current(self, pos: int):
         self.tc.set_position(pos)
         self._target_position = pos
+        self._end_movement(EVENT_MOVEMENT_STOPPED)
 
     def _apply_tilt_target(self, tilt: int):
         self._target_tilt_position = tilt
@@ -348,32 +1089,48 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
                     self._apply_tilt_target(tilt)
                 else:
                     self._apply_tilt_current(tilt)
+        self._stop_updater_if_idle()
         self.async_write_ha_state()
 
     async def async_open_cover(self, **kwargs):
+        self._cancel_plan()
+        if not self._duty_permits(self._main_run_time(100), self.async_open_cover):
+            return
         self._assume_uncertain_position = not self._always_confident
-        self.tc.start_travel_up()
+        self.tc.start_travel_up(self._couple_tilt_to_main(True))
         self._target_position = 100
+        self._begin_movement()
         self.start_auto_updater()
         self.tc.update_position()
         self.async_write_ha_state()
         await self._handle_command(SERVICE_OPEN_COVER)
 
     async def async_close_cover(self, **kwargs):
+        self._cancel_plan()
+        if not self._duty_permits(self._main_run_time(0), self.async_close_cover):
+            return
         self._assume_uncertain_position = not self._always_confident
-        self.tc.start_travel_down()
+        self.tc.start_travel_down(self._couple_tilt_to_main(False))
         self._target_position = 0
+        self._begin_movement()
         self.start_auto_updater()
         self.tc.update_position()
         self.async_write_ha_state()
         await self._handle_command(SERVICE_CLOSE_COVER)
 
     async def async_stop_cover(self, **kwargs):
+        self._cancel_plan()
+        self._cancel_duty_queue()
         if self._stopping or not self.tc.is_traveling():
             return
         self._stopping = True
         try:
             self.tc.stop()
+            self._end_movement(EVENT_MOVEMENT_STOPPED)
+            if self._tilt_follows_main:
+                self.tilt_tc.stop()
+                self._tilt_follows_main = False
+            self._stop_updater_if_idle()
             await self._handle_command(SERVICE_STOP_COVER)
             self.async_write_ha_state()
         finally:
@@ -385,7 +1142,11 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
         if self._should_block_tilt():
             _LOGGER.warning(TILT_BLOCKED_LOG, self.name, self.tc.current_position())
             return
+        self._cancel_plan()
+        if not self._duty_permits(self._tilt_run_time(100), self.async_open_cover_tilt):
+            return
         self._assume_uncertain_position = not self._always_confident
+        self._couple_main_to_tilt(100)
         self.tilt_tc.start_travel_up()
         self._target_tilt_position = 100
         self.start_auto_updater()
@@ -399,7 +1160,11 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
         if self._should_block_tilt():
             _LOGGER.warning(TILT_BLOCKED_LOG, self.name, self.tc.current_position())
             return
+        self._cancel_plan()
+        if not self._duty_permits(self._tilt_run_time(0), self.async_close_cover_tilt):
+            return
         self._assume_uncertain_position = not self._always_confident
+        self._couple_main_to_tilt(0)
         self.tilt_tc.start_travel_down()
         self._target_tilt_position = 0
         self.start_auto_updater()
@@ -408,13 +1173,45 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
         await self._handle_command(SERVICE_CLOSE_COVER_TILT)
 
     async def async_stop_cover_tilt(self, **kwargs):
+        self._cancel_plan()
+        self._cancel_duty_queue()
         if not self._has_tilt or not self.tilt_tc.is_traveling():
             return
         self.tilt_tc.stop()
+        if self._main_follows_tilt:
+            self.tc.stop()
+            self._main_follows_tilt = False
+        self._stop_updater_if_idle()
         await self._handle_command(SERVICE_STOP_COVER_TILT)
         self.async_write_ha_state()
 
     async def async_set_cover_position(self, position, **kwargs):
+        self._cancel_plan()
+        plan = None
+        if not self.tc.is_traveling() and (self._config.backlash or self._config.min_move_time):
+            profile = self._motion_profile()
+            targets = approach_targets(profile, self.tc.current_position(), position)
+            if not targets:
+                _LOGGER.debug("%s: Move to %d is below the minimum pulse and was skipped", self._name, position)
+                self.async_write_ha_state()
+                return
+            if len(targets) > 1:
+                plan = simulate_moves(
+                    profile,
+                    self.tc.current_position(),
+                    self.tilt_tc.current_position(),
+                    [(AXIS_POSITION, target) for target in targets],
+                )
+        # A back-off or backlash approach runs the motor longer than the direct move
+        run_time = plan.motor_time if plan is not None else self._main_run_time(position)
+        if not self._duty_permits(run_time, self.async_set_cover_position, position):
+            return
+        if plan is not None:
+            self._plan_task = self.hass.async_create_task(self._async_run_plan(plan))
+            return
+        await self._async_set_main_position(position)
+
+    async def _async_set_main_position(self, position):
         cur = self.tc.current_position()
         if position == cur:
             if self.tc.is_traveling():
@@ -423,8 +1220,9 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
             return
         cmd = SERVICE_OPEN_COVER if position > cur else SERVICE_CLOSE_COVER
         self._assume_uncertain_position = not self._always_confident
-        self.tc.start_travel(position)
+        self.tc.start_travel(position, self._couple_tilt_to_main(position > cur))
         self._target_position = position
+        self._begin_movement()
         self.start_auto_updater()
         await self._handle_command(cmd)
         self.tc.update_position()
@@ -437,10 +1235,17 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
         if self._should_block_tilt():
             _LOGGER.warning(TILT_BLOCKED_LOG, self.name, self.tc.current_position())
             return
+        self._cancel_plan()
+        if not self._duty_permits(self._tilt_run_time(tilt_position), self.async_set_cover_tilt_position, tilt_position):
+            return
+        await self._async_set_tilt_position(tilt_position)
+
+    async def _async_set_tilt_position(self, tilt_position):
         cur = self.tilt_tc.current_position()
         self._target_tilt_position = tilt_position
         if self._cover_entity_id is not None:
             self._assume_uncertain_position = not self._always_confident
+            self._couple_main_to_tilt(tilt_position)
             self.tilt_tc.start_travel(tilt_position)
             self.start_auto_updater()
             await self._handle_command(SERVICE_SET_COVER_TILT_POSITION, tilt_position=tilt_position)
@@ -454,27 +1259,185 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
             return
         cmd = SERVICE_OPEN_COVER_TILT if tilt_position > cur else SERVICE_CLOSE_COVER_TILT
         self._assume_uncertain_position = not self._always_confident
+        self._couple_main_to_tilt(tilt_position)
         self.tilt_tc.start_travel(tilt_position)
         self.start_auto_updater()
         await self._handle_command(cmd)
         self.tilt_tc.update_position()
         self.async_write_ha_state()
 
+    async def async_move_to(self, **kwargs):
+        """Reach a position and tilt together with the shortest valid command sequence."""
+        arrive_at = kwargs.pop(ATTR_ARRIVE_AT, None)
+        if arrive_at is not None:
+            await self._async_schedule_move(arrive_at, **kwargs)
+            return
+        position = kwargs.get(ATTR_POSITION)
+        tilt = kwargs.get(ATTR_TILT_POSITION)
+        if not self._has_tilt or tilt is None:
+            if position is not None:
+                await self.async_set_cover_position(position)
+            return
+        plan = self._build_plan(position, tilt)
+        if plan is None:
+            _LOGGER.warning("%s: No valid command sequence reaches position %s / tilt %s", self._name, position, tilt)
+            return
+        self._cancel_plan()
+        if not self._duty_permits(plan.motor_time, self.async_move_to, **kwargs):
+            return
+        if plan.steps:
+            self._plan_task = self.hass.async_create_task(self._async_run_plan(plan))
+
+    def _build_plan(self, position: int | None, tilt: int | None) -> MovePlan | None:
+        """Plan the commands move_to/set_cover_position would send from the current state."""
+        profile = self._motion_profile()
+        current = self.tc.current_position()
+        current_tilt = self.tilt_tc.current_position()
+        if self._has_tilt and tilt is not None:
+            return plan_move(profile, current, current_tilt, current if position is None else position, tilt)
+        if position is None:
+            return MovePlan(position=current, tilt=current_tilt)
+        targets = approach_targets(profile, current, position)
+        return simulate_moves(profile, current, current_tilt, [(AXIS_POSITION, target) for target in targets])
+
+    async def async_get_move_plan(self, **kwargs) -> dict[str, Any]:
+        """Return the commands, timing and end state of a move without sending anything.
+
+        The plan starts from the current estimate; a cover that is moving
+        right now is treated as if it were stopped there.
+        """
+        plan = self._build_plan(kwargs.get(ATTR_POSITION), kwargs.get(ATTR_TILT_POSITION))
+        if plan is None:
+            return {"reachable": False}
+        now = self.tc.current_time()
+        limit = self._config.max_run_time
+        wait = self._duty.wait_time(now, plan.motor_time, limit, self._motor_run_end()) if limit else 0
+        # Measured delay from the power sensor if there is one, the configured delay otherwise
+        latency = self._start_latency if self._start_latency is not None else self._command_delay
+        commands = []
+        offset = wait
+        position, tilt = self.tc.current_position(), self.tilt_tc.current_position()
+        for step in plan.steps:
+            if step.axis == AXIS_POSITION:
+                command = SERVICE_OPEN_COVER if step.target > position else SERVICE_CLOSE_COVER
+            elif self._cover_entity_id is not None:
+                command = SERVICE_SET_COVER_TILT_POSITION
+            else:
+                command = SERVICE_OPEN_COVER_TILT if step.target > tilt else SERVICE_CLOSE_COVER_TILT
+            commands.append({
+                "axis": step.axis,
+                "command": command,
+                "target": step.target,
+                "send_stop": step.frames > 1,
+                "start_in": round(offset, 3),
+                "run_time": step.run_time,
+            })
+            offset += step.run_time + latency
+            position, tilt = step.position, step.tilt
+        return {
+            "reachable": True,
+            "rejected": wait > 0 and self._config.duty_mode == DUTY_MODE_REJECT,
+            "queue_wait": round(wait, 3),
+            "start_latency": round(latency, 3),
+            "duration": round(offset - wait, 3),
+            "motor_time": plan.motor_time,
+            "eta": (dt_util.utcnow() + timedelta(seconds=offset)).isoformat(),
+            ATTR_POSITION: plan.position,
+            ATTR_TILT_POSITION: plan.tilt if self._has_tilt else None,
+            "commands": commands,
+        }
+
+    async def _async_schedule_move(self, arrive_at, **kwargs):
+        """Start a move_to at the moment that makes it arrive at ``arrive_at``.
+
+        The start is derived from the planned duration (travel times and start
+        latency). If the duty limit would hold the motor back at that moment,
+        the start is moved earlier by the wait (at the latest to now) so the
+        duty queue can release it on time; a warning is logged only when the
+        arrival still cannot be met. A new scheduled move replaces the
+        previous one; stop commands do not cancel it.
+        """
+        self._cancel_scheduled_move()
+        preview = await self.async_get_move_plan(**kwargs)
+        if not preview["reachable"]:
+            _LOGGER.warning("%s: No valid command sequence reaches position %s / tilt %s",
+                            self._name, kwargs.get(ATTR_POSITION), kwargs.get(ATTR_TILT_POSITION))
+            return
+        delay = (dt_util.as_utc(arrive_at) - dt_util.utcnow()).total_seconds() - preview["duration"]
+        late = -delay
+        limit = self._config.max_run_time
+        if limit and delay > 0:
+            now = self.tc.current_time()
+            run_end = self._motor_run_end()
+            wait = self._duty.wait_time(now + delay, preview["motor_time"], limit, run_end)
+            if wait > 0:
+                # Start early by the wait and check when the duty queue would release the move from there
+                early = max(delay - wait, 0)
+                late = early + self._duty.wait_time(now + early, preview["motor_time"], limit, run_end) - delay
+                delay = early
+        if late > 0:
+            _LOGGER.warning("%s: Move cannot arrive by %s, it will be %.1fs late", self._name, arrive_at, late)
+        if delay <= 0:
+            await self.async_move_to(**kwargs)
+            return
+
+        @callback
+        def _start(_now):
+            self._unsub_scheduled_move = None
+            self.hass.async_create_task(self.async_move_to(**kwargs))
+
+        _LOGGER.debug("%s: Move to arrive at %s starts in %.1fs", self._name, arrive_at, delay)
+        self._unsub_scheduled_move = async_call_later(self.hass, delay, _start)
+
+    def _cancel_scheduled_move(self):
+        if self._unsub_scheduled_move is not None:
+            self._unsub_scheduled_move()
+            self._unsub_scheduled_move = None
+
+    def _cancel_plan(self):
+        if self._plan_task is not None and not self._plan_task.done():
+            self._plan_task.cancel()
+        self._plan_task = None
+
+    async def _async_run_plan(self, plan: MovePlan):
+        """Execute a plan step by step, waiting the precomputed time of each step."""
+        _LOGGER.debug(
+            "%s: Running %d-step plan (%.1fs motor time, %d frames)",
+            self._name, len(plan.steps), plan.motor_time, plan.frames,
+        )
+        poll = TRAVEL_TIME_INTERVAL.total_seconds()
+        for step in plan.steps:
+            if step.axis == AXIS_POSITION:
+                await self._async_set_main_position(step.target)
+            else:
+                await self._async_set_tilt_position(step.target)
+            await asyncio.sleep(step.duration)
+            while self.tc.is_traveling() or self.is_tilting:
+                await asyncio.sleep(poll)
+            reached = self.tc.current_position() if step.axis == AXIS_POSITION else self.tilt_tc.current_position()
+            if reached != step.target:
+                _LOGGER.debug("%s: Plan interrupted at step %s -> %d", self._name, step.axis, step.target)
+                return
+
     async def async_set_known_action(self, **kwargs):
         action = kwargs.get(ATTR_ACTION)
         if action not in ("open", "close", "stop"):
             raise ValueError("action must be one of open, close or stop")
         if action == "stop":
             self.tc.stop()
+            self._end_movement(EVENT_MOVEMENT_STOPPED)
             if self._has_tilt:
                 self.tilt_tc.stop()
+            self._tilt_follows_main = self._main_follows_tilt = False
+            self._stop_updater_if_idle()
             self.async_write_ha_state()
             return
         self._assume_uncertain_position = not self._always_confident
         if action == "open":
-            self.tc.start_travel_up(); self._target_position = 100
+            self.tc.start_travel_up(self._couple_tilt_to_main(True)); self._target_position = 100
         elif action == "close":
-            self.tc.start_travel_down(); self._target_position = 0
+            self.tc.start_travel_down(self._couple_tilt_to_main(False)); self._target_position = 0
+        self._begin_movement()
         self.start_auto_updater()
         self.async_write_ha_state()
 
@@ -494,11 +1457,12 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
             return
         await fn()
 
-    async def auto_stop_if_necessary(self):
+    async def auto_stop_if_necessary(self, tolerance: float = 0):
+        """Stop axes that reached their target; main travel may stop ``tolerance`` seconds early."""
         self._processing_known_position = False
         if self._stopping:
             return
-        main_done = self.tc.position_reached()
+        main_done = self.tc.position_reached(tolerance)
         tilt_done = self._has_tilt and self.tilt_tc.position_reached()
         main_stopped = False
         if main_done:
@@ -507,12 +1471,22 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
             await self._auto_stop_tilt(main_stopped)
         if main_done or tilt_done:
             self.async_write_ha_state()
-        if not self.tc.is_traveling() and not self.is_tilting:
-            self.stop_auto_updater()
+        self._stop_updater_if_idle()
 
     async def _auto_stop_main(self):
         target = self.tc.travel_to_position
-        self.tc.stop()
+        arrival_at = self.tc.arrival_time()
+        if self._perf.enabled:
+            lateness = self.tc.current_time() - self.tc.stop_deadline()
+            self._perf.stop_lateness.add(max(0.0, lateness * 1000))
+        # An anchored segment sends STOP command_delay before arrival, so record the target itself
+        self.tc.set_position(target)
+        self._end_movement(EVENT_MOVEMENT_ARRIVED, arrival_at)
+        self._stop_updater_if_idle()
+        if self._main_follows_tilt:
+            # The blind only moved along with the slats; the tilt stop ends this movement
+            self._main_follows_tilt = False
+            return False
         intermediate = target not in (0, 100)
         if intermediate or self._send_stop_at_ends:
             await self._handle_command(SERVICE_STOP_COVER)
@@ -522,6 +1496,11 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
     async def _auto_stop_tilt(self, main_stop_done: bool):
         target = self.tilt_tc.travel_to_position
         self.tilt_tc.stop()
+        self._stop_updater_if_idle()
+        if self._tilt_follows_main:
+            # Slats turned as the first part of a main move, which keeps running
+            self._tilt_follows_main = False
+            return
         intermediate = target not in (0, 100)
         separate = self._tilt_stop_script_entity_id is not None
         # Send stop command if:
@@ -536,6 +1515,13 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
         self._assume_uncertain_position = not self._always_confident
         self._processing_known_position = False
         entity_id = self._resolve_script_entity(command)
+        if command == SERVICE_STOP_COVER:
+            self._stop_sent_at = self.tc.current_time()
+        if self._service_call is not None:
+            task, called_at = self._service_call
+            self._service_call = None
+            if self._perf.enabled and task is asyncio.current_task():
+                self._perf.dispatch_latency.add((self.tc.current_time() - called_at) * 1000)
 
         # Determine if this is a tilt command
         is_tilt_command = command in [
@@ -556,6 +1542,11 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
         use_wrapper = self._cover_entity_id is not None and (not is_tilt_command or entity_id is None)
         use_script = entity_id is not None and (not use_wrapper or is_tilt_command)
 
+        # Only commands that actually reach the motor count as a duty cycle;
+        # the run ends when the updater stops with the travel
+        if (use_wrapper or use_script) and command not in (SERVICE_STOP_COVER, SERVICE_STOP_COVER_TILT):
+            self._duty.start(self.tc.current_time())
+
         if use_wrapper:
             service_data = {"entity_id": self._cover_entity_id}
             if command == SERVICE_SET_COVER_TILT_POSITION and 'tilt_position' in kwargs:
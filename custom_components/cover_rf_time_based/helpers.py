@@ -1,8 +1,10 @@
 """Helper / factory functions for cover_rf_time_based."""
 from __future__ import annotations
 import logging
+import os
 import voluptuous as vol
 import homeassistant.helpers.config_validation as cv
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.components.cover import PLATFORM_SCHEMA, DEVICE_CLASSES_SCHEMA
 from .const import (
     CONF_DEVICES,
@@ -18,6 +20,7 @@ from .const import (
     CONF_ALWAYS_CONFIDENT,
     CONF_BLOCK_TILT_IF_OPEN,
     CONF_TILT_ONLY_WHEN_CLOSED,
+    CONF_TILT_COUPLED,
     CONF_AVAILABILITY_TEMPLATE,
     CONF_OPEN_SCRIPT_ENTITY_ID,
     CONF_CLOSE_SCRIPT_ENTITY_ID,
@@ -26,6 +29,16 @@ from .const import (
     CONF_TILT_CLOSE_SCRIPT_ENTITY_ID,
     CONF_TILT_STOP_SCRIPT_ENTITY_ID,
     CONF_COMMAND_DELAY,
+    CONF_BACKLASH,
+    CONF_MIN_MOVE_TIME,
+    CONF_MAX_RUN_TIME,
+    CONF_DUTY_WINDOW,
+    CONF_DUTY_MODE,
+    CONF_WRAPPER_POSITION_WEIGHT,
+    CONF_OPEN_SENSOR_ENTITY_ID,
+    CONF_CLOSED_SENSOR_ENTITY_ID,
+    CONF_POWER_SENSOR_ENTITY_ID,
+    CONF_POWER_THRESHOLD,
     DEFAULT_DEVICE_CLASS,
     DEFAULT_TRAVEL_TIME,
     DEFAULT_TILT_TIME,
@@ -33,7 +46,18 @@ from .const import (
     DEFAULT_ALWAYS_CONFIDENT,
     DEFAULT_BLOCK_TILT_IF_OPEN,
     DEFAULT_TILT_ONLY_WHEN_CLOSED,
+    DEFAULT_TILT_COUPLED,
     DEFAULT_COMMAND_DELAY,
+    DEFAULT_BACKLASH,
+    DEFAULT_MIN_MOVE_TIME,
+    DEFAULT_MAX_RUN_TIME,
+    DEFAULT_DUTY_WINDOW,
+    DEFAULT_DUTY_MODE,
+    DEFAULT_WRAPPER_POSITION_WEIGHT,
+    DEFAULT_POWER_THRESHOLD,
+    DUTY_MODE_QUEUE,
+    DUTY_MODE_REJECT,
+    DOMAIN,
 )
 from .models import DeviceConfig, ScriptsConfig, WrapperConfig
 from .entity import CoverTimeBased
@@ -50,11 +74,22 @@ BASE_DEVICE_SCHEMA = vol.Schema({
     vol.Optional(CONF_TILTING_TIME_DOWN, default=DEFAULT_TILT_TIME): vol.Any(cv.positive_int, cv.positive_float),
     vol.Optional(CONF_TILTING_TIME_UP, default=DEFAULT_TILT_TIME): vol.Any(cv.positive_int, cv.positive_float),
     vol.Optional(CONF_COMMAND_DELAY, default=DEFAULT_COMMAND_DELAY): vol.Any(cv.positive_int, cv.positive_float),
+    vol.Optional(CONF_BACKLASH, default=DEFAULT_BACKLASH): vol.Any(cv.positive_int, cv.positive_float),
+    vol.Optional(CONF_MIN_MOVE_TIME, default=DEFAULT_MIN_MOVE_TIME): vol.Any(cv.positive_int, cv.positive_float),
+    vol.Optional(CONF_MAX_RUN_TIME, default=DEFAULT_MAX_RUN_TIME): vol.Any(cv.positive_int, cv.positive_float),
+    vol.Optional(CONF_DUTY_WINDOW, default=DEFAULT_DUTY_WINDOW): vol.All(vol.Coerce(float), vol.Range(min=60)),
+    vol.Optional(CONF_DUTY_MODE, default=DEFAULT_DUTY_MODE): vol.In([DUTY_MODE_QUEUE, DUTY_MODE_REJECT]),
     vol.Optional(CONF_SEND_STOP_AT_ENDS, default=DEFAULT_SEND_STOP_AT_ENDS): cv.boolean,
     vol.Optional(CONF_ALWAYS_CONFIDENT, default=DEFAULT_ALWAYS_CONFIDENT): cv.boolean,
     vol.Optional(CONF_BLOCK_TILT_IF_OPEN, default=DEFAULT_BLOCK_TILT_IF_OPEN): cv.boolean,
     vol.Optional(CONF_TILT_ONLY_WHEN_CLOSED, default=DEFAULT_TILT_ONLY_WHEN_CLOSED): cv.boolean,
+    vol.Optional(CONF_TILT_COUPLED, default=DEFAULT_TILT_COUPLED): cv.boolean,
+    vol.Optional(CONF_WRAPPER_POSITION_WEIGHT, default=DEFAULT_WRAPPER_POSITION_WEIGHT): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
     vol.Optional(CONF_AVAILABILITY_TEMPLATE): cv.template,
+    vol.Optional(CONF_OPEN_SENSOR_ENTITY_ID): cv.entity_id,
+    vol.Optional(CONF_CLOSED_SENSOR_ENTITY_ID): cv.entity_id,
+    vol.Optional(CONF_POWER_SENSOR_ENTITY_ID): cv.entity_id,
+    vol.Optional(CONF_POWER_THRESHOLD, default=DEFAULT_POWER_THRESHOLD): vol.All(vol.Coerce(float), vol.Range(min=0)),
 })
 SCRIPT_DEVICE_SCHEMA = BASE_DEVICE_SCHEMA.extend({
     vol.Optional(CONF_OPEN_SCRIPT_ENTITY_ID): cv.entity_id,
@@ -70,6 +105,141 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({vol.Required(CONF_DEVICES): vol.Schema
 # Duplicate guard
 _REGISTERED_DEVICE_IDS: set[str] = set()
 
+def configs_from_entry_data(hass, config_data, default_name):
+    """Build the device dataclasses from merged config entry data/options."""
+    availability_template = None
+    if config_data.get(CONF_AVAILABILITY_TEMPLATE):
+        try:
+            from homeassistant.helpers.template import Template
+            availability_template = Template(config_data[CONF_AVAILABILITY_TEMPLATE], hass)
+        except Exception as ex:
+            _LOGGER.warning("Failed to parse availability_template for %s: %s", default_name, ex)
+
+    base = DeviceConfig(
+        name=config_data.get(CONF_NAME, default_name),
+        device_class=config_data.get(CONF_DEVICE_CLASS, DEFAULT_DEVICE_CLASS),
+        travel_time_down=config_data.get(CONF_TRAVELLING_TIME_DOWN, DEFAULT_TRAVEL_TIME),
+        travel_time_up=config_data.get(CONF_TRAVELLING_TIME_UP, DEFAULT_TRAVEL_TIME),
+        tilting_time_down=config_data.get(CONF_TILTING_TIME_DOWN, DEFAULT_TILT_TIME),
+        tilting_time_up=config_data.get(CONF_TILTING_TIME_UP, DEFAULT_TILT_TIME),
+        send_stop_at_ends=config_data.get(CONF_SEND_STOP_AT_ENDS, DEFAULT_SEND_STOP_AT_ENDS),
+        always_confident=config_data.get(CONF_ALWAYS_CONFIDENT, DEFAULT_ALWAYS_CONFIDENT),
+        block_tilt_if_open=config_data.get(CONF_BLOCK_TILT_IF_OPEN, DEFAULT_BLOCK_TILT_IF_OPEN),
+        tilt_only_when_closed=config_data.get(CONF_TILT_ONLY_WHEN_CLOSED, DEFAULT_TILT_ONLY_WHEN_CLOSED),
+        tilt_coupled=config_data.get(CONF_TILT_COUPLED, DEFAULT_TILT_COUPLED),
+        availability_template=availability_template,
+        command_delay=config_data.get(CONF_COMMAND_DELAY, DEFAULT_COMMAND_DELAY),
+        backlash=config_data.get(CONF_BACKLASH, DEFAULT_BACKLASH),
+        min_move_time=config_data.get(CONF_MIN_MOVE_TIME, DEFAULT_MIN_MOVE_TIME),
+        max_run_time=config_data.get(CONF_MAX_RUN_TIME, DEFAULT_MAX_RUN_TIME),
+        duty_window=config_data.get(CONF_DUTY_WINDOW, DEFAULT_DUTY_WINDOW),
+        duty_mode=config_data.get(CONF_DUTY_MODE, DEFAULT_DUTY_MODE),
+        wrapper_position_weight=config_data.get(CONF_WRAPPER_POSITION_WEIGHT, DEFAULT_WRAPPER_POSITION_WEIGHT),
+        open_sensor=config_data.get(CONF_OPEN_SENSOR_ENTITY_ID),
+        closed_sensor=config_data.get(CONF_CLOSED_SENSOR_ENTITY_ID),
+        power_sensor=config_data.get(CONF_POWER_SENSOR_ENTITY_ID),
+        power_threshold=config_data.get(CONF_POWER_THRESHOLD, DEFAULT_POWER_THRESHOLD),
+    )
+    scripts = ScriptsConfig(
+        open_script=config_data.get(CONF_OPEN_SCRIPT_ENTITY_ID),
+        close_script=config_data.get(CONF_CLOSE_SCRIPT_ENTITY_ID),
+        stop_script=config_data.get(CONF_STOP_SCRIPT_ENTITY_ID),
+        tilt_open_script=config_data.get(CONF_TILT_OPEN_SCRIPT_ENTITY_ID),
+        tilt_close_script=config_data.get(CONF_TILT_CLOSE_SCRIPT_ENTITY_ID),
+        tilt_stop_script=config_data.get(CONF_TILT_STOP_SCRIPT_ENTITY_ID),
+    )
+    wrapper = WrapperConfig(cover_entity_id=config_data.get(CONF_COVER_ENTITY_ID))
+    return base, scripts, wrapper
+
+def ui_data_from_configs(config: DeviceConfig, scripts: ScriptsConfig, wrapper: WrapperConfig) -> dict:
+    """Inverse of configs_from_entry_data: build UI entry data from the dataclasses."""
+    template = config.availability_template
+    data = {
+        "mode": "wrapper" if wrapper.cover_entity_id else "script",
+        CONF_NAME: config.name,
+        CONF_DEVICE_CLASS: config.device_class,
+        CONF_TRAVELLING_TIME_DOWN: config.travel_time_down,
+        CONF_TRAVELLING_TIME_UP: config.travel_time_up,
+        CONF_TILTING_TIME_DOWN: config.tilting_time_down,
+        CONF_TILTING_TIME_UP: config.tilting_time_up,
+        CONF_COMMAND_DELAY: config.command_delay,
+        CONF_BACKLASH: config.backlash,
+        CONF_MIN_MOVE_TIME: config.min_move_time,
+        CONF_MAX_RUN_TIME: config.max_run_time,
+        CONF_DUTY_WINDOW: config.duty_window,
+        CONF_DUTY_MODE: config.duty_mode,
+        CONF_WRAPPER_POSITION_WEIGHT: config.wrapper_position_weight,
+        CONF_SEND_STOP_AT_ENDS: config.send_stop_at_ends,
+        CONF_ALWAYS_CONFIDENT: config.always_confident,
+        CONF_BLOCK_TILT_IF_OPEN: config.block_tilt_if_open,
+        CONF_TILT_ONLY_WHEN_CLOSED: config.tilt_only_when_closed,
+        CONF_TILT_COUPLED: config.tilt_coupled,
+        CONF_AVAILABILITY_TEMPLATE: getattr(template, "template", template),
+        CONF_OPEN_SENSOR_ENTITY_ID: config.open_sensor,
+        CONF_CLOSED_SENSOR_ENTITY_ID: config.closed_sensor,
+        CONF_POWER_SENSOR_ENTITY_ID: config.power_sensor,
+        CONF_POWER_THRESHOLD: config.power_threshold,
+        CONF_COVER_ENTITY_ID: wrapper.cover_entity_id,
+        CONF_OPEN_SCRIPT_ENTITY_ID: scripts.open_script,
+        CONF_CLOSE_SCRIPT_ENTITY_ID: scripts.close_script,
+        CONF_STOP_SCRIPT_ENTITY_ID: scripts.stop_script,
+        CONF_TILT_OPEN_SCRIPT_ENTITY_ID: scripts.tilt_open_script,
+        CONF_TILT_CLOSE_SCRIPT_ENTITY_ID: scripts.tilt_close_script,
+        CONF_TILT_STOP_SCRIPT_ENTITY_ID: scripts.tilt_stop_script,
+    }
+    return {key: value for key, value in data.items() if value not in (None, "")}
+
+def apply_device_config(hass, device_id, config_data, title):
+    """Push config into a live entity; return False if a reload is needed instead."""
+    entity = hass.data.get(DOMAIN, {}).get("entities", {}).get(device_id)
+    if entity is None:
+        return False
+
+    device_config, scripts_config, wrapper_config = configs_from_entry_data(
+        hass, config_data, title
+    )
+    if entity.requires_reload(scripts_config, wrapper_config):
+        return False
+
+    if entity.config_changed(device_config, scripts_config, wrapper_config):
+        entity.async_apply_config(device_config, scripts_config, wrapper_config)
+    return True
+
+def skip_update_listener(hass, entry_id):
+    """Make the next update listener run of an entry return early.
+
+    For callers that already applied the change to the live entities and
+    only persist it afterwards; a batch then costs one pass instead of one
+    full hub pass per stored device.
+    """
+    pending = hass.data.setdefault(DOMAIN, {}).setdefault("skipped_updates", {})
+    pending[entry_id] = pending.get(entry_id, 0) + 1
+
+def consume_skipped_update(hass, entry_id) -> bool:
+    """Return True (once per skip_update_listener call) if this listener run is to be skipped."""
+    pending = hass.data.get(DOMAIN, {}).get("skipped_updates", {})
+    if not pending.get(entry_id):
+        return False
+    pending[entry_id] -= 1
+    if not pending[entry_id]:
+        del pending[entry_id]
+    return True
+
+def _config_dir_path(config_dir, filename):
+    config_dir = os.path.realpath(config_dir)
+    path = os.path.realpath(os.path.join(config_dir, filename))
+    if path == config_dir or os.path.commonpath((config_dir, path)) != config_dir:
+        raise HomeAssistantError(f"{filename} is not a file inside the config directory")
+    return path
+
+async def async_config_dir_path(hass, filename):
+    """Resolve a service-supplied file name, refusing anything outside the config directory.
+
+    Absolute paths, ``..`` segments and symlinks are resolved first, so none
+    of them can reach a file elsewhere on the host.
+    """
+    return await hass.async_add_executor_job(_config_dir_path, hass.config.config_dir, filename)
+
 def devices_from_config(domain_config):
     devices = []
     raw_devices = domain_config.get(CONF_DEVICES, {})
@@ -89,8 +259,19 @@ def devices_from_config(domain_config):
             always_confident=c.get(CONF_ALWAYS_CONFIDENT, DEFAULT_ALWAYS_CONFIDENT),
             block_tilt_if_open=c.get(CONF_BLOCK_TILT_IF_OPEN, DEFAULT_BLOCK_TILT_IF_OPEN),
             tilt_only_when_closed=c.get(CONF_TILT_ONLY_WHEN_CLOSED, DEFAULT_TILT_ONLY_WHEN_CLOSED),
+            tilt_coupled=c.get(CONF_TILT_COUPLED, DEFAULT_TILT_COUPLED),
             availability_template=c.get(CONF_AVAILABILITY_TEMPLATE),
             command_delay=c.get(CONF_COMMAND_DELAY, DEFAULT_COMMAND_DELAY),
+            backlash=c.get(CONF_BACKLASH, DEFAULT_BACKLASH),
+            min_move_time=c.get(CONF_MIN_MOVE_TIME, DEFAULT_MIN_MOVE_TIME),
+            max_run_time=c.get(CONF_MAX_RUN_TIME, DEFAULT_MAX_RUN_TIME),
+            duty_window=c.get(CONF_DUTY_WINDOW, DEFAULT_DUTY_WINDOW),
+            duty_mode=c.get(CONF_DUTY_MODE, DEFAULT_DUTY_MODE),
+            wrapper_position_weight=c.get(CONF_WRAPPER_POSITION_WEIGHT, DEFAULT_WRAPPER_POSITION_WEIGHT),
+            open_sensor=c.get(CONF_OPEN_SENSOR_ENTITY_ID),
+            closed_sensor=c.get(CONF_CLOSED_SENSOR_ENTITY_ID),
+            power_sensor=c.get(CONF_POWER_SENSOR_ENTITY_ID),
+            power_threshold=c.get(CONF_POWER_THRESHOLD, DEFAULT_POWER_THRESHOLD),
         )
         scripts = ScriptsConfig(
             open_script=c.get(CONF_OPEN_SCRIPT_ENTITY_ID),
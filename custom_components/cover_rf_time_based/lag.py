@@ -0,0 +1,58 @@
+"""Event loop lag tracking for Cover RF Time Based."""
+from __future__ import annotations
+
+# Weight of the newest sample in the running lag estimates
+LAG_SMOOTHING = 0.2
+# STOP is never dispatched earlier than this ahead of its deadline (seconds)
+MAX_LAG_COMPENSATION = 0.5
+# Lag above this is logged as a warning (seconds), at most once per LAG_WARNING_INTERVAL
+LAG_WARNING_BUDGET = 0.25
+LAG_WARNING_INTERVAL = 300
+
+
+class LoopLag:
+    """Running estimates of how late updater ticks and deadline timers fire."""
+
+    __slots__ = ("tick_lag", "deadline_lag", "_last_tick", "_last_warning")
+
+    def __init__(self):
+        self.tick_lag = 0.0
+        self.deadline_lag = 0.0
+        self._last_tick = None
+        self._last_warning = None
+
+    def reset_ticks(self) -> None:
+        """Forget the previous tick (the updater was restarted)."""
+        self._last_tick = None
+
+    def tick(self, now: float, interval: float) -> float:
+        """Record an updater tick and return how late it fired.
+
+        The interval timer is re-armed from each firing, so the lag of a tick
+        is the gap to the previous one minus the interval.
+        """
+        lag = 0.0
+        if self._last_tick is not None:
+            lag = max(0.0, now - self._last_tick - interval)
+            self.tick_lag += LAG_SMOOTHING * (lag - self.tick_lag)
+        self._last_tick = now
+        return lag
+
+    def deadline(self, scheduled: float, fired: float) -> float:
+        """Record a deadline timer and return how late it fired."""
+        lag = max(0.0, fired - scheduled)
+        self.deadline_lag += LAG_SMOOTHING * (lag - self.deadline_lag)
+        return lag
+
+    @property
+    def compensation(self) -> float:
+        """How much earlier to arm a deadline timer to make up for the expected lag."""
+        return min(self.deadline_lag, MAX_LAG_COMPENSATION)
+
+    def should_warn(self, lag: float, now: float) -> bool:
+        if lag <= LAG_WARNING_BUDGET:
+            return False
+        if self._last_warning is not None and now - self._last_warning < LAG_WARNING_INTERVAL:
+            return False
+        self._last_warning = now
+        return True
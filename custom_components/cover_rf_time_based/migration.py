@@ -1,14 +1,20 @@
 """Migration helpers for Cover RF Time Based integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.template import Template
 
 from .const import (
     DOMAIN,
+    CONF_ENTRY_TYPE,
+    ENTRY_TYPE_HUB,
+    SUBENTRY_TYPE_DEVICE,
     CONF_NAME,
     CONF_DEVICE_CLASS,
     CONF_COVER_ENTITY_ID,
@@ -20,6 +26,7 @@ from .const import (
     CONF_ALWAYS_CONFIDENT,
     CONF_BLOCK_TILT_IF_OPEN,
     CONF_TILT_ONLY_WHEN_CLOSED,
+    CONF_TILT_COUPLED,
     CONF_OPEN_SCRIPT_ENTITY_ID,
     CONF_CLOSE_SCRIPT_ENTITY_ID,
     CONF_STOP_SCRIPT_ENTITY_ID,
@@ -27,6 +34,16 @@ from .const import (
     CONF_TILT_CLOSE_SCRIPT_ENTITY_ID,
     CONF_TILT_STOP_SCRIPT_ENTITY_ID,
     CONF_COMMAND_DELAY,
+    CONF_BACKLASH,
+    CONF_MIN_MOVE_TIME,
+    CONF_MAX_RUN_TIME,
+    CONF_DUTY_WINDOW,
+    CONF_DUTY_MODE,
+    CONF_WRAPPER_POSITION_WEIGHT,
+    CONF_OPEN_SENSOR_ENTITY_ID,
+    CONF_CLOSED_SENSOR_ENTITY_ID,
+    CONF_POWER_SENSOR_ENTITY_ID,
+    CONF_POWER_THRESHOLD,
     CONF_AVAILABILITY_TEMPLATE,
     DEFAULT_DEVICE_CLASS,
     DEFAULT_TRAVEL_TIME,
@@ -35,7 +52,14 @@ from .const import (
     DEFAULT_ALWAYS_CONFIDENT,
     DEFAULT_BLOCK_TILT_IF_OPEN,
     DEFAULT_TILT_ONLY_WHEN_CLOSED,
+    DEFAULT_TILT_COUPLED,
     DEFAULT_COMMAND_DELAY,
+    DEFAULT_BACKLASH,
+    DEFAULT_MIN_MOVE_TIME,
+    DEFAULT_MAX_RUN_TIME,
+    DEFAULT_DUTY_WINDOW,
+    DEFAULT_DUTY_MODE,
+    DEFAULT_WRAPPER_POSITION_WEIGHT,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -43,6 +67,25 @@ _LOGGER = logging.getLogger(__name__)
 MODE_SCRIPT = "script"
 MODE_WRAPPER = "wrapper"
 
+DEFAULT_MIGRATION_CONCURRENCY = 8
+
+STATUS_MIGRATED = "migrated"
+STATUS_WOULD_CREATE = "would_create"
+STATUS_ALREADY_CONFIGURED = "already_configured"
+STATUS_INVALID = "invalid"
+STATUS_FAILED = "failed"
+
+
+@dataclass(slots=True)
+class DeviceMigrationResult:
+    device_id: str
+    name: str
+    status: str
+    mode: Optional[str] = None
+    duration_ms: float = 0.0
+    changes: dict[str, list[Any]] = field(default_factory=dict)
+    error: Optional[str] = None
+
 
 async def async_migrate_yaml_to_ui(hass: HomeAssistant, yaml_config: dict[str, Any]) -> bool:
     """Migrate YAML configuration to UI config entries.
@@ -58,31 +101,136 @@ async def async_migrate_yaml_to_ui(hass: HomeAssistant, yaml_config: dict[str, A
         _LOGGER.warning("No devices found in YAML config")
         return False
 
-    devices = yaml_config["devices"]
-    _LOGGER.info("Starting migration of %d devices from YAML to UI", len(devices))
+    results = await async_migrate_yaml_devices(hass, [yaml_config])
+    return any(result.status == STATUS_MIGRATED for result in results)
 
-    migrated_count = 0
 
-    for device_id, device_config in devices.items():
-        try:
-            # Convert YAML config to UI config format
-            ui_config = await _convert_yaml_device_to_ui(hass, device_id, device_config)
+async def async_migrate_yaml_devices(
+    hass: HomeAssistant,
+    yaml_configs: list[dict[str, Any]],
+    dry_run: bool = False,
+    max_concurrency: int = DEFAULT_MIGRATION_CONCURRENCY,
+) -> list[DeviceMigrationResult]:
+    """Convert and import YAML devices concurrently, returning one result per device.
 
-            if ui_config:
-                # Trigger import flow for this device
-                await hass.config_entries.flow.async_init(
-                    DOMAIN,
-                    context={"source": "import"},
-                    data={"device_config": ui_config},
-                )
-                migrated_count += 1
-                _LOGGER.info("Successfully queued migration for device: %s", device_config.get(CONF_NAME, device_id))
+    At most ``max_concurrency`` devices are converted/imported at the same
+    time. With ``dry_run`` nothing is imported; each result instead reports
+    what would happen and, for covers that already exist, which fields differ.
 
-        except Exception as ex:
-            _LOGGER.error("Failed to migrate device %s: %s", device_id, ex, exc_info=True)
+    Args:
+        hass: Home Assistant instance
+        yaml_configs: Platform configurations from YAML
+        dry_run: Only report, do not create config entries
+        max_concurrency: Upper bound on devices processed in parallel
 
-    _LOGGER.info("Migration complete: %d/%d devices queued for migration", migrated_count, len(devices))
-    return migrated_count > 0
+    Returns:
+        Per-device results in YAML order
+    """
+    devices = [
+        (device_id, device_config)
+        for yaml_config in yaml_configs
+        for device_id, device_config in yaml_config.get("devices", {}).items()
+    ]
+    _LOGGER.info(
+        "Starting %smigration of %d devices from YAML to UI",
+        "dry-run " if dry_run else "", len(devices),
+    )
+
+    existing = existing_devices_by_name(hass)
+    seen_names: set[str] = set()
+    duplicates: set[str] = set()
+    for device_id, device_config in devices:
+        name = device_config.get(CONF_NAME, device_id)
+        if name in seen_names:
+            duplicates.add(device_id)
+        seen_names.add(name)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _migrate_one(device_id: str, device_config: dict[str, Any]) -> DeviceMigrationResult:
+        if device_id in duplicates:
+            # Only the first YAML device with a given name is imported
+            return DeviceMigrationResult(
+                device_id, device_config.get(CONF_NAME, device_id), STATUS_INVALID,
+                error="name already used by another YAML device",
+            )
+        async with semaphore:
+            started = time.monotonic()
+            result = await _async_migrate_device(hass, device_id, device_config, existing, dry_run)
+            result.duration_ms = round((time.monotonic() - started) * 1000, 2)
+            return result
+
+    results = await asyncio.gather(
+        *(_migrate_one(device_id, device_config) for device_id, device_config in devices)
+    )
+
+    migrated = sum(1 for result in results if result.status in (STATUS_MIGRATED, STATUS_WOULD_CREATE))
+    _LOGGER.info(
+        "Migration %scomplete: %d/%d devices %s",
+        "dry-run " if dry_run else "", migrated, len(devices),
+        "would be created" if dry_run else "migrated",
+    )
+    return list(results)
+
+
+def existing_devices_by_name(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    """Configuration of every UI cover by name, standalone entries and hub subentries alike."""
+    existing: dict[str, dict[str, Any]] = {}
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HUB:
+            for subentry in entry.subentries.values():
+                if subentry.subentry_type != SUBENTRY_TYPE_DEVICE:
+                    continue
+                name = subentry.data.get(CONF_NAME) or subentry.title
+                existing.setdefault(name, dict(subentry.data))
+        elif entry.data.get(CONF_NAME):
+            existing.setdefault(entry.data[CONF_NAME], {**entry.data, **entry.options})
+    return existing
+
+
+async def _async_migrate_device(
+    hass: HomeAssistant,
+    device_id: str,
+    device_config: dict[str, Any],
+    existing: dict[str, dict[str, Any]],
+    dry_run: bool,
+) -> DeviceMigrationResult:
+    """Convert one YAML device and import it (or describe the import in dry-run)."""
+    name = device_config.get(CONF_NAME, device_id)
+    ui_config = await _convert_yaml_device_to_ui(hass, device_id, device_config)
+    if not ui_config:
+        return DeviceMigrationResult(device_id, name, STATUS_INVALID,
+                                     error="neither cover entity nor scripts configured")
+
+    mode = ui_config["mode"]
+    current = existing.get(ui_config[CONF_NAME])
+    if current is not None:
+        changes = {
+            key: [current.get(key), value]
+            for key, value in ui_config.items()
+            if current.get(key) != value
+        }
+        return DeviceMigrationResult(device_id, name, STATUS_ALREADY_CONFIGURED, mode, changes=changes)
+
+    if dry_run:
+        changes = {key: [None, value] for key, value in ui_config.items()}
+        return DeviceMigrationResult(device_id, name, STATUS_WOULD_CREATE, mode, changes=changes)
+
+    try:
+        flow_result = await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": "import"},
+            data={"device_config": ui_config},
+        )
+    except Exception as ex:
+        _LOGGER.error("Failed to migrate device %s: %s", device_id, ex, exc_info=True)
+        return DeviceMigrationResult(device_id, name, STATUS_FAILED, mode, error=str(ex))
+
+    if flow_result.get("type") == "abort":
+        return DeviceMigrationResult(device_id, name, STATUS_ALREADY_CONFIGURED, mode,
+                                     error=flow_result.get("reason"))
+
+    _LOGGER.info("Successfully migrated device: %s", name)
+    return DeviceMigrationResult(device_id, name, STATUS_MIGRATED, mode)
 
 
 async def _convert_yaml_device_to_ui(
@@ -129,15 +277,24 @@ async def _convert_yaml_device_to_ui(
             CONF_TILTING_TIME_DOWN: yaml_config.get(CONF_TILTING_TIME_DOWN, DEFAULT_TILT_TIME),
             CONF_TILTING_TIME_UP: yaml_config.get(CONF_TILTING_TIME_UP, DEFAULT_TILT_TIME),
             CONF_COMMAND_DELAY: yaml_config.get(CONF_COMMAND_DELAY, DEFAULT_COMMAND_DELAY),
+            CONF_BACKLASH: yaml_config.get(CONF_BACKLASH, DEFAULT_BACKLASH),
+            CONF_MIN_MOVE_TIME: yaml_config.get(CONF_MIN_MOVE_TIME, DEFAULT_MIN_MOVE_TIME),
+            CONF_MAX_RUN_TIME: yaml_config.get(CONF_MAX_RUN_TIME, DEFAULT_MAX_RUN_TIME),
+            CONF_DUTY_WINDOW: yaml_config.get(CONF_DUTY_WINDOW, DEFAULT_DUTY_WINDOW),
+            CONF_DUTY_MODE: yaml_config.get(CONF_DUTY_MODE, DEFAULT_DUTY_MODE),
             CONF_SEND_STOP_AT_ENDS: yaml_config.get(CONF_SEND_STOP_AT_ENDS, DEFAULT_SEND_STOP_AT_ENDS),
             CONF_ALWAYS_CONFIDENT: yaml_config.get(CONF_ALWAYS_CONFIDENT, DEFAULT_ALWAYS_CONFIDENT),
             CONF_BLOCK_TILT_IF_OPEN: yaml_config.get(CONF_BLOCK_TILT_IF_OPEN, DEFAULT_BLOCK_TILT_IF_OPEN),
             CONF_TILT_ONLY_WHEN_CLOSED: yaml_config.get(CONF_TILT_ONLY_WHEN_CLOSED, DEFAULT_TILT_ONLY_WHEN_CLOSED),
+            CONF_TILT_COUPLED: yaml_config.get(CONF_TILT_COUPLED, DEFAULT_TILT_COUPLED),
         }
 
         # Add mode-specific fields
         if mode == MODE_WRAPPER:
             ui_config[CONF_COVER_ENTITY_ID] = yaml_config[CONF_COVER_ENTITY_ID]
+            ui_config[CONF_WRAPPER_POSITION_WEIGHT] = yaml_config.get(
+                CONF_WRAPPER_POSITION_WEIGHT, DEFAULT_WRAPPER_POSITION_WEIGHT
+            )
         else:  # MODE_SCRIPT
             ui_config[CONF_OPEN_SCRIPT_ENTITY_ID] = yaml_config.get(CONF_OPEN_SCRIPT_ENTITY_ID)
             ui_config[CONF_CLOSE_SCRIPT_ENTITY_ID] = yaml_config.get(CONF_CLOSE_SCRIPT_ENTITY_ID)
@@ -151,6 +308,17 @@ async def _convert_yaml_device_to_ui(
         if CONF_TILT_STOP_SCRIPT_ENTITY_ID in yaml_config:
             ui_config[CONF_TILT_STOP_SCRIPT_ENTITY_ID] = yaml_config[CONF_TILT_STOP_SCRIPT_ENTITY_ID]
 
+        # Add optional end-stop sensors (available in both modes)
+        for key in (CONF_OPEN_SENSOR_ENTITY_ID, CONF_CLOSED_SENSOR_ENTITY_ID):
+            if yaml_config.get(key):
+                ui_config[key] = yaml_config[key]
+
+        # Add optional power-meter motion detection
+        if yaml_config.get(CONF_POWER_SENSOR_ENTITY_ID):
+            ui_config[CONF_POWER_SENSOR_ENTITY_ID] = yaml_config[CONF_POWER_SENSOR_ENTITY_ID]
+            if CONF_POWER_THRESHOLD in yaml_config:
+                ui_config[CONF_POWER_THRESHOLD] = yaml_config[CONF_POWER_THRESHOLD]
+
         # Handle availability template
         if CONF_AVAILABILITY_TEMPLATE in yaml_config:
             template = yaml_config[CONF_AVAILABILITY_TEMPLATE]
@@ -16,6 +16,17 @@ class DeviceConfig:
     tilt_only_when_closed: bool
     availability_template: Optional[Any]
     command_delay: float
+    wrapper_position_weight: float = 0.0
+    open_sensor: Optional[str] = None
+    closed_sensor: Optional[str] = None
+    power_sensor: Optional[str] = None
+    power_threshold: float = 5.0
+    tilt_coupled: bool = False
+    backlash: float = 0.0
+    min_move_time: float = 0.0
+    max_run_time: float = 0.0
+    duty_window: float = 900.0
+    duty_mode: str = 'queue'
 
 @dataclass(slots=True)
 class ScriptsConfig:
@@ -30,3 +41,11 @@ class ScriptsConfig:
 class WrapperConfig:
     cover_entity_id: Optional[str]
 
+@dataclass(slots=True)
+class Movement:
+    """A commanded main travel, tracked from its start until it arrives or stops."""
+    start_position: int
+    target_position: int
+    started_at: float
+    planned_duration: float
+    trace_seq: int = -1
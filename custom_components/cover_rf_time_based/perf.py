@@ -0,0 +1,148 @@
+"""Runtime performance counters for Cover RF Time Based.
+
+Counters are preallocated per device and only updated while a performance
+sensor (per device or the integration-wide aggregate) is enabled. The
+counter classes have no Home Assistant imports, so tests and benchmarks
+load this module on its own.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+# Histogram bucket upper bounds (milliseconds); the last bucket collects everything above
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+# State writes are counted in WRITE_BUCKETS slots of WRITE_BUCKET_SECONDS each (one minute)
+WRITE_BUCKETS = 6
+WRITE_BUCKET_SECONDS = 10
+
+
+class Histogram:
+    """Fixed-bucket latency histogram."""
+
+    __slots__ = ("counts", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.total = 0
+        self.max = 0.0
+
+    def add(self, value_ms: float) -> None:
+        self.counts[bisect_left(HISTOGRAM_BOUNDS_MS, value_ms)] += 1
+        self.total += 1
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def merge(self, other: Histogram) -> None:
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Upper bound of the bucket holding the given fraction of samples (None if empty)."""
+        if not self.total:
+            return None
+        rank = fraction * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return HISTOGRAM_BOUNDS_MS[index] if index < len(HISTOGRAM_BOUNDS_MS) else round(self.max, 1)
+        return round(self.max, 1)
+
+
+class PerfCounters:
+    """Performance counters of one cover."""
+
+    __slots__ = (
+        "enabled",
+        "subscribers",
+        "ticks",
+        "leaked_updaters",
+        "dispatch_latency",
+        "stop_lateness",
+        "_write_counts",
+        "_write_epochs",
+    )
+
+    def __init__(self):
+        self.enabled = False
+        self.subscribers = 0
+        self.ticks = 0
+        self.leaked_updaters = 0
+        self.dispatch_latency = Histogram()
+        self.stop_lateness = Histogram()
+        self._write_counts = [0] * WRITE_BUCKETS
+        self._write_epochs = [-1] * WRITE_BUCKETS
+
+    def merge(self, other: PerfCounters) -> None:
+        """Add the counts of another device (aggregate sensors)."""
+        self.ticks += other.ticks
+        self.leaked_updaters += other.leaked_updaters
+        self.dispatch_latency.merge(other.dispatch_latency)
+        self.stop_lateness.merge(other.stop_lateness)
+        for index, epoch in enumerate(other._write_epochs):
+            if epoch > self._write_epochs[index]:
+                self._write_epochs[index] = epoch
+                self._write_counts[index] = other._write_counts[index]
+            elif epoch == self._write_epochs[index]:
+                self._write_counts[index] += other._write_counts[index]
+
+    def state_written(self, now: float) -> None:
+        epoch = int(now // WRITE_BUCKET_SECONDS)
+        index = epoch % WRITE_BUCKETS
+        if self._write_epochs[index] != epoch:
+            self._write_epochs[index] = epoch
+            self._write_counts[index] = 0
+        self._write_counts[index] += 1
+
+    def writes_per_minute(self, now: float) -> int:
+        epoch = int(now // WRITE_BUCKET_SECONDS)
+        return sum(
+            count
+            for count, bucket_epoch in zip(self._write_counts, self._write_epochs)
+            if 0 <= epoch - bucket_epoch < WRITE_BUCKETS
+        )
+
+
+def _domain_data(hass: HomeAssistant) -> dict:
+    # const imports Home Assistant, so it is only imported once a hass is at hand
+    from .const import DOMAIN
+    return hass.data.setdefault(DOMAIN, {})
+
+
+def perf_counters(hass: HomeAssistant, device_id: str) -> PerfCounters:
+    """Return the shared counters of a device, creating them on first use."""
+    domain_data = _domain_data(hass)
+    registry = domain_data.setdefault("perf", {})
+    counters = registry.get(device_id)
+    if counters is None:
+        counters = registry[device_id] = PerfCounters()
+        counters.enabled = domain_data.get("perf_aggregate_subscribers", 0) > 0
+    return counters
+
+
+def retire_perf_counters(hass: HomeAssistant, device_id: str) -> None:
+    """Drop the counters of an unloaded device, keeping its totals for the aggregate sensors."""
+    domain_data = _domain_data(hass)
+    counters = domain_data.get("perf", {}).pop(device_id, None)
+    if counters is None:
+        return
+    retired = domain_data.setdefault("perf_retired", PerfCounters())
+    retired.ticks += counters.ticks
+    retired.leaked_updaters += counters.leaked_updaters
+
+
+def all_perf_counters(hass: HomeAssistant) -> Iterable[PerfCounters]:
+    return _domain_data(hass).get("perf", {}).values()
+
+
+def refresh_perf_enabled(hass: HomeAssistant) -> None:
+    """Enable collection for every device with a subscribed sensor, or all with the aggregate."""
+    aggregate = _domain_data(hass).get("perf_aggregate_subscribers", 0) > 0
+    for counters in all_perf_counters(hass):
+        counters.enabled = aggregate or counters.subscribers > 0
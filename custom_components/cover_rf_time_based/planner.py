@@ -0,0 +1,206 @@
+"""Planning of combined position + tilt moves for Cover RF Time Based."""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Optional
+
+AXIS_POSITION = "position"
+AXIS_TILT = "tilt"
+
+# Final position/tilt may differ this much from the target (integer model rounding)
+PLAN_TOLERANCE = 1
+
+
+@dataclass(slots=True)
+class MotionProfile:
+    """Snapshot of the timing and tilt rules a plan is computed against."""
+    travel_time_down: float
+    travel_time_up: float
+    tilting_time_down: float
+    tilting_time_up: float
+    command_delay: float
+    send_stop_at_ends: bool
+    tilt_only_when_closed: bool
+    tilt_coupled: bool
+    backlash: float = 0
+    min_move_time: float = 0
+
+
+@dataclass(slots=True)
+class MoveStep:
+    """One command of a plan: move a single axis to a target."""
+    axis: str
+    target: int
+    run_time: float
+    duration: float
+    frames: int
+    position: int
+    tilt: int
+
+
+@dataclass(slots=True)
+class MovePlan:
+    """Sequence of steps reaching a (position, tilt) pair."""
+    steps: list[MoveStep] = field(default_factory=list)
+    position: int = 0
+    tilt: int = 0
+
+    @property
+    def duration(self) -> float:
+        """Seconds from the first command until the last step arrives."""
+        return round(sum(step.duration for step in self.steps), 3)
+
+    @property
+    def motor_time(self) -> float:
+        return round(sum(step.run_time for step in self.steps), 3)
+
+    @property
+    def frames(self) -> int:
+        return sum(step.frames for step in self.steps)
+
+
+def tilt_shift(profile: MotionProfile, tilt_from: int, tilt_to: int) -> int:
+    """Main position change caused by tilting when tilt and position are coupled."""
+    if not profile.tilt_coupled or tilt_from == tilt_to:
+        return 0
+    up = tilt_to > tilt_from
+    tilt_time = (profile.tilting_time_up if up else profile.tilting_time_down) * abs(tilt_to - tilt_from) / 100
+    shift = round(tilt_time / (profile.travel_time_up if up else profile.travel_time_down) * 100)
+    return shift if up else -shift
+
+
+def tilt_range(profile: MotionProfile) -> int:
+    """Highest position at which tilting is still allowed with tilt_only_when_closed."""
+    return tilt_shift(profile, 0, 100)
+
+
+def _stop_frames(profile: MotionProfile, target: int) -> int:
+    return 1 if target not in (0, 100) or profile.send_stop_at_ends else 0
+
+
+def simulate_moves(
+    profile: MotionProfile,
+    position: int,
+    tilt: int,
+    moves: list[tuple[str, int]],
+) -> Optional[MovePlan]:
+    """Apply moves to the model; None if a move is not allowed or out of range."""
+    plan = MovePlan()
+    last_up = None
+    for axis, target in moves:
+        if not 0 <= target <= 100:
+            return None
+        if axis == AXIS_POSITION:
+            if target == position:
+                continue
+            up = target > position
+            duration = (profile.travel_time_up if up else profile.travel_time_down) * abs(target - position) / 100
+            if last_up is not None and last_up != up:
+                duration += profile.backlash
+            last_up = up
+            if profile.tilt_coupled:
+                # Slats are turned to their end before the blind moves
+                tilt_end = 100 if up else 0
+                duration += (profile.tilting_time_up if up else profile.tilting_time_down) * abs(tilt_end - tilt) / 100
+                tilt = tilt_end
+            position = target
+        else:
+            if target == tilt:
+                continue
+            if profile.tilt_only_when_closed and position > tilt_range(profile):
+                return None
+            up = target > tilt
+            duration = (profile.tilting_time_up if up else profile.tilting_time_down) * abs(target - tilt) / 100
+            position = min(max(position + tilt_shift(profile, tilt, target), 0), 100)
+            tilt = target
+        plan.steps.append(MoveStep(
+            axis=axis,
+            target=target,
+            run_time=round(duration, 3),
+            duration=round(duration + profile.command_delay, 3),
+            frames=1 + _stop_frames(profile, target),
+            position=position,
+            tilt=tilt,
+        ))
+    plan.position = position
+    plan.tilt = tilt
+    return plan
+
+
+def min_move_distance(profile: MotionProfile, up: bool) -> int:
+    """Smallest position change the motor can execute reliably."""
+    if not profile.min_move_time:
+        return 0
+    return math.ceil(profile.min_move_time / (profile.travel_time_up if up else profile.travel_time_down) * 100)
+
+
+def approach_targets(profile: MotionProfile, position: int, target: int) -> list[int]:
+    """Stops needed to reach a main position repeatably.
+
+    Intermediate targets are approached downwards when the motor has
+    backlash, so the slack is always taken up on the same side. Moves shorter
+    than the minimum pulse are widened into a back-off and a full approach,
+    or skipped (empty list) when the cover is already within half a pulse.
+    End positions are always reachable since the motor stops there by itself.
+    Near the top end there may be no room above the target for a full
+    approach downwards; the back-off then goes downwards instead and the
+    backlash approach is left out.
+    """
+    if target in (0, 100) or target == position:
+        return [target]
+    up = target > position
+    distance = abs(target - position)
+    min_distance = min_move_distance(profile, up)
+    min_down = min_move_distance(profile, False)
+    if distance < min_distance:
+        if distance * 2 < min_distance:
+            return []
+        back_off = max(position, target) + min_move_distance(profile, True)
+        if min(back_off, 100) - target < min_down:
+            back_off = min(position, target) - max(min_down, min_move_distance(profile, True))
+        return [min(max(back_off, 0), 100), target]
+    if up and profile.backlash:
+        slack = math.ceil(profile.backlash / profile.travel_time_down * 100)
+        overshoot = max(min_down, slack, 1)
+        if target + overshoot > 100:
+            return [target]
+        return [target + overshoot, target]
+    return [target]
+
+
+def _candidates(profile: MotionProfile, target_position: int, target_tilt: int):
+    """Yield the command sequences worth considering for a (position, tilt) target."""
+    yield [(AXIS_POSITION, target_position), (AXIS_TILT, target_tilt)]
+    yield [(AXIS_TILT, target_tilt), (AXIS_POSITION, target_position)]
+    if profile.tilt_only_when_closed:
+        # Tilt only works at the closed end: close, tilt, then move out again
+        yield [(AXIS_POSITION, 0), (AXIS_TILT, target_tilt), (AXIS_POSITION, target_position)]
+    if profile.tilt_coupled:
+        # Approach from below (slats end at 0) or overshoot from above (slats end at 100)
+        # so that the final tilt move lands the blind on the target position
+        yield [(AXIS_POSITION, target_position - tilt_shift(profile, 0, target_tilt)), (AXIS_TILT, target_tilt)]
+        yield [(AXIS_POSITION, target_position - tilt_shift(profile, 100, target_tilt)), (AXIS_TILT, target_tilt)]
+
+
+def plan_move(
+    profile: MotionProfile,
+    position: int,
+    tilt: int,
+    target_position: int,
+    target_tilt: int,
+) -> Optional[MovePlan]:
+    """Return the shortest valid plan reaching both targets, or None if none exists.
+
+    Plans are compared by total motor time first and number of RF frames second.
+    """
+    best = None
+    for moves in _candidates(profile, target_position, target_tilt):
+        plan = simulate_moves(profile, position, tilt, moves)
+        if plan is None:
+            continue
+        if abs(plan.position - target_position) > PLAN_TOLERANCE or abs(plan.tilt - target_tilt) > PLAN_TOLERANCE:
+            continue
+        if best is None or (plan.motor_time, plan.frames) < (best.motor_time, best.frames):
+            best = plan
+    return best
@@ -0,0 +1,95 @@
+"""Bounded profiling sessions of the integration's hot paths."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import json
+import logging
+import os
+import pstats
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .helpers import async_config_dir_path
+
+_LOGGER = logging.getLogger(__name__)
+
+# Callbacks reported individually; everything else in the package is summed up
+PROFILED_FUNCTIONS = (
+    "_update_cover_position",
+    "auto_stop_if_necessary",
+    "_handle_command",
+    "_wrapper_state_changed",
+    "extra_state_attributes",
+    "available",
+)
+
+_PACKAGE_DIR = os.path.dirname(__file__)
+
+
+def summarize(profiler: cProfile.Profile) -> dict[str, Any]:
+    """Reduce a profile to call counts and times of the integration's own functions."""
+    functions = {name: {"calls": 0, "own_time": 0.0, "cumulative_time": 0.0} for name in PROFILED_FUNCTIONS}
+    total_calls = 0
+    total_time = 0.0
+    for (filename, _line, name), (_prim, calls, own, cumulative, _callers) in pstats.Stats(profiler).stats.items():
+        if not filename.startswith(_PACKAGE_DIR):
+            continue
+        total_calls += calls
+        total_time += own
+        if name in functions:
+            entry = functions[name]
+            entry["calls"] += calls
+            entry["own_time"] += own
+            entry["cumulative_time"] += cumulative
+    for entry in functions.values():
+        entry["own_time"] = round(entry["own_time"], 6)
+        entry["cumulative_time"] = round(entry["cumulative_time"], 6)
+    return {
+        "functions": functions,
+        "integration_calls": total_calls,
+        "integration_time": round(total_time, 6),
+    }
+
+
+async def async_run_profile(hass: HomeAssistant, duration: float, filename: str) -> dict[str, Any]:
+    """Profile the event loop for ``duration`` seconds and write the integration's share to a file.
+
+    The profiler is only installed for the session, so nothing is added to
+    the hot paths the rest of the time.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if domain_data.get("profiling"):
+        raise HomeAssistantError("A profiling session is already running")
+    # Checked before profiling so a bad name does not cost the whole session
+    path = await async_config_dir_path(hass, filename)
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError as ex:
+        raise HomeAssistantError(f"Cannot start profiler: {ex}") from ex
+    domain_data["profiling"] = True
+    started = dt_util.utcnow()
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        profiler.disable()
+        domain_data["profiling"] = False
+
+    summary = {
+        "started_at": started.isoformat(),
+        "duration": duration,
+        **summarize(profiler),
+    }
+
+    def _write() -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(summary, handle, indent=2)
+
+    await hass.async_add_executor_job(_write)
+    _LOGGER.info("Profile of %.0fs written to %s", duration, path)
+    return {"filename": path, **summary}
@@ -0,0 +1,175 @@
+"""Diagnostic performance sensors for Cover RF Time Based.
+
+All sensors are disabled by default; counters are only collected for a
+device while one of its sensors (or an integration-wide one) is enabled.
+"""
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import CONF_ENTRY_TYPE, DOMAIN, ENTRY_TYPE_HUB, SUBENTRY_TYPE_DEVICE
+from .entity import unique_id_for
+from .perf import PerfCounters, all_perf_counters, perf_counters, refresh_perf_enabled
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+@dataclass(frozen=True, kw_only=True)
+class PerfSensorDescription(SensorEntityDescription):
+    """Sensor description with a getter on counters and the live cover entities."""
+    value_fn: Callable[[PerfCounters, list, float], Any]
+
+
+SENSORS: tuple[PerfSensorDescription, ...] = (
+    PerfSensorDescription(
+        key="ticks",
+        name="Ticks",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda counters, covers, now: counters.ticks,
+    ),
+    PerfSensorDescription(
+        key="state_writes_per_minute",
+        name="State writes per minute",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda counters, covers, now: counters.writes_per_minute(now),
+    ),
+    PerfSensorDescription(
+        key="dispatch_latency_p50",
+        name="Dispatch latency p50",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda counters, covers, now: counters.dispatch_latency.percentile(0.5),
+    ),
+    PerfSensorDescription(
+        key="dispatch_latency_p95",
+        name="Dispatch latency p95",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda counters, covers, now: counters.dispatch_latency.percentile(0.95),
+    ),
+    PerfSensorDescription(
+        key="auto_stop_lateness",
+        name="Auto-stop lateness p95",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda counters, covers, now: counters.stop_lateness.percentile(0.95),
+    ),
+    PerfSensorDescription(
+        key="active_timers",
+        name="Active timers",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda counters, covers, now: sum(cover.active_timers() for cover in covers),
+    ),
+    PerfSensorDescription(
+        key="leaked_updaters",
+        name="Leaked updater ticks",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda counters, covers, now: counters.leaked_updaters,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the performance sensors of a cover or hub entry."""
+    if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HUB:
+        # Sensors of a hub cover belong to its subentry and go away with it
+        for subentry_id, subentry in entry.subentries.items():
+            if subentry.subentry_type == SUBENTRY_TYPE_DEVICE:
+                async_add_entities(
+                    [DevicePerfSensor(description, subentry_id, subentry.title) for description in SENSORS],
+                    config_subentry_id=subentry_id,
+                )
+        entities: list[SensorEntity] = []
+    else:
+        entities = [DevicePerfSensor(description, entry.entry_id, entry.title) for description in SENSORS]
+
+    # The integration-wide sensors live with whichever entry is set up first
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if domain_data.setdefault("perf_aggregate_entry", entry.entry_id) == entry.entry_id:
+        entities.extend(AggregatePerfSensor(description) for description in SENSORS)
+
+    if entities:
+        async_add_entities(entities)
+
+
+class DevicePerfSensor(SensorEntity):
+    """Performance counter of one cover."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, description: PerfSensorDescription, device_id: str, name: str):
+        self.entity_description = description
+        self._device_id = device_id
+        self._attr_unique_id = f"{unique_id_for(device_id)}_{description.key}"
+        self._attr_name = f"{name} {description.name}"
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, device_id)})
+        self._counters = None
+
+    async def async_added_to_hass(self):
+        self._counters = perf_counters(self.hass, self._device_id)
+        self._counters.subscribers += 1
+        refresh_perf_enabled(self.hass)
+
+    async def async_will_remove_from_hass(self):
+        self._counters.subscribers -= 1
+        refresh_perf_enabled(self.hass)
+
+    @property
+    def native_value(self):
+        cover = self.hass.data.get(DOMAIN, {}).get("entities", {}).get(self._device_id)
+        covers = [cover] if cover is not None else []
+        return self.entity_description.value_fn(self._counters, covers, time.time())
+
+
+class AggregatePerfSensor(SensorEntity):
+    """Performance counter summed over every cover of the integration."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, description: PerfSensorDescription):
+        self.entity_description = description
+        self._attr_unique_id = f"{DOMAIN}_{description.key}"
+        self._attr_name = f"Cover RF Time Based {description.name}"
+
+    async def async_added_to_hass(self):
+        domain_data = self.hass.data.setdefault(DOMAIN, {})
+        domain_data["perf_aggregate_subscribers"] = domain_data.get("perf_aggregate_subscribers", 0) + 1
+        refresh_perf_enabled(self.hass)
+
+    async def async_will_remove_from_hass(self):
+        domain_data = self.hass.data.setdefault(DOMAIN, {})
+        domain_data["perf_aggregate_subscribers"] = domain_data.get("perf_aggregate_subscribers", 1) - 1
+        refresh_perf_enabled(self.hass)
+
+    @property
+    def native_value(self):
+        merged = PerfCounters()
+        for counters in all_perf_counters(self.hass):
+            merged.merge(counters)
+        # Totals of unloaded covers, so the integration-wide counters never go down
+        retired = self.hass.data.get(DOMAIN, {}).get("perf_retired")
+        if retired is not None:
+            merged.merge(retired)
+        covers = list(self.hass.data.get(DOMAIN, {}).get("entities", {}).values())
+        return self.entity_description.value_fn(merged, covers, time.time())
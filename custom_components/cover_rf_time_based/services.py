@@ -0,0 +1,305 @@
+"""Integration-wide services for Cover RF Time Based."""
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+import homeassistant.helpers.config_validation as cv
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from .const import (
+    DOMAIN,
+    DUTY_MODE_QUEUE,
+    DUTY_MODE_REJECT,
+    CONF_ENTRY_TYPE,
+    ENTRY_TYPE_HUB,
+    SUBENTRY_TYPE_DEVICE,
+    CONF_DEVICE_CLASS,
+    CONF_TRAVELLING_TIME_DOWN,
+    CONF_TRAVELLING_TIME_UP,
+    CONF_TILTING_TIME_DOWN,
+    CONF_TILTING_TIME_UP,
+    CONF_COMMAND_DELAY,
+    CONF_BACKLASH,
+    CONF_MIN_MOVE_TIME,
+    CONF_MAX_RUN_TIME,
+    CONF_DUTY_WINDOW,
+    CONF_DUTY_MODE,
+    CONF_SEND_STOP_AT_ENDS,
+    CONF_ALWAYS_CONFIDENT,
+    CONF_TILT_ONLY_WHEN_CLOSED,
+    CONF_TILT_COUPLED,
+    CONF_WRAPPER_POSITION_WEIGHT,
+    CONF_POWER_THRESHOLD,
+    DEFAULT_DEVICE_CLASS,
+    SERVICE_BULK_UPDATE_OPTIONS,
+    SERVICE_MIGRATE_YAML,
+    ATTR_DRY_RUN,
+    ATTR_MAX_CONCURRENCY,
+    SERVICE_EXPORT_DEVICES,
+    SERVICE_IMPORT_DEVICES,
+    ATTR_FILENAME,
+    ATTR_DOCUMENT,
+    ATTR_DURATION,
+    SERVICE_PROFILE,
+    DEFAULT_PROFILE_DURATION,
+    DEFAULT_PROFILE_FILENAME,
+    MAX_PROFILE_DURATION,
+    ATTR_AREA_ID,
+    ATTR_MODE,
+    ATTR_OPTIONS,
+)
+from .config_flow import CONF_MODE, MODE_SCRIPT, MODE_WRAPPER
+from .helpers import apply_device_config, skip_update_listener
+from .migration import DEFAULT_MIGRATION_CONCURRENCY, async_migrate_yaml_devices
+from .backup import (
+    async_export_document,
+    async_export_to_file,
+    async_import_document,
+    async_read_document,
+)
+from .profiling import async_run_profile
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigSubentry
+
+_LOGGER = logging.getLogger(__name__)
+
+# Options that can be patched on many covers at once (same ranges as the options flow)
+BULK_OPTIONS_SCHEMA = vol.Schema({
+    vol.Optional(CONF_TRAVELLING_TIME_DOWN): vol.All(vol.Coerce(float), vol.Range(min=1, max=300)),
+    vol.Optional(CONF_TRAVELLING_TIME_UP): vol.All(vol.Coerce(float), vol.Range(min=1, max=300)),
+    vol.Optional(CONF_TILTING_TIME_DOWN): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=60)),
+    vol.Optional(CONF_TILTING_TIME_UP): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=60)),
+    vol.Optional(CONF_COMMAND_DELAY): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+    vol.Optional(CONF_BACKLASH): vol.All(vol.Coerce(float), vol.Range(min=0, max=5)),
+    vol.Optional(CONF_MIN_MOVE_TIME): vol.All(vol.Coerce(float), vol.Range(min=0, max=5)),
+    vol.Optional(CONF_MAX_RUN_TIME): vol.All(vol.Coerce(float), vol.Range(min=0, max=3600)),
+    vol.Optional(CONF_DUTY_WINDOW): vol.All(vol.Coerce(float), vol.Range(min=60, max=7200)),
+    vol.Optional(CONF_DUTY_MODE): vol.In([DUTY_MODE_QUEUE, DUTY_MODE_REJECT]),
+    vol.Optional(CONF_SEND_STOP_AT_ENDS): cv.boolean,
+    vol.Optional(CONF_ALWAYS_CONFIDENT): cv.boolean,
+    vol.Optional(CONF_TILT_ONLY_WHEN_CLOSED): cv.boolean,
+    vol.Optional(CONF_TILT_COUPLED): cv.boolean,
+    vol.Optional(CONF_WRAPPER_POSITION_WEIGHT): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
+    vol.Optional(CONF_POWER_THRESHOLD): vol.All(vol.Coerce(float), vol.Range(min=0, max=1000)),
+})
+
+BULK_UPDATE_SCHEMA = vol.Schema({
+    vol.Required(ATTR_OPTIONS): vol.All(BULK_OPTIONS_SCHEMA, vol.Length(min=1)),
+    vol.Optional(ATTR_AREA_ID): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_MODE): vol.In([MODE_SCRIPT, MODE_WRAPPER]),
+    vol.Optional(CONF_DEVICE_CLASS): vol.All(cv.ensure_list, [cv.string]),
+})
+
+MIGRATE_YAML_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_DRY_RUN, default=False): cv.boolean,
+    vol.Optional(ATTR_MAX_CONCURRENCY, default=DEFAULT_MIGRATION_CONCURRENCY): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=64)
+    ),
+})
+
+EXPORT_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_FILENAME): cv.string,
+})
+
+IMPORT_SCHEMA = vol.All(
+    vol.Schema({
+        vol.Optional(ATTR_FILENAME): cv.string,
+        vol.Optional(ATTR_DOCUMENT): dict,
+    }),
+    cv.has_at_least_one_key(ATTR_FILENAME, ATTR_DOCUMENT),
+)
+
+PROFILE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+        vol.Coerce(float), vol.Range(min=1, max=MAX_PROFILE_DURATION)
+    ),
+    vol.Optional(ATTR_FILENAME, default=DEFAULT_PROFILE_FILENAME): cv.string,
+})
+
+
+def _iter_devices(hass: HomeAssistant):
+    """Yield (entry, subentry, device_id, data) for every UI-configured cover."""
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HUB:
+            for subentry_id, subentry in entry.subentries.items():
+                if subentry.subentry_type == SUBENTRY_TYPE_DEVICE:
+                    yield entry, subentry, subentry_id, dict(subentry.data)
+        elif entry.data.get("yaml_config") or entry.data.get("migration_completed"):
+            continue
+        else:
+            yield entry, None, entry.entry_id, {**entry.data, **entry.options}
+
+
+def _matches(
+    hass: HomeAssistant,
+    device_id: str,
+    data: dict[str, Any],
+    filters: dict[str, Any],
+) -> bool:
+    """Return True if a device passes the area/mode/device_class filters."""
+    if ATTR_MODE in filters and data.get(CONF_MODE, MODE_SCRIPT) != filters[ATTR_MODE]:
+        return False
+    if CONF_DEVICE_CLASS in filters and data.get(CONF_DEVICE_CLASS, DEFAULT_DEVICE_CLASS) not in filters[CONF_DEVICE_CLASS]:
+        return False
+    if ATTR_AREA_ID in filters:
+        entity = hass.data.get(DOMAIN, {}).get("entities", {}).get(device_id)
+        if entity is None or entity.entity_id is None:
+            return False
+        reg_entry = er.async_get(hass).async_get(entity.entity_id)
+        if reg_entry is None:
+            return False
+        area_id = reg_entry.area_id
+        if area_id is None and reg_entry.device_id is not None:
+            # The entity follows the area of its device
+            device = dr.async_get(hass).async_get(reg_entry.device_id)
+            area_id = device.area_id if device is not None else None
+        if area_id not in filters[ATTR_AREA_ID]:
+            return False
+    return True
+
+
+async def async_bulk_update_options(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Apply one validated options patch to every matching cover.
+
+    The patch is pushed into the live entities first and then persisted
+    with the entries' update listeners skipped, so no entry is reloaded and
+    a hub is not re-applied once per stored cover.
+    """
+    patch = call.data[ATTR_OPTIONS]
+    updated: list[str] = []
+
+    for entry, subentry, device_id, data in list(_iter_devices(hass)):
+        if not _matches(hass, device_id, data, call.data):
+            continue
+        new_data = {**data, **patch}
+        if new_data == data:
+            continue
+        title = subentry.title if subentry is not None else entry.title
+        applied = apply_device_config(hass, device_id, new_data, title)
+        _async_store(hass, entry, subentry, new_data, applied)
+        updated.append(title)
+
+    _LOGGER.info("Bulk options update applied to %d covers", len(updated))
+    return {"updated": updated}
+
+
+def _async_store(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    subentry: ConfigSubentry | None,
+    data: dict[str, Any],
+    applied: bool,
+) -> None:
+    """Persist device data; the update listener is skipped if the data is already live."""
+    if subentry is not None:
+        changed = hass.config_entries.async_update_subentry(entry, subentry, data=data)
+    else:
+        changed = hass.config_entries.async_update_entry(entry, data=data, options={})
+    if changed and applied:
+        skip_update_listener(hass, entry.entry_id)
+
+
+async def async_migrate_yaml(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Migrate YAML covers to config entries and return a per-device report."""
+    yaml_configs = hass.data.get(DOMAIN, {}).get("yaml_configs", [])
+    results = await async_migrate_yaml_devices(
+        hass,
+        yaml_configs,
+        dry_run=call.data[ATTR_DRY_RUN],
+        max_concurrency=call.data[ATTR_MAX_CONCURRENCY],
+    )
+    summary: dict[str, int] = {}
+    for result in results:
+        summary[result.status] = summary.get(result.status, 0) + 1
+    return {
+        ATTR_DRY_RUN: call.data[ATTR_DRY_RUN],
+        "summary": summary,
+        "devices": [asdict(result) for result in results],
+    }
+
+
+async def async_export_devices(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Export all covers, optionally writing the document to a file."""
+    if ATTR_FILENAME in call.data:
+        return await async_export_to_file(hass, call.data[ATTR_FILENAME])
+    return async_export_document(hass)
+
+
+async def async_import_devices(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Import covers from a document passed inline or read from a file."""
+    document = call.data.get(ATTR_DOCUMENT)
+    if document is None:
+        document = await async_read_document(hass, call.data[ATTR_FILENAME])
+    return await async_import_document(hass, document)
+
+
+async def async_profile(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Profile the integration for the requested time and return the summary."""
+    return await async_run_profile(hass, call.data[ATTR_DURATION], call.data[ATTR_FILENAME])
+
+
+def async_register_services(hass: HomeAssistant) -> None:
+    """Register integration-wide services."""
+    if hass.services.has_service(DOMAIN, SERVICE_BULK_UPDATE_OPTIONS):
+        return
+
+    async def _bulk_update(call: ServiceCall) -> ServiceResponse:
+        return await async_bulk_update_options(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_UPDATE_OPTIONS,
+        _bulk_update,
+        schema=BULK_UPDATE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def _migrate_yaml(call: ServiceCall) -> ServiceResponse:
+        return await async_migrate_yaml(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_MIGRATE_YAML,
+        _migrate_yaml,
+        schema=MIGRATE_YAML_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def _export_devices(call: ServiceCall) -> ServiceResponse:
+        return await async_export_devices(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_DEVICES,
+        _export_devices,
+        schema=EXPORT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def _import_devices(call: ServiceCall) -> ServiceResponse:
+        return await async_import_devices(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_DEVICES,
+        _import_devices,
+        schema=IMPORT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def _profile(call: ServiceCall) -> ServiceResponse:
+        return await async_profile(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,108 @@
+"""Config subentry flow for covers inside a hub entry.
+
+Kept apart from config_flow.py because config subentries only exist in
+Home Assistant 2025.3 and newer; this module is imported only there.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant import config_entries
+
+from .config_flow import (
+    CONF_MODE,
+    DEVICE_MODES,
+    MODE_SCRIPT,
+    _get_script_schema,
+    _get_wrapper_schema,
+    _validate_device_input,
+)
+from .const import CONF_NAME
+
+
+class CoverDeviceSubentryFlow(config_entries.ConfigSubentryFlow):
+    """Add or reconfigure a cover inside a hub entry.
+
+    Subentries are identified by their subentry id; names are only checked
+    against the current titles, which follow renames.
+    """
+
+    mode: str = MODE_SCRIPT
+
+    def _name_taken(self, name: str, own_id: str | None = None) -> bool:
+        return any(
+            subentry.title == name and subentry_id != own_id
+            for subentry_id, subentry in self._get_entry().subentries.items()
+        )
+
+    async def async_step_user(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.SubentryFlowResult:
+        """Choose the mode of the new cover."""
+        if user_input is not None:
+            self.mode = user_input.get(CONF_MODE, MODE_SCRIPT)
+            return await self.async_step_device_config()
+
+        return self.async_show_form(
+            step_id="user",
+            data_schema=vol.Schema({
+                vol.Required(CONF_MODE, default=MODE_SCRIPT): vol.In(DEVICE_MODES),
+            }),
+        )
+
+    async def async_step_device_config(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.SubentryFlowResult:
+        """Configure the new cover."""
+        errors = {}
+
+        if user_input is not None:
+            errors = _validate_device_input(self.mode, user_input)
+
+            if not errors:
+                user_input = {k: v for k, v in user_input.items() if v not in (None, "")}
+                name = user_input[CONF_NAME]
+                if self._name_taken(name):
+                    return self.async_abort(reason="already_configured")
+
+                user_input[CONF_MODE] = self.mode
+                return self.async_create_entry(title=name, data=user_input)
+
+        schema = _get_script_schema() if self.mode == MODE_SCRIPT else _get_wrapper_schema()
+        return self.async_show_form(
+            step_id="device_config",
+            data_schema=schema,
+            errors=errors,
+        )
+
+    async def async_step_reconfigure(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.SubentryFlowResult:
+        """Edit an existing cover; timing changes are applied in place."""
+        subentry = self._get_reconfigure_subentry()
+        mode = subentry.data.get(CONF_MODE, MODE_SCRIPT)
+        errors = {}
+
+        if user_input is not None:
+            errors = _validate_device_input(mode, user_input)
+            if not errors and self._name_taken(user_input[CONF_NAME], subentry.subentry_id):
+                errors[CONF_NAME] = "name_exists"
+
+            if not errors:
+                updated_data = {k: v for k, v in user_input.items() if v not in (None, "")}
+                updated_data[CONF_MODE] = mode
+                return self.async_update_and_abort(
+                    self._get_entry(),
+                    subentry,
+                    title=updated_data[CONF_NAME],
+                    data=updated_data,
+                )
+
+        schema = _get_script_schema() if mode == MODE_SCRIPT else _get_wrapper_schema()
+        return self.async_show_form(
+            step_id="reconfigure",
+            data_schema=self.add_suggested_values_to_schema(schema, subentry.data),
+            errors=errors,
+        )
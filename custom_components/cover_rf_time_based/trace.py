@@ -0,0 +1,173 @@
+"""Bounded movement trace for Cover RF Time Based diagnostics."""
+from __future__ import annotations
+
+from array import array
+from typing import Any
+
+# Movements kept per cover (about 41 bytes each; columns grow up to this size)
+TRACE_SIZE = 1000
+
+OUTCOME_MOVING = 0
+OUTCOME_ARRIVED = 1
+OUTCOME_STOPPED = 2
+OUTCOMES = ("moving", "arrived", "stopped")
+
+SOURCE_NONE = 0
+SOURCE_WRAPPER = 1
+SOURCE_END_SENSOR = 2
+SOURCE_POWER = 3
+SOURCES = (None, "wrapper", "end_sensor", "power")
+
+NO_POSITION = -1
+
+_COLUMNS = (
+    ("_command_at", "d"),
+    ("_travel_time", "f"),
+    ("_lead_time", "f"),
+    ("_command_delay", "f"),
+    ("_planned_stop", "f"),
+    ("_stop", "f"),
+    ("_confirmed", "f"),
+    ("_start_position", "b"),
+    ("_target_position", "b"),
+    ("_end_position", "b"),
+    ("_confirmed_position", "b"),
+    ("_outcome", "b"),
+    ("_source", "b"),
+    ("_confirmations", "B"),
+)
+
+
+class MovementTrace:
+    """Ring buffer of the last TRACE_SIZE movements stored in typed array columns.
+
+    The columns start empty and grow by one entry per recorded movement
+    until they hold ``size`` entries, then the oldest movement is
+    overwritten; a cover that rarely moves keeps a small trace. Only the
+    command time is an absolute timestamp; every other time is an
+    offset from it in single precision. Records are addressed by a running
+    sequence number, so confirmations for a record that has already been
+    overwritten are dropped. A movement keeps its latest confirmation and
+    the number of confirmations it received.
+    """
+
+    __slots__ = (
+        "size",
+        "count",
+        "_command_at",
+        "_travel_time",
+        "_lead_time",
+        "_command_delay",
+        "_planned_stop",
+        "_stop",
+        "_confirmed",
+        "_start_position",
+        "_target_position",
+        "_end_position",
+        "_confirmed_position",
+        "_outcome",
+        "_source",
+        "_confirmations",
+    )
+
+    def __init__(self, size: int = TRACE_SIZE):
+        self.size = size
+        self.count = 0
+        for name, typecode in _COLUMNS:
+            setattr(self, name, array(typecode))
+
+    def begin(
+        self,
+        command_at: float,
+        start_position: int,
+        target_position: int,
+        travel_time: float,
+        lead_time: float,
+        command_delay: float,
+        planned_stop_at: float,
+    ) -> int:
+        """Record the start of a movement and return its sequence number."""
+        seq = self.count
+        self.count += 1
+        i = seq % self.size
+        if i == len(self._command_at):
+            # Not full yet: add an entry to every column, then fill it in below
+            for name, _typecode in _COLUMNS:
+                getattr(self, name).append(0)
+        self._command_at[i] = command_at
+        self._travel_time[i] = travel_time
+        self._lead_time[i] = lead_time
+        self._command_delay[i] = command_delay
+        self._planned_stop[i] = planned_stop_at - command_at
+        self._stop[i] = 0
+        self._confirmed[i] = 0
+        self._start_position[i] = start_position
+        self._target_position[i] = target_position
+        self._end_position[i] = NO_POSITION
+        self._confirmed_position[i] = NO_POSITION
+        self._outcome[i] = OUTCOME_MOVING
+        self._source[i] = SOURCE_NONE
+        self._confirmations[i] = 0
+        return seq
+
+    def _index(self, seq: int) -> int | None:
+        if seq < 0 or seq >= self.count or seq < self.count - self.size:
+            return None
+        return seq % self.size
+
+    def reschedule(self, seq: int, planned_stop_at: float) -> None:
+        """Update the planned stop after the segment was rebased."""
+        i = self._index(seq)
+        if i is not None:
+            self._planned_stop[i] = planned_stop_at - self._command_at[i]
+
+    def finish(self, seq: int, stop_at: float, end_position: int, arrived: bool) -> None:
+        i = self._index(seq)
+        if i is None:
+            return
+        self._stop[i] = stop_at - self._command_at[i]
+        self._end_position[i] = end_position
+        self._outcome[i] = OUTCOME_ARRIVED if arrived else OUTCOME_STOPPED
+
+    def confirm(self, seq: int, confirmed_at: float, position: int, source: int) -> None:
+        """Attach a real position (wrapper report, end sensor, power meter) to a movement.
+
+        A later confirmation replaces an earlier one, so a correction after
+        the first report is what the position error is computed against.
+        """
+        i = self._index(seq)
+        if i is None:
+            return
+        self._confirmed[i] = confirmed_at - self._command_at[i]
+        self._confirmed_position[i] = position
+        self._source[i] = source
+        if self._confirmations[i] < 255:
+            self._confirmations[i] += 1
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the stored movements, oldest first."""
+        records = []
+        for seq in range(max(0, self.count - self.size), self.count):
+            i = seq % self.size
+            end = self._end_position[i]
+            confirmed = self._confirmed_position[i]
+            outcome = self._outcome[i]
+            records.append({
+                "seq": seq,
+                "command_at": self._command_at[i],
+                "start_position": self._start_position[i],
+                "target_position": self._target_position[i],
+                "travel_time": round(self._travel_time[i], 3),
+                "lead_time": round(self._lead_time[i], 3),
+                "command_delay": round(self._command_delay[i], 3),
+                "planned_stop": round(self._planned_stop[i], 3),
+                "actual_stop": round(self._stop[i], 3) if outcome != OUTCOME_MOVING else None,
+                "outcome": OUTCOMES[outcome],
+                "end_position": end if end != NO_POSITION else None,
+                "confirmed_by": SOURCES[self._source[i]],
+                "confirmed_after": round(self._confirmed[i], 3) if confirmed != NO_POSITION else None,
+                "confirmed_position": confirmed if confirmed != NO_POSITION else None,
+                "confirmations": self._confirmations[i],
+                "position_error": end - confirmed if NO_POSITION not in (end, confirmed) else None,
+            })
+        return records
@@ -1,14 +1,19 @@
 import time
-from enum import Enum
+from enum import IntEnum
 
+# Fusion tuning: minimum observed travel before re-estimating speed, and bounds of the speed factor
+MIN_CORRECTION_TRAVEL = 5
+MIN_TRAVEL_TIME_SCALE = 0.5
+MAX_TRAVEL_TIME_SCALE = 2.0
 
-class PositionType(Enum):
+
+class PositionType(IntEnum):
     UNKNOWN = 1
     CALCULATED = 2
     CONFIRMED = 3
 
 
-class TravelStatus(Enum):
+class TravelStatus(IntEnum):
     DIRECTION_UP = 1
     DIRECTION_DOWN = 2
     STOPPED = 3
@@ -16,6 +21,28 @@ class TravelStatus(Enum):
 
 class TravelCalculator:
 
+    __slots__ = (
+        "position_type",
+        "last_known_position",
+        "travel_to_position",
+        "travel_started_time",
+        "travel_time_down",
+        "travel_time_up",
+        "travel_direction",
+        "position_closed",
+        "position_open",
+        "time_set_from_outside",
+        "command_delay",
+        "start_lag",
+        "travel_time_scale",
+        "segment_origin_position",
+        "segment_origin_time",
+        "lead_time",
+        "backlash",
+        "last_travel_direction",
+        "awaiting_motor_start",
+    )
+
     def __init__(self, travel_time_down, travel_time_up, command_delay=0):
         self.position_type = PositionType.UNKNOWN
         self.last_known_position = 0
@@ -28,36 +55,190 @@ class TravelCalculator:
         self.position_open = 100
         self.time_set_from_outside = None
         self.command_delay = command_delay
-
-    def start_travel(self, position):
+        # Seconds between travel_started_time and actual motor start of the active segment
+        self.start_lag = command_delay
+        # Speed factor of the active segment, re-estimated from observed positions
+        self.travel_time_scale = 1.0
+        self.segment_origin_position = 0
+        self.segment_origin_time = 0
+        # Seconds at the start of the segment in which the motor runs without
+        # changing this position (e.g. venetian slats turning before the blind moves)
+        self.lead_time = 0
+        # Seconds of motor run taken up by mechanical slack when the direction reverses
+        self.backlash = 0
+        self.last_travel_direction = None
+        # True from a travel command until motor_started() anchors the travel on the measured start
+        self.awaiting_motor_start = False
+
+    def _begin_segment(self, lead_time=0):
+        self.segment_origin_position = self.last_known_position
+        self.segment_origin_time = self.travel_started_time + lead_time
+        self.start_lag = self.command_delay
+        self.travel_time_scale = 1.0
+        self.lead_time = lead_time
+        self.awaiting_motor_start = True
+
+    def _apply_backlash(self):
+        """Delay position changes by the slack taken up when the motor reverses."""
+        if self.travel_direction == TravelStatus.STOPPED:
+            return
+        if self.backlash and self.last_travel_direction not in (None, self.travel_direction):
+            self.lead_time += self.backlash
+            self.segment_origin_time += self.backlash
+        self.last_travel_direction = self.travel_direction
+
+    def start_travel(self, position, lead_time=0):
+        # Read the position before the active travel's target and start time are replaced
+        current = self.current_position()
         self.travel_to_position = position
         self.travel_started_time = self.current_time()
-        self.last_known_position = self.current_position()
-        if position < self.current_position():
+        self.last_known_position = current
+        self._begin_segment(lead_time)
+        if position < current:
             self.travel_direction = TravelStatus.DIRECTION_DOWN
-        elif position > self.current_position():
+        elif position > current:
             self.travel_direction = TravelStatus.DIRECTION_UP
         else:
             self.travel_direction = TravelStatus.STOPPED
+        self._apply_backlash()
 
-    def start_travel_up(self):
+    def start_travel_up(self, lead_time=0):
+        current = self.current_position()
         self.travel_to_position = self.position_open
         self.travel_started_time = self.current_time()
-        self.last_known_position = self.current_position()
+        self.last_known_position = current
+        self._begin_segment(lead_time)
         self.travel_direction = TravelStatus.DIRECTION_UP
+        self._apply_backlash()
 
-    def start_travel_down(self):
+    def start_travel_down(self, lead_time=0):
+        current = self.current_position()
         self.travel_to_position = self.position_closed
         self.travel_started_time = self.current_time()
-        self.last_known_position = self.current_position()
+        self.last_known_position = current
+        self._begin_segment(lead_time)
         self.travel_direction = TravelStatus.DIRECTION_DOWN
+        self._apply_backlash()
 
     def stop(self):
         self.last_known_position = self.current_position()
         self.travel_direction = TravelStatus.STOPPED
         self.travel_started_time = 0
         self.travel_to_position = self.last_known_position
+        self.start_lag = self.command_delay
+        self.travel_time_scale = 1.0
+        self.lead_time = 0
+        self.awaiting_motor_start = False
     
+    def update_timing(self, travel_time_down, travel_time_up, command_delay=0):
+        """Change travel times in place, rebasing an active travel on the current position."""
+        if self.is_traveling():
+            target = self.travel_to_position
+            direction = self.travel_direction
+            now = self.current_time()
+            self.last_known_position = self.current_position()
+            self.lead_time = max(0, self.lead_time - (now - self.travel_started_time))
+            self.travel_started_time = now
+            self.travel_to_position = target
+            self.travel_direction = direction
+        self.travel_time_down = travel_time_down
+        self.travel_time_up = travel_time_up
+        if not self.is_traveling() or self.awaiting_motor_start:
+            self.start_lag = command_delay
+        self.command_delay = command_delay
+
+    def correct_position(self, position, weight, observed_at=None):
+        """Blend an observed (real) position into the active travel segment.
+
+        The observation is compared against the estimated motor position
+        (which lags the displayed estimate by ``start_lag``), the segment speed
+        is re-estimated from the distance covered since the segment started
+        and the remaining travel is rebased on the fused position. Because the
+        rebased segment describes a motor that is already running, STOP is
+        from then on sent ``command_delay`` before arrival.
+
+        ``observed_at`` is when the position was reported (defaults to now);
+        the segment is rebased at that moment and extrapolated from there.
+        """
+        if not self.is_traveling() or weight <= 0:
+            return
+        now = self.current_time() if observed_at is None else observed_at
+        if now < self.travel_started_time:
+            # Report predates the active segment
+            return
+        weight = min(weight, 1.0)
+        up = self.travel_direction == TravelStatus.DIRECTION_UP
+        travel_time_full = self.travel_time_up if up else self.travel_time_down
+        travel_range = self.position_open - self.position_closed
+
+        low, high = sorted((self.segment_origin_position, self.travel_to_position))
+        observed = min(max(position, low), high)
+
+        # Re-estimate the speed from the whole segment so far
+        motion_time = now - self.segment_origin_time - self.command_delay
+        moved = abs(observed - self.segment_origin_position)
+        if moved >= MIN_CORRECTION_TRAVEL and motion_time > 0:
+            implied = (motion_time / travel_time_full * travel_range) / moved
+            scale = (1 - weight) * self.travel_time_scale + weight * implied
+            self.travel_time_scale = min(max(scale, MIN_TRAVEL_TIME_SCALE), MAX_TRAVEL_TIME_SCALE)
+
+        # Where the motor should be right now according to the model
+        estimate = self._motor_position_at(now)
+
+        fused = estimate + weight * (observed - estimate)
+        self.last_known_position = int(round(fused))
+        self.lead_time = max(0, self.lead_time - max(0, now - self.travel_started_time - self.start_lag))
+        self.travel_started_time = now
+        self.start_lag = 0
+        # The observed movement shows the motor is already running
+        self.awaiting_motor_start = False
+
+    def motor_started(self, started_at=None):
+        """Anchor the active travel on a measured motor start.
+
+        Until now the segment assumed the motor starts ``command_delay`` after
+        the command; from here on the position is derived from the actual run
+        time. Returns the measured start latency in seconds, or None if no
+        travel is waiting for its motor.
+        """
+        if not self.is_traveling() or not self.awaiting_motor_start:
+            return None
+        now = self.current_time() if started_at is None else started_at
+        latency = now - self.travel_started_time
+        if latency < 0:
+            return None
+        self.travel_started_time = now
+        # correct_position() measures motion time from the command, not the start
+        self.segment_origin_time = now - self.command_delay
+        self.start_lag = 0
+        self.awaiting_motor_start = False
+        return latency
+
+    def motor_stopped(self, stopped_at=None):
+        """End the active travel where the motor actually stopped.
+
+        Used when the motor stops on its own before the target (obstacle,
+        thermal cut-out). Returns the resulting position, or None if nothing
+        was traveling.
+        """
+        if not self.is_traveling():
+            return None
+        now = self.current_time() if stopped_at is None else stopped_at
+        position = int(round(self._motor_position_at(now)))
+        self.set_position(position)
+        return position
+
+    def _motor_position_at(self, moment):
+        """Estimated (unrounded) motor position of the active segment at ``moment``."""
+        up = self.travel_direction == TravelStatus.DIRECTION_UP
+        travel_time_full = self.travel_time_up if up else self.travel_time_down
+        travel_range = self.position_open - self.position_closed
+        running = max(0, moment - self.travel_started_time - self.start_lag - self.lead_time)
+        step = running * travel_range / (travel_time_full * self.travel_time_scale)
+        estimate = self.last_known_position + (step if up else -step)
+        low, high = sorted((self.segment_origin_position, self.travel_to_position))
+        return min(max(estimate, low), high)
+
     # UPDATED: Do not stop automatically here; let external logic (auto_stop_if_necessary) handle stop & side-effects.
     def update_position(self):
         """Called periodically to allow external logic to detect arrival; no direct state mutation here."""
@@ -69,6 +250,10 @@ class TravelCalculator:
         self.travel_to_position = position
         self.travel_direction = TravelStatus.STOPPED
         self.travel_started_time = 0
+        self.start_lag = self.command_delay
+        self.travel_time_scale = 1.0
+        self.lead_time = 0
+        self.awaiting_motor_start = False
 
     def current_position(self):
         if self.travel_direction == TravelStatus.STOPPED:
@@ -84,7 +269,7 @@ class TravelCalculator:
         if travel_time == 0:
             return self.travel_to_position
 
-        progress = (self.current_time() - self.travel_started_time) / travel_time
+        progress = max(0, self.current_time() - self.travel_started_time - self.lead_time) / travel_time
         
         if progress >= 1:
             return self.travel_to_position
@@ -98,11 +283,14 @@ class TravelCalculator:
     def is_closed(self):
         return self.current_position() == self.position_closed
 
-    def position_reached(self):
+    def position_reached(self, tolerance=0):
         """
         Check if target position is reached (accounting for command_delay).
         Returns True when we should send the STOP command.
 
+        ``tolerance`` lets the check pass that many seconds early, for a
+        caller that knows its STOP will be dispatched late.
+
         With command_delay, the timeline is:
         - t=0: Command sent (OPEN/CLOSE)
         - t=command_delay: Motor actually starts moving
@@ -128,10 +316,26 @@ class TravelCalculator:
             return True
 
         # Send STOP when elapsed time equals the needed travel time
-        # This ensures STOP takes effect exactly when motor reaches the target
-        elapsed_time = self.current_time() - self.travel_started_time
+        # This ensures STOP takes effect exactly when motor reaches the target.
+        # After a fusion correction the motor is already running (start_lag 0),
+        # so STOP has to lead arrival by the full command_delay.
+        elapsed_time = self.current_time() - self.travel_started_time + tolerance
+
+        return elapsed_time >= travel_time + self.lead_time - (self.command_delay - self.start_lag)
 
-        return elapsed_time >= travel_time
+    def stop_deadline(self):
+        """Absolute time at which position_reached() turns True, or None if not traveling."""
+        if not self.is_traveling():
+            return None
+        travel_time = self._calculate_travel_time(self.travel_to_position - self.last_known_position)
+        return self.travel_started_time + travel_time + self.lead_time - (self.command_delay - self.start_lag)
+
+    def arrival_time(self):
+        """Absolute time at which the motor reaches the target, or None if not traveling."""
+        if not self.is_traveling():
+            return None
+        travel_time = self._calculate_travel_time(self.travel_to_position - self.last_known_position)
+        return self.travel_started_time + self.start_lag + self.lead_time + travel_time
 
     def calculate_position(self):
         if not self.is_traveling():
@@ -171,7 +375,7 @@ class TravelCalculator:
             self.travel_time_down
         travel_range = self.position_open - self.position_closed
 
-        return travel_time_full * abs(relative_position) / travel_range
+        return travel_time_full * self.travel_time_scale * abs(relative_position) / travel_range
 
     def current_time(self):
         if self.time_set_from_outside is not None:
@@ -179,4 +383,6 @@ class TravelCalculator:
         return time.time()
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
\ No newline at end of file
+        if not isinstance(other, TravelCalculator):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
\ No newline at end of file
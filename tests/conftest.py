@@ -0,0 +1,55 @@
+"""Shared fixtures for the tests.
+
+The calculator, planner, duty-cycle, lag and performance counter modules
+have no Home Assistant imports, so they are loaded straight from the
+integration folder (as the benchmarks do) and their tests run without
+Home Assistant installed.
+"""
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+INTEGRATION = ROOT / "custom_components" / "cover_rf_time_based"
+
+
+def load_module(name: str):
+    """Load one module of the integration by path, without importing the package."""
+    module_name = f"cover_rf_time_based_{name}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, INTEGRATION / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    # Slotted dataclasses look their module up while the class is created
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def travelcalculator():
+    return load_module("travelcalculator")
+
+
+@pytest.fixture(scope="session")
+def planner():
+    return load_module("planner")
+
+
+@pytest.fixture(scope="session")
+def duty():
+    return load_module("duty")
+
+
+@pytest.fixture(scope="session")
+def lag():
+    return load_module("lag")
+
+
+@pytest.fixture(scope="session")
+def perf():
+    return load_module("perf")
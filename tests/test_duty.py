@@ -0,0 +1,50 @@
+"""Tests for the motor duty-cycle window."""
+from __future__ import annotations
+
+import pytest
+
+
+def test_counters_and_window(duty):
+    cycle = duty.DutyCycle(600)
+    cycle.start(0)
+    cycle.stop(100)
+    cycle.start(200)
+    cycle.stop(230)
+
+    assert cycle.cycles == 2
+    assert cycle.total_run_time == pytest.approx(130)
+    assert cycle.run_time(230) == pytest.approx(130)
+    # The first run leaves the window from t=600 on
+    assert cycle.run_time(650) == pytest.approx(80)
+
+
+def test_wait_time_zero_when_it_fits(duty):
+    cycle = duty.DutyCycle(600)
+    cycle.start(0)
+    cycle.stop(30)
+    assert cycle.wait_time(40, 60, 120) == 0
+
+
+def test_wait_time_until_runs_leave_the_window(duty):
+    cycle = duty.DutyCycle(600)
+    cycle.start(0)
+    cycle.stop(100)
+    # 100 s used, 50 s needed, limit 120: 30 s of the run must age out
+    assert cycle.wait_time(100, 50, 120) == pytest.approx(530, abs=duty.WAIT_RESOLUTION)
+
+
+def test_wait_time_while_running_uses_projected_end(duty):
+    cycle = duty.DutyCycle(600)
+    cycle.start(0)
+    cycle.stop(100)
+    cycle.start(200)
+
+    # Without a projection the whole window is returned
+    assert cycle.wait_time(230, 50, 120) == 600
+    # Running until 260 makes 160 s; at most 70 s may remain, so the first run must age out until 690
+    assert cycle.wait_time(230, 50, 120, 260) == pytest.approx(460, abs=duty.WAIT_RESOLUTION)
+
+
+def test_wait_time_long_run_allowed_on_empty_window(duty):
+    cycle = duty.DutyCycle(600)
+    assert cycle.wait_time(0, 500, 120) == 0
@@ -0,0 +1,40 @@
+"""Tests for the event loop lag estimates."""
+from __future__ import annotations
+
+import pytest
+
+
+def test_tick_lag_is_gap_minus_interval(lag):
+    loop_lag = lag.LoopLag()
+    assert loop_lag.tick(0.0, 0.1) == 0.0
+    assert loop_lag.tick(0.3, 0.1) == pytest.approx(0.2)
+    assert loop_lag.tick_lag == pytest.approx(lag.LAG_SMOOTHING * 0.2)
+
+
+def test_reset_ticks_forgets_previous_tick(lag):
+    loop_lag = lag.LoopLag()
+    loop_lag.tick(0.0, 0.1)
+    loop_lag.reset_ticks()
+    assert loop_lag.tick(10.0, 0.1) == 0.0
+
+
+def test_compensation_is_capped(lag):
+    loop_lag = lag.LoopLag()
+    for _ in range(50):
+        loop_lag.deadline(0.0, 2.0)
+    assert loop_lag.deadline_lag == pytest.approx(2.0, rel=0.01)
+    assert loop_lag.compensation == lag.MAX_LAG_COMPENSATION
+
+
+def test_early_deadline_counts_as_no_lag(lag):
+    loop_lag = lag.LoopLag()
+    assert loop_lag.deadline(10.0, 9.5) == 0.0
+    assert loop_lag.compensation == 0.0
+
+
+def test_warning_is_rate_limited(lag):
+    loop_lag = lag.LoopLag()
+    assert not loop_lag.should_warn(lag.LAG_WARNING_BUDGET, 0)
+    assert loop_lag.should_warn(1.0, 0)
+    assert not loop_lag.should_warn(1.0, lag.LAG_WARNING_INTERVAL - 1)
+    assert loop_lag.should_warn(1.0, lag.LAG_WARNING_INTERVAL)
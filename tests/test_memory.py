@@ -0,0 +1,37 @@
+"""Memory budget checks of benchmarks/bench_memory.py as tests."""
+from __future__ import annotations
+
+import importlib.util
+
+import pytest
+
+from conftest import ROOT
+
+
+@pytest.fixture(scope="module")
+def bench_memory():
+    spec = importlib.util.spec_from_file_location("bench_memory", ROOT / "benchmarks" / "bench_memory.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_calculator_within_budget(bench_memory):
+    assert bench_memory.calculator_bytes(bench_memory.DEFAULT_SIZE) <= bench_memory.CALCULATOR_BUDGET
+
+
+def test_cover_state_within_budget(bench_memory):
+    # The Home Assistant-free part of a cover, checked everywhere
+    assert bench_memory.state_bytes(bench_memory.DEFAULT_SIZE) <= bench_memory.STATE_BUDGET
+
+
+def test_full_trace_within_budget(bench_memory):
+    assert bench_memory.trace_bytes() <= bench_memory.TRACE_BUDGET
+
+
+def test_cover_within_budget(bench_memory):
+    result = bench_memory.cover_bytes(200)
+    if result is None:
+        pytest.skip("needs Home Assistant")
+    per_cover, _trace = result
+    assert per_cover <= bench_memory.COVER_BUDGET
@@ -0,0 +1,45 @@
+"""Tests for the performance histogram and counters."""
+from __future__ import annotations
+
+
+def test_empty_histogram_has_no_percentile(perf):
+    assert perf.Histogram().percentile(0.5) is None
+
+
+def test_percentile_is_bucket_upper_bound(perf):
+    histogram = perf.Histogram()
+    for value in (0.5, 1.5, 3, 3, 40):
+        histogram.add(value)
+    assert histogram.total == 5
+    assert histogram.percentile(0.5) == 5
+    assert histogram.percentile(0.95) == 50
+
+
+def test_values_above_last_bound_report_the_maximum(perf):
+    histogram = perf.Histogram()
+    histogram.add(perf.HISTOGRAM_BOUNDS_MS[-1] + 1234.56)
+    assert histogram.percentile(0.5) == round(perf.HISTOGRAM_BOUNDS_MS[-1] + 1234.56, 1)
+
+
+def test_merge_adds_counts_and_keeps_maximum(perf):
+    first, second = perf.Histogram(), perf.Histogram()
+    first.add(1)
+    second.add(300)
+    second.add(700)
+    first.merge(second)
+    assert first.total == 3
+    assert first.max == 700
+    assert first.percentile(1.0) == 1000
+
+
+def test_counters_merge_and_writes_per_minute(perf):
+    first, second = perf.PerfCounters(), perf.PerfCounters()
+    first.ticks, second.ticks = 3, 4
+    first.state_written(100.0)
+    second.state_written(101.0)
+    second.state_written(170.0)
+    first.merge(second)
+    assert first.ticks == 7
+    assert first.writes_per_minute(101.0) == 2
+    # Writes older than one minute have dropped out
+    assert first.writes_per_minute(175.0) == 1
@@ -0,0 +1,104 @@
+"""Tests for the move planner and the backlash / minimum-move approach."""
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture
+def profile(planner):
+    def make(**overrides):
+        values = dict(
+            travel_time_down=30.0,
+            travel_time_up=30.0,
+            tilting_time_down=2.0,
+            tilting_time_up=2.0,
+            command_delay=0.5,
+            send_stop_at_ends=False,
+            tilt_only_when_closed=False,
+            tilt_coupled=False,
+        )
+        values.update(overrides)
+        return planner.MotionProfile(**values)
+    return make
+
+
+def _pulses_ok(planner, profile, position, targets):
+    """Every intermediate stop is at least one minimum pulse away from the previous one."""
+    for target in targets:
+        if target not in (0, 100):
+            up = target > position
+            if abs(target - position) < planner.min_move_distance(profile, up):
+                return False
+        position = target
+    return True
+
+
+def test_plan_move_prefers_least_motor_time(planner, profile):
+    plan = planner.plan_move(profile(), 0, 0, 50, 100)
+    assert plan is not None
+    assert (plan.position, plan.tilt) == (50, 100)
+    assert plan.motor_time == pytest.approx(15.0 + 2.0)
+    assert [step.axis for step in plan.steps] == [planner.AXIS_POSITION, planner.AXIS_TILT]
+
+
+def test_plan_move_tilt_only_when_closed_goes_through_closed(planner, profile):
+    plan = planner.plan_move(profile(tilt_only_when_closed=True), 50, 0, 50, 100)
+    assert plan is not None
+    assert [(step.axis, step.target) for step in plan.steps] == [
+        (planner.AXIS_POSITION, 0),
+        (planner.AXIS_TILT, 100),
+        (planner.AXIS_POSITION, 50),
+    ]
+
+
+def test_plan_move_adds_backlash_on_reversal(planner, profile):
+    moves = [(planner.AXIS_POSITION, 60), (planner.AXIS_POSITION, 50)]
+    plan = planner.simulate_moves(profile(backlash=0.4), 40, 0, moves)
+    assert [step.run_time for step in plan.steps] == [6.0, 3.4]
+
+
+def test_min_move_distance(planner, profile):
+    assert planner.min_move_distance(profile(), True) == 0
+    assert planner.min_move_distance(profile(min_move_time=1.5), True) == 5
+
+
+def test_short_move_within_half_pulse_is_skipped(planner, profile):
+    assert planner.approach_targets(profile(min_move_time=1.5), 50, 52) == []
+
+
+def test_short_move_is_widened(planner, profile):
+    prof = profile(min_move_time=1.5)
+    targets = planner.approach_targets(prof, 90, 93)
+    assert targets == [98, 93]
+    assert _pulses_ok(planner, prof, 90, targets)
+
+
+@pytest.mark.parametrize("position, target", [(96, 99), (93, 96), (95, 98)])
+def test_short_move_near_top_backs_off_downwards(planner, profile, position, target):
+    prof = profile(min_move_time=1.5)
+    targets = planner.approach_targets(prof, position, target)
+    assert targets[-1] == target
+    assert targets[0] < min(position, target)
+    assert _pulses_ok(planner, prof, position, targets)
+
+
+def test_short_move_backs_off_to_the_top_when_there_is_room(planner, profile):
+    assert planner.approach_targets(profile(min_move_time=1.5), 97, 94) == [100, 94]
+
+
+def test_backlash_approach_from_above(planner, profile):
+    prof = profile(backlash=0.3, min_move_time=1.5)
+    assert planner.approach_targets(prof, 40, 80) == [85, 80]
+    # Downwards moves already end on the approach side
+    assert planner.approach_targets(prof, 80, 40) == [40]
+
+
+def test_backlash_approach_skipped_near_top(planner, profile):
+    prof = profile(backlash=0.3, min_move_time=1.5)
+    assert planner.approach_targets(prof, 90, 97) == [97]
+
+
+def test_end_positions_are_always_direct(planner, profile):
+    prof = profile(backlash=0.3, min_move_time=1.5)
+    assert planner.approach_targets(prof, 99, 100) == [100]
+    assert planner.approach_targets(prof, 1, 0) == [0]
@@ -0,0 +1,104 @@
+"""Tests for TravelCalculator backlash, position fusion, motor start anchoring and retargeting."""
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture
+def make_calculator(travelcalculator):
+    def make(position=0, backlash=0.0, command_delay=0.0):
+        tc = travelcalculator.TravelCalculator(25.0, 30.0, command_delay)
+        tc.time_set_from_outside = 1000.0
+        tc.backlash = backlash
+        tc.set_position(position)
+        return tc
+    return make
+
+
+def test_backlash_only_on_reversal(make_calculator):
+    tc = make_calculator(position=50, backlash=0.5)
+    tc.start_travel(60)
+    assert tc.lead_time == 0
+
+    tc.time_set_from_outside += 3.0
+    tc.set_position(60)
+    tc.start_travel(70)
+    # Same direction as the previous travel: no slack to take up
+    assert tc.lead_time == 0
+
+
+def test_backlash_delays_reversed_travel(make_calculator):
+    tc = make_calculator(position=50, backlash=0.5)
+    tc.start_travel(60)
+    tc.time_set_from_outside += 3.0
+    tc.set_position(60)
+
+    tc.start_travel(40)
+    assert tc.lead_time == pytest.approx(0.5)
+    # The position does not change while the slack is taken up
+    tc.time_set_from_outside += 0.5
+    assert tc.current_position() == 60
+    deadline = tc.stop_deadline()
+    assert deadline == pytest.approx(1003.0 + 0.5 + 25.0 * 20 / 100)
+
+
+def test_correct_position_rebases_segment(make_calculator):
+    tc = make_calculator(position=0)
+    tc.start_travel(100)
+    tc.time_set_from_outside += 15.0
+    # The model expects 50; the cover reports it is only at 40
+    tc.correct_position(40, 1.0)
+
+    assert tc.current_position() == 40
+    assert tc.start_lag == 0
+    assert tc.travel_time_scale == pytest.approx(1.25)
+    # The remaining 60 % now take 60 % of the re-estimated 37.5 s
+    assert tc.arrival_time() == pytest.approx(1015.0 + 0.6 * 30.0 * 1.25)
+
+
+def test_correct_position_with_partial_weight(make_calculator):
+    tc = make_calculator(position=0)
+    tc.start_travel(100)
+    tc.time_set_from_outside += 15.0
+    tc.correct_position(40, 0.5)
+
+    # Half way between the old speed and the implied one (1.25)
+    assert tc.travel_time_scale == pytest.approx(1.125)
+    # The estimate at the new speed (44.4) is blended half way towards 40
+    assert tc.current_position() == 42
+
+
+def test_correct_position_ignored_when_stopped(make_calculator):
+    tc = make_calculator(position=30)
+    tc.correct_position(80, 1.0)
+    assert tc.current_position() == 30
+    assert not tc.is_traveling()
+
+
+@pytest.mark.parametrize("command_delay", [0.0, 0.5])
+def test_motor_started_anchors_travel(make_calculator, command_delay):
+    tc = make_calculator(position=0, command_delay=command_delay)
+    tc.start_travel(100)
+    tc.time_set_from_outside += 2.0
+
+    assert tc.motor_started() == pytest.approx(2.0)
+    assert tc.travel_started_time == 1002.0
+    # Only the first start of a travel is measured
+    tc.time_set_from_outside += 1.0
+    assert tc.motor_started() is None
+
+
+def test_motor_started_ignored_after_stop(make_calculator):
+    tc = make_calculator(position=0)
+    tc.start_travel(100)
+    tc.stop()
+    assert tc.motor_started() is None
+
+
+def test_retarget_reads_current_position_first(make_calculator):
+    tc = make_calculator(position=0)
+    tc.start_travel(100)
+    tc.time_set_from_outside += 15.0
+    tc.start_travel(20)
+    assert tc.last_known_position == 50
+    assert tc.current_position() == 50
@@ -0,0 +1,303 @@
+"""Stand-in Home Assistant core for driving covers outside Home Assistant.
+
+CoverTimeBased only uses a small part of ``hass``: the loop, tasks, the
+service registry, the state machine and the event bus. ``StandInHass``
+provides those and records what the covers do with them. On a
+``VirtualClockLoop`` the loop jumps straight to the next due timer, so hours
+of cover activity run in a fraction of a second and every run is identical.
+
+Home Assistant itself still has to be installed: the entity derives from
+``CoverEntity``. Only the timer helpers and ``dt_util`` of the entity module
+are routed through the stand-in (see ``entity_timers``).
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import selectors
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from homeassistant.core import callback  # noqa: E402
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.cover_rf_time_based import entity as entity_module  # noqa: E402
+from custom_components.cover_rf_time_based.const import DOMAIN  # noqa: E402
+from custom_components.cover_rf_time_based.entity import CoverTimeBased  # noqa: E402
+from custom_components.cover_rf_time_based.models import (  # noqa: E402
+    DeviceConfig,
+    ScriptsConfig,
+    WrapperConfig,
+)
+
+# 2024-01-01T00:00:00Z; calculators see realistic timestamps
+VIRTUAL_EPOCH = 1_704_067_200.0
+# A real loop runs a timer a little after it is due; so does the virtual one by default
+DEFAULT_TIMER_LATENCY = 0.001
+
+
+class VirtualClock:
+    """Simulated wall clock shared by the loop and the covers' travel calculators."""
+
+    def __init__(self, start: float = VIRTUAL_EPOCH):
+        self.now = start
+        self._calculators = []
+
+    def attach(self, calculator) -> None:
+        """Drive a TravelCalculator from this clock through ``time_set_from_outside``."""
+        calculator.time_set_from_outside = self.now
+        self._calculators.append(calculator)
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+        for calculator in self._calculators:
+            calculator.time_set_from_outside = self.now
+
+
+class _VirtualSelector(selectors.DefaultSelector):
+    """Selector that moves the clock forward instead of sleeping until the next timer."""
+
+    def __init__(self, clock: VirtualClock):
+        super().__init__()
+        self._clock = clock
+
+    def select(self, timeout=None):
+        if timeout is None:
+            # Nothing is scheduled, only another thread can wake the loop up
+            return super().select(None)
+        ready = super().select(0)
+        if not ready and timeout > 0:
+            self._clock.advance(timeout)
+        return ready
+
+
+class VirtualClockLoop(asyncio.SelectorEventLoop):
+    """Event loop running on a VirtualClock; idle time takes no real time."""
+
+    def __init__(self, clock: VirtualClock):
+        self.clock = clock
+        super().__init__(_VirtualSelector(clock))
+        # Timers due within this much are run; it has to exceed the float spacing
+        # of epoch timestamps or a timer one ulp ahead would never become due
+        self._clock_resolution = 1e-6
+
+    def time(self) -> float:
+        return self.clock.now
+
+
+@dataclass(slots=True)
+class ServiceCall:
+    time: float
+    domain: str
+    service: str
+    data: dict[str, Any]
+
+
+@dataclass(slots=True)
+class StateRecord:
+    entity_id: str
+    state: str | None
+    attributes: dict[str, Any]
+    last_updated: float
+
+
+@dataclass(slots=True)
+class FiredEvent:
+    time: float
+    event_type: str
+    data: dict[str, Any]
+
+
+class StandInServices:
+    """Service registry that records every call and runs registered handlers."""
+
+    def __init__(self, hass: StandInHass):
+        self._hass = hass
+        self._handlers: dict[tuple[str, str], Callable[[ServiceCall], None]] = {}
+        self.calls: list[ServiceCall] = []
+
+    def async_register(self, domain: str, service: str, handler: Callable[[ServiceCall], None]) -> None:
+        self._handlers[(domain, service)] = handler
+
+    def has_service(self, domain: str, service: str) -> bool:
+        return (domain, service) in self._handlers
+
+    async def async_call(self, domain, service, service_data=None, blocking=False, **kwargs):
+        call = ServiceCall(self._hass.time(), domain, service, dict(service_data or {}))
+        self.calls.append(call)
+        handler = self._handlers.get((domain, service))
+        if handler is not None:
+            handler(call)
+
+
+class StandInStates:
+    """State machine keeping the last state of every entity and counting writes."""
+
+    def __init__(self, hass: StandInHass):
+        self._hass = hass
+        self._states: dict[str, StateRecord] = {}
+        self.writes = 0
+
+    def get(self, entity_id: str) -> StateRecord | None:
+        return self._states.get(entity_id)
+
+    def async_set(self, entity_id: str, state: str | None, attributes: dict[str, Any] | None = None) -> None:
+        self.writes += 1
+        self._states[entity_id] = StateRecord(entity_id, state, dict(attributes or {}), self._hass.time())
+
+
+class StandInBus:
+    """Event bus that records fired events and calls listeners synchronously."""
+
+    def __init__(self, hass: StandInHass):
+        self._hass = hass
+        self._listeners: dict[str, list[Callable[[FiredEvent], None]]] = {}
+        self.events: list[FiredEvent] = []
+
+    def async_listen(self, event_type: str, listener: Callable[[FiredEvent], None]) -> Callable[[], None]:
+        listeners = self._listeners.setdefault(event_type, [])
+        listeners.append(listener)
+        return lambda: listeners.remove(listener)
+
+    def async_fire(self, event_type: str, event_data: dict[str, Any] | None = None, **kwargs) -> None:
+        event = FiredEvent(self._hass.time(), event_type, dict(event_data or {}))
+        self.events.append(event)
+        for listener in list(self._listeners.get(event_type, ())):
+            listener(event)
+
+
+class StandInHass:
+    """The parts of ``hass`` the cover entity uses.
+
+    Timers fire ``timer_latency`` plus up to ``timer_jitter`` seconds after
+    they are due (seeded, so runs stay reproducible), which models a busy
+    event loop. Without a clock the stand-in runs on wall time and adds no
+    latency of its own.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        clock: VirtualClock | None = None,
+        timer_latency: float | None = None,
+        timer_jitter: float = 0.0,
+        seed: int = 0,
+    ):
+        self.loop = loop
+        self.clock = clock
+        self.data: dict[str, Any] = {}
+        self.services = StandInServices(self)
+        self.states = StandInStates(self)
+        self.bus = StandInBus(self)
+        if timer_latency is None:
+            timer_latency = DEFAULT_TIMER_LATENCY if clock is not None else 0.0
+        self.timer_latency = timer_latency
+        self.timer_jitter = timer_jitter
+        self._rng = random.Random(seed)
+
+    def time(self) -> float:
+        return self.clock.now if self.clock is not None else time.time()
+
+    def utcnow(self) -> datetime:
+        return datetime.fromtimestamp(self.time(), timezone.utc)
+
+    def async_create_task(self, target, name=None, eager_start=False):
+        return self.loop.create_task(target, name=name)
+
+    def _timer_delay(self, delay: float) -> float:
+        delay = max(0.0, delay) + self.timer_latency
+        if self.timer_jitter:
+            delay += self._rng.uniform(0, self.timer_jitter)
+        return delay
+
+    def call_later(self, delay: float, action: Callable[[datetime], Any]) -> Callable[[], None]:
+        """Run ``action(now)`` after ``delay`` seconds; returns the cancel callable."""
+        handle = self.loop.call_later(self._timer_delay(delay), lambda: action(self.utcnow()))
+        return handle.cancel
+
+    def track_time_interval(self, action: Callable[[datetime], Any], interval: float) -> Callable[[], None]:
+        """Run ``action(now)`` every ``interval`` seconds, re-armed from each firing like Home Assistant."""
+        handle = None
+
+        def _fire():
+            nonlocal handle
+            handle = self.loop.call_later(self._timer_delay(interval), _fire)
+            action(self.utcnow())
+
+        handle = self.loop.call_later(self._timer_delay(interval), _fire)
+        return lambda: handle.cancel()
+
+
+class _StandInDtUtil:
+    """``dt_util`` replacement whose ``utcnow`` follows the stand-in clock."""
+
+    def __init__(self, hass: StandInHass):
+        self._hass = hass
+
+    def utcnow(self) -> datetime:
+        return self._hass.utcnow()
+
+    def as_utc(self, value: datetime) -> datetime:
+        return dt_util.as_utc(value)
+
+
+def _call_later(hass: StandInHass, delay, action):
+    return hass.call_later(delay, action)
+
+
+def _track_time_interval(hass: StandInHass, action, interval):
+    return hass.track_time_interval(action, interval.total_seconds())
+
+
+@contextmanager
+def entity_timers(hass: StandInHass):
+    """Route the entity module's timers and ``utcnow`` through the stand-in while active."""
+    saved = (entity_module.async_call_later, entity_module.async_track_time_interval, entity_module.dt_util)
+    entity_module.async_call_later = _call_later
+    entity_module.async_track_time_interval = _track_time_interval
+    entity_module.dt_util = _StandInDtUtil(hass)
+    try:
+        yield
+    finally:
+        entity_module.async_call_later, entity_module.async_track_time_interval, entity_module.dt_util = saved
+
+
+class SimulatedCover(CoverTimeBased):
+    """CoverTimeBased that writes its state into the stand-in state machine."""
+
+    @callback
+    def async_write_ha_state(self):
+        if self._perf.enabled:
+            self._perf.state_written(self.tc.current_time())
+        self.hass.states.async_set(
+            self.entity_id, self.state, {**self.state_attributes, **self.extra_state_attributes}
+        )
+
+
+def add_cover(
+    hass: StandInHass,
+    device_id: str,
+    config: DeviceConfig,
+    scripts: ScriptsConfig,
+    wrapper: WrapperConfig | None = None,
+    position: int = 0,
+) -> SimulatedCover:
+    """Create a cover attached to the stand-in, stopped at ``position``."""
+    cover = SimulatedCover(device_id, config, scripts, wrapper or WrapperConfig(cover_entity_id=None))
+    cover.hass = hass
+    cover.entity_id = f"cover.{device_id}"
+    if hass.clock is not None:
+        hass.clock.attach(cover.tc)
+        hass.clock.attach(cover.tilt_tc)
+    cover.tc.set_position(position)
+    hass.data.setdefault(DOMAIN, {}).setdefault("entities", {})[device_id] = cover
+    return cover
@@ -0,0 +1,332 @@
+"""Replay recorded movements through TravelCalculator with other calibration parameters.
+
+Every recorded movement with a confirmed real position (wrapped cover
+report, end-stop sensor, power meter) is re-run through a TravelCalculator
+built from each profile: the recorded parameters, any ``--set``/``--profiles``
+what-ifs and, with ``--fit``, the travel times and command delay that fit
+the recordings best. For each cover and profile the predicted versus
+confirmed position error is reported.
+
+    python tools/replay.py diagnostics.json
+    python tools/replay.py diagnostics.json --set travel_time_up=31.5 --fit
+    python tools/replay.py history.json --truth cover.living=cover.living_rf --json
+
+Inputs are config entry diagnostics (the ``movements`` trace of every
+cover) or a Home Assistant history export (``/api/history/period``) of the
+covers. History has no confirmations of its own: ``--truth`` names the
+entity (usually the wrapped cover) whose next settled position confirms a
+movement. Only travelcalculator.py is loaded, so Home Assistant is not needed.
+
+The replay assumes STOP takes as long to reach the motor as the start
+command did, so ``command_delay`` only matters for movements that the motor
+ended itself (end-stop sensor, power meter).
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import math
+import sys
+from dataclasses import asdict, dataclass, fields, replace
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+MODULE_PATH = ROOT / "custom_components" / "cover_rf_time_based" / "travelcalculator.py"
+
+# Recorded confirmations that are the motor's own end, not the result of a STOP
+MOTOR_SOURCES = ("end_sensor", "power")
+MOVING_STATES = ("opening", "closing")
+# Fit: travel times are searched within this factor of the recorded value
+FIT_RANGE = 0.3
+FIT_STEP = 0.1
+FIT_DELAY_MAX = 2.0
+FIT_DELAY_STEP = 0.05
+
+
+def load_travelcalculator():
+    spec = importlib.util.spec_from_file_location("travelcalculator", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@dataclass(slots=True)
+class Params:
+    travel_time_down: float
+    travel_time_up: float
+    command_delay: float = 0.0
+    backlash: float = 0.0
+
+
+PARAM_NAMES = tuple(field.name for field in fields(Params))
+
+
+@dataclass(slots=True)
+class RecordedMove:
+    command_at: float
+    start_position: int
+    up: bool
+    # Seconds from the command until the movement ended (STOP sent or motor stopped)
+    stop_after: float
+    # Lead (slat turning) without the backlash the recording added on a reversal
+    lead_time: float
+    ended_by_motor: bool
+    confirmed_position: int
+
+
+@dataclass(slots=True)
+class CoverTrace:
+    name: str
+    params: Params
+    moves: list[RecordedMove]
+
+
+@dataclass(slots=True)
+class Summary:
+    moves: int
+    bias: float
+    mae: float
+    rms: float
+    max_error: int
+
+
+def traces_from_diagnostics(document: dict) -> list[CoverTrace]:
+    """Covers and confirmed movements of a config entry diagnostics download."""
+    data = document.get("data", document)
+    traces = []
+    for device_id, cover in data.get("covers", {}).items():
+        config = cover.get("config", {})
+        params = Params(
+            travel_time_down=float(config["travelling_time_down"]),
+            travel_time_up=float(config["travelling_time_up"]),
+            command_delay=float(config.get("command_delay", 0)),
+            backlash=float(config.get("backlash", 0)),
+        )
+        moves = []
+        previous_up = None
+        for record in cover.get("movements", []):
+            if record["target_position"] == record["start_position"]:
+                continue
+            up = record["target_position"] > record["start_position"]
+            lead_time = record["lead_time"]
+            if previous_up is not None and up != previous_up:
+                lead_time = max(0.0, lead_time - params.backlash)
+            previous_up = up
+            if record["confirmed_position"] is None or record["actual_stop"] is None:
+                continue
+            moves.append(RecordedMove(
+                command_at=record["command_at"],
+                start_position=record["start_position"],
+                up=up,
+                stop_after=record["actual_stop"],
+                lead_time=lead_time,
+                ended_by_motor=(
+                    record["confirmed_by"] in MOTOR_SOURCES
+                    and record["confirmed_after"] - record["actual_stop"] < 0.01
+                ),
+                confirmed_position=record["confirmed_position"],
+            ))
+        traces.append(CoverTrace(cover.get("name") or device_id, params, moves))
+    return traces
+
+
+def _timestamp(state: dict) -> float:
+    return datetime.fromisoformat(state.get("last_updated") or state["last_changed"]).timestamp()
+
+
+def _position(state: dict) -> int | None:
+    value = state.get("attributes", {}).get("current_position")
+    return None if value is None else int(value)
+
+
+def traces_from_history(document: list, truth: dict[str, str]) -> list[CoverTrace]:
+    """Movements of covers in a history export, confirmed by their ``truth`` entity.
+
+    A movement runs from the state turning opening/closing until the next
+    settled state; it is confirmed by the first settled state of the truth
+    entity at or after its end. Lead and backlash are not in the history, so
+    they are taken as zero.
+    """
+    histories = {}
+    for states in document:
+        if states:
+            histories[states[0]["entity_id"]] = states
+    traces = []
+    for entity_id, truth_id in truth.items():
+        states = histories.get(entity_id)
+        if not states:
+            raise ValueError(f"{entity_id} is not in the history export")
+        settled_truth = [
+            (_timestamp(state), _position(state))
+            for state in histories.get(truth_id, [])
+            if state["state"] not in MOVING_STATES and _position(state) is not None
+        ]
+        attributes = states[-1].get("attributes", {})
+        params = Params(
+            travel_time_down=float(attributes["travelling_time_down"]),
+            travel_time_up=float(attributes["travelling_time_up"]),
+            command_delay=float(attributes.get("command_delay", 0)),
+        )
+        moves = []
+        for index in range(1, len(states)):
+            state, before = states[index], states[index - 1]
+            if state["state"] not in MOVING_STATES or before["state"] in MOVING_STATES:
+                continue
+            end = next((later for later in states[index + 1:] if later["state"] not in MOVING_STATES), None)
+            start_position = _position(before)
+            if end is None or start_position is None:
+                continue
+            started, ended = _timestamp(state), _timestamp(end)
+            confirmed = next((position for at, position in settled_truth if at >= ended), None)
+            if confirmed is None:
+                continue
+            moves.append(RecordedMove(
+                command_at=started,
+                start_position=start_position,
+                up=state["state"] == "opening",
+                stop_after=ended - started,
+                lead_time=0.0,
+                ended_by_motor=False,
+                confirmed_position=confirmed,
+            ))
+        traces.append(CoverTrace(attributes.get("friendly_name", entity_id), params, moves))
+    return traces
+
+
+def replay(module, trace: CoverTrace, params: Params) -> list[int]:
+    """Predicted minus confirmed position of every movement under ``params``."""
+    tc = module.TravelCalculator(params.travel_time_down, params.travel_time_up, params.command_delay)
+    tc.backlash = params.backlash
+    errors = []
+    for move in trace.moves:
+        tc.time_set_from_outside = move.command_at
+        tc.set_position(move.start_position)
+        # Head for the end stop so the model is not cut off at the recorded target
+        tc.start_travel(tc.position_open if move.up else tc.position_closed, move.lead_time)
+        stopped_at = move.command_at + move.stop_after
+        if not move.ended_by_motor:
+            stopped_at += params.command_delay
+        errors.append(tc.motor_stopped(stopped_at) - move.confirmed_position)
+    return errors
+
+
+def summarize(errors: list[int]) -> Summary:
+    if not errors:
+        return Summary(0, 0.0, 0.0, 0.0, 0)
+    return Summary(
+        moves=len(errors),
+        bias=round(sum(errors) / len(errors), 2),
+        mae=round(sum(map(abs, errors)) / len(errors), 2),
+        rms=round(math.sqrt(sum(error * error for error in errors) / len(errors)), 2),
+        max_error=max(map(abs, errors)),
+    )
+
+
+def _rms(errors) -> float:
+    errors = list(errors)
+    return math.sqrt(sum(error * error for error in errors) / len(errors)) if errors else 0.0
+
+
+def _candidates(low: float, high: float, step: float) -> list[float]:
+    return [round(low + step * i, 3) for i in range(int((high - low) / step) + 1)]
+
+
+def fit(module, trace: CoverTrace) -> Params:
+    """Grid-search each travel time on its own direction's moves, then the command delay."""
+    best = trace.params
+    for name, up in (("travel_time_up", True), ("travel_time_down", False)):
+        if not any(move.up == up for move in trace.moves):
+            continue
+        recorded = getattr(trace.params, name)
+        scored = []
+        for value in _candidates(recorded * (1 - FIT_RANGE), recorded * (1 + FIT_RANGE), FIT_STEP):
+            errors = replay(module, trace, replace(best, **{name: value}))
+            scored.append((_rms(e for e, move in zip(errors, trace.moves) if move.up == up), abs(value - recorded), value))
+        best = replace(best, **{name: min(scored)[2]})
+    if any(move.ended_by_motor for move in trace.moves):
+        scored = [
+            (_rms(replay(module, trace, replace(best, command_delay=value))), abs(value - trace.params.command_delay), value)
+            for value in _candidates(0, FIT_DELAY_MAX, FIT_DELAY_STEP)
+        ]
+        best = replace(best, command_delay=min(scored)[2])
+    return best
+
+
+def parse_overrides(text: str) -> dict[str, float]:
+    overrides = {}
+    for item in text.split(","):
+        name, _, value = item.partition("=")
+        name = name.strip()
+        if name not in PARAM_NAMES:
+            raise argparse.ArgumentTypeError(f"unknown parameter {name!r}; choose from {', '.join(PARAM_NAMES)}")
+        overrides[name] = float(value)
+    return overrides
+
+
+def parse_truth(text: str) -> tuple[str, str]:
+    cover, _, truth = text.partition("=")
+    if not truth:
+        raise argparse.ArgumentTypeError("expected cover.entity=cover.truth_entity")
+    return cover, truth
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="+", type=Path, help="diagnostics downloads or history exports (JSON)")
+    parser.add_argument("--set", dest="what_if", action="append", type=parse_overrides, default=[],
+                        help="what-if profile, e.g. travel_time_up=31,command_delay=0.5 (repeatable)")
+    parser.add_argument("--profiles", type=Path, help='JSON file of named profiles: {"name": {"travel_time_up": 31}}')
+    parser.add_argument("--fit", action="store_true", help="also report the best fitting travel times and command delay")
+    parser.add_argument("--truth", action="append", type=parse_truth, default=[],
+                        help="history input: cover.entity=cover.truth_entity (repeatable)")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+
+    profiles = {f"set{index + 1}": overrides for index, overrides in enumerate(args.what_if)}
+    if args.profiles:
+        for name, overrides in json.loads(args.profiles.read_text(encoding="utf-8")).items():
+            unknown = set(overrides) - set(PARAM_NAMES)
+            if unknown:
+                parser.error(f"profile {name}: unknown parameter(s) {', '.join(sorted(unknown))}")
+            profiles[name] = overrides
+
+    traces = []
+    for path in args.files:
+        document = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(document, list):
+            traces.extend(traces_from_history(document, dict(args.truth)))
+        else:
+            traces.extend(traces_from_diagnostics(document))
+
+    module = load_travelcalculator()
+    results = []
+    for trace in traces:
+        runs = [("recorded", trace.params)]
+        runs.extend((name, replace(trace.params, **overrides)) for name, overrides in profiles.items())
+        if args.fit and trace.moves:
+            runs.append(("fit", fit(module, trace)))
+        for name, params in runs:
+            results.append({
+                "cover": trace.name,
+                "profile": name,
+                "params": asdict(params),
+                **asdict(summarize(replay(module, trace, params))),
+            })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{'cover':<24} {'profile':<10} {'moves':>5} {'bias':>6} {'mae':>6} {'rms':>6} {'max':>4}  parameters")
+    for result in results:
+        params = " ".join(f"{name}={value:g}" for name, value in result["params"].items())
+        print(
+            f"{result['cover'][:24]:<24} {result['profile'][:10]:<10} {result['moves']:>5} {result['bias']:>6.2f} "
+            f"{result['mae']:>6.2f} {result['rms']:>6.2f} {result['max_error']:>4}  {params}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,370 @@
+"""Drive a cover against a modelled motor on a virtual clock and check the outcome.
+
+Each scenario sends service calls to one CoverTimeBased at scripted
+(virtual) times. The RF commands it sends move a ``SimulatedMotor``, the
+physical truth the cover's estimate is checked against: the command
+sequence, the final position and the stop timing error of each automatic
+STOP (how much longer or shorter the motor ran than the move needed).
+
+    python tools/simulate.py                          # all scenarios
+    python tools/simulate.py random --hours 24        # a day of random activity
+    python tools/simulate.py --motor-delay 0.6        # real RF latency differs from command_delay
+    python tools/simulate.py --jitter 300 --stop-tolerance 400   # timers up to 300 ms late
+
+Exits with 1 if a check fails. Runs are deterministic for a given seed; the
+printed digest of the command log changes only when behaviour does.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from harness import (
+    ServiceCall,
+    StandInHass,
+    VirtualClock,
+    VirtualClockLoop,
+    add_cover,
+    entity_timers,
+)
+
+from custom_components.cover_rf_time_based.const import EVENT_MOVEMENT_STARTED
+from custom_components.cover_rf_time_based.models import DeviceConfig, ScriptsConfig
+
+CONFIG = DeviceConfig(
+    name="Simulated cover",
+    device_class="shutter",
+    travel_time_down=25,
+    travel_time_up=30,
+    tilting_time_down=0,
+    tilting_time_up=0,
+    send_stop_at_ends=False,
+    always_confident=False,
+    block_tilt_if_open=False,
+    tilt_only_when_closed=False,
+    availability_template=None,
+    command_delay=0.4,
+)
+SCRIPTS = ScriptsConfig(
+    open_script="script.sim_open",
+    close_script="script.sim_close",
+    stop_script="script.sim_stop",
+    tilt_open_script=None,
+    tilt_close_script=None,
+    tilt_stop_script=None,
+)
+# Defaults of the checks: estimate vs motor (%) and automatic STOP timing (seconds)
+POSITION_TOLERANCE = 1
+STOP_TOLERANCE = 0.05
+# Virtual seconds to let the last move finish after the final action
+SETTLE_TIME = 60
+
+
+@dataclass(slots=True)
+class Action:
+    at: float
+    service: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class Scenario:
+    name: str
+    actions: list[Action]
+    start_position: int = 0
+    commands: list[str] | None = None
+    final_position: int | None = None
+    position_tolerance: float = POSITION_TOLERANCE
+    stop_tolerance: float = STOP_TOLERANCE
+
+
+@dataclass(slots=True)
+class StopError:
+    time: float
+    seconds: float
+    # The movement started from standstill (not a reversal or a retarget mid-move)
+    from_rest: bool
+
+
+class SimulatedMotor:
+    """The physical cover: it starts and stops ``delay`` seconds after each RF command.
+
+    Travel is linear at the motor's own travel times and ends at the limit
+    switches (0 and 100).
+    """
+
+    def __init__(self, hass: StandInHass, travel_time_down: float, travel_time_up: float, delay: float, position: float):
+        self.hass = hass
+        self.travel_time_down = travel_time_down
+        self.travel_time_up = travel_time_up
+        self.delay = delay
+        self.direction = 0
+        self._position = float(position)
+        self._since = hass.time()
+        self._pending = 0
+        self._run_started = None
+        # Run time the cover's current movement needs; None once it has no timed STOP to judge
+        self.planned_run: float | None = None
+        self.from_rest = False
+        self.stop_errors: list[StopError] = []
+
+    def position_at(self, moment: float) -> float:
+        if self.direction == 0:
+            return self._position
+        travel_time = self.travel_time_up if self.direction > 0 else self.travel_time_down
+        moved = (moment - self._since) * 100 / travel_time
+        return min(100.0, max(0.0, self._position + self.direction * moved))
+
+    @property
+    def position(self) -> float:
+        return self.position_at(self.hass.time())
+
+    def movement_started(self, start: int, target: int) -> None:
+        if target in (0, 100):
+            # Moves to an end are stopped by the limit switch, not by timing
+            self.planned_run = None
+            return
+        travel_time = self.travel_time_up if target > start else self.travel_time_down
+        self.planned_run = abs(target - start) * travel_time / 100
+        self.from_rest = self.direction == 0 and not self._pending
+
+    def command(self, direction: int) -> None:
+        self._pending += 1
+        self.hass.loop.call_later(self.delay, self._apply, direction)
+
+    def _apply(self, direction: int) -> None:
+        self._pending -= 1
+        now = self.hass.time()
+        previous = self.direction
+        self._position = self.position_at(now)
+        self._since = now
+        self.direction = direction
+        if direction != previous and direction:
+            self._run_started = now
+        if direction or not previous or self.planned_run is None:
+            return
+        self.stop_errors.append(StopError(now, now - self._run_started - self.planned_run, self.from_rest))
+        self.planned_run = None
+
+
+@dataclass
+class SimulationResult:
+    commands: list[tuple[float, str]]
+    stop_errors: list[StopError]
+    estimated_position: int
+    actual_position: float
+    virtual_time: float
+    wall_time: float
+    state_writes: int
+
+    @property
+    def command_names(self) -> list[str]:
+        return [name for _, name in self.commands]
+
+    @property
+    def digest(self) -> str:
+        log = ";".join(f"{at:.3f}:{name}" for at, name in self.commands)
+        return hashlib.sha256(log.encode()).hexdigest()[:12]
+
+    def failures(self, scenario: Scenario) -> list[str]:
+        failures = []
+        if scenario.commands is not None and self.command_names != scenario.commands:
+            failures.append(f"commands {self.command_names} != expected {scenario.commands}")
+        if scenario.final_position is not None and self.estimated_position != scenario.final_position:
+            failures.append(f"final position {self.estimated_position} != expected {scenario.final_position}")
+        error = abs(self.estimated_position - self.actual_position)
+        if error > scenario.position_tolerance:
+            failures.append(f"estimate {self.estimated_position} is {error:.1f}% off the motor ({self.actual_position:.1f})")
+        timed = [stop.seconds for stop in self.stop_errors if stop.from_rest]
+        if timed and max(map(abs, timed)) > scenario.stop_tolerance:
+            failures.append(f"auto STOP off by up to {max(map(abs, timed)) * 1000:.0f} ms")
+        return failures
+
+
+class Simulation:
+    """One cover, its motor and the stand-in hass on a fresh virtual clock."""
+
+    def __init__(
+        self,
+        config: DeviceConfig = CONFIG,
+        scripts: ScriptsConfig = SCRIPTS,
+        start_position: int = 0,
+        motor_delay: float | None = None,
+        motor_speed: float = 1.0,
+        timer_latency: float | None = None,
+        timer_jitter: float = 0.0,
+        seed: int = 0,
+    ):
+        self.clock = VirtualClock()
+        self.loop = VirtualClockLoop(self.clock)
+        self.hass = StandInHass(self.loop, self.clock, timer_latency, timer_jitter, seed)
+        self.cover = add_cover(self.hass, "simulated", config, scripts, position=start_position)
+        self.motor = SimulatedMotor(
+            self.hass,
+            config.travel_time_down / motor_speed,
+            config.travel_time_up / motor_speed,
+            config.command_delay if motor_delay is None else motor_delay,
+            start_position,
+        )
+        self.commands: list[tuple[float, str]] = []
+        self._scripts = {
+            scripts.open_script: ("open", 1),
+            scripts.close_script: ("close", -1),
+            scripts.stop_script: ("stop", 0),
+        }
+        self.hass.services.async_register("homeassistant", "turn_on", self._script_called)
+        self.hass.bus.async_listen(
+            EVENT_MOVEMENT_STARTED,
+            lambda event: self.motor.movement_started(event.data["start_position"], event.data["target_position"]),
+        )
+
+    def _script_called(self, call: ServiceCall) -> None:
+        name, direction = self._scripts.get(call.data["entity_id"], (call.data["entity_id"], None))
+        self.commands.append((round(call.time - self.start, 3), name))
+        if direction is not None:
+            self.motor.command(direction)
+
+    async def _run_actions(self, actions: list[Action], settle: float) -> None:
+        for action in actions:
+            wait = self.start + action.at - self.hass.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            if action.service == "stop_cover":
+                # A manual stop is not judged against the movement's planned run
+                self.motor.planned_run = None
+            await getattr(self.cover, f"async_{action.service}")(**action.data)
+        await asyncio.sleep(settle)
+
+    def run(self, actions: list[Action], settle: float = SETTLE_TIME) -> SimulationResult:
+        self.start = self.hass.time()
+        started = time.perf_counter()
+        try:
+            with entity_timers(self.hass):
+                self.loop.run_until_complete(self._run_actions(actions, settle))
+        finally:
+            self.loop.close()
+        return SimulationResult(
+            commands=self.commands,
+            stop_errors=self.motor.stop_errors,
+            estimated_position=self.cover.current_cover_position,
+            actual_position=self.motor.position,
+            virtual_time=self.hass.time() - self.start,
+            wall_time=time.perf_counter() - started,
+            state_writes=self.hass.states.writes,
+        )
+
+
+def random_actions(hours: float, seed: int) -> list[Action]:
+    """Random position changes, full opens/closes and stops, some of them mid-move."""
+    rng = random.Random(seed)
+    actions = []
+    at = 0.0
+    while True:
+        at += rng.uniform(5, 600)
+        if at > hours * 3600:
+            return actions
+        roll = rng.random()
+        if roll < 0.7:
+            actions.append(Action(round(at, 1), "set_cover_position", {"position": rng.randint(0, 100)}))
+        elif roll < 0.8:
+            actions.append(Action(round(at, 1), "open_cover"))
+        elif roll < 0.9:
+            actions.append(Action(round(at, 1), "close_cover"))
+        else:
+            actions.append(Action(round(at, 1), "stop_cover"))
+
+
+def scenarios(hours: float, seed: int) -> dict[str, Scenario]:
+    return {
+        scenario.name: scenario
+        for scenario in (
+            Scenario(
+                "intermediate",
+                [
+                    Action(0, "set_cover_position", {"position": 50}),
+                    Action(60, "set_cover_position", {"position": 20}),
+                    Action(120, "open_cover"),
+                ],
+                commands=["open", "stop", "close", "stop", "open"],
+                final_position=100,
+            ),
+            Scenario(
+                "manual_stop",
+                [Action(0, "close_cover"), Action(10, "stop_cover")],
+                start_position=100,
+                commands=["close", "stop"],
+            ),
+            # The STOP after a reversal is not timed (from_rest is False): the
+            # motor's run time spans both directions. The end position is checked
+            Scenario(
+                "reverse",
+                [Action(0, "set_cover_position", {"position": 80}), Action(5, "set_cover_position", {"position": 10})],
+                commands=["open", "close", "stop"],
+                final_position=10,
+            ),
+            Scenario(
+                "random",
+                random_actions(hours, seed),
+                start_position=50,
+                position_tolerance=3,
+            ),
+        )
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenario", nargs="*", help="scenarios to run (default: all)")
+    parser.add_argument("--hours", type=float, default=1, help="length of the random scenario")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--motor-delay", type=float, help="real RF latency in seconds (default: command_delay)")
+    parser.add_argument("--motor-speed", type=float, default=1.0, help="real speed relative to the configured travel times")
+    parser.add_argument("--latency", type=float, help="timer latency in ms (default: 1)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random timer latency in ms")
+    parser.add_argument("--stop-tolerance", type=float, help=f"allowed stop timing error in ms (default: {STOP_TOLERANCE * 1000:.0f})")
+    parser.add_argument("--verbose", action="store_true", help="print the command log")
+    args = parser.parse_args(argv)
+
+    available = scenarios(args.hours, args.seed)
+    unknown = [name for name in args.scenario if name not in available]
+    if unknown:
+        parser.error(f"unknown scenario(s) {', '.join(unknown)}; choose from {', '.join(available)}")
+
+    failed = False
+    for name in args.scenario or available:
+        scenario = available[name]
+        simulation = Simulation(
+            start_position=scenario.start_position,
+            motor_delay=args.motor_delay,
+            motor_speed=args.motor_speed,
+            timer_latency=None if args.latency is None else args.latency / 1000,
+            timer_jitter=args.jitter / 1000,
+            seed=args.seed,
+        )
+        if args.stop_tolerance is not None:
+            scenario.stop_tolerance = args.stop_tolerance / 1000
+        result = simulation.run(scenario.actions)
+        timed = [abs(stop.seconds) for stop in result.stop_errors if stop.from_rest]
+        print(
+            f"{name:<13} {result.virtual_time / 3600:7.2f} h in {result.wall_time * 1000:7.1f} ms  "
+            f"{len(result.commands):4} commands  {result.state_writes:6} writes  "
+            f"stop error max {max(timed, default=0) * 1000:6.1f} ms  "
+            f"position {result.estimated_position:3} vs {result.actual_position:5.1f}  digest {result.digest}"
+        )
+        if args.verbose:
+            for at, command in result.commands:
+                print(f"    {at:10.3f}  {command}")
+        for failure in result.failures(scenario):
+            failed = True
+            print(f"  FAIL {failure}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())